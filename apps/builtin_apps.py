@@ -5,44 +5,24 @@ import pygame
 from core.plugin_manager import Application
 from config.i18n import tr
 from config.settings import *
+from core.clipboard import get_clipboard_service
 
-# Funciones para manejo de clipboard
+# Funciones para manejo de clipboard (portapapeles compartido, no bloquean)
 def get_clipboard():
-    """Obtiene texto del clipboard del sistema"""
-    try:
-        import tkinter as tk
-        root = tk.Tk()
-        root.withdraw()  # Ocultar ventana
-        try:
-            text = root.clipboard_get()
-            return text
-        except:
-            return ""
-        finally:
-            root.destroy()
-    except:
-        return ""
+    """Obtiene el último texto copiado"""
+    return get_clipboard_service().paste()
 
 def set_clipboard(text):
-    """Copia texto al clipboard del sistema"""
-    try:
-        import tkinter as tk
-        root = tk.Tk()
-        root.withdraw()  # Ocultar ventana
-        try:
-            root.clipboard_clear()
-            root.clipboard_append(text)
-            root.update()  # Necesario para actualizar clipboard
-            return True
-        finally:
-            root.destroy()
-    except:
-        return False
+    """Copia texto al portapapeles compartido y, en segundo plano, al del sistema"""
+    return get_clipboard_service().copy(text)
 
 
 class TerminalApp(Application):
     """Terminal mejorada con navegación del filesystem y ejecución de Goul"""
     
+    damage_tracking = True
+    event_types = {pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION}
+    
     def __init__(self):
         super().__init__(tr("app.terminal"), color=Colors.GREEN, app_id="terminal")
         self.lines = [
@@ -71,6 +51,7 @@ class TerminalApp(Application):
             "cat": self._cmd_cat,
             "goul": self._cmd_goul,
             "touch": self._cmd_touch,
+            "cp": self._cmd_cp,
             "mkdir": self._cmd_mkdir,
             "rm": self._cmd_rm,
             "rmdir": self._cmd_rmdir,
@@ -98,6 +79,7 @@ class TerminalApp(Application):
             "  cat <archivo>  - Mostrar contenido de archivo",
             "  mkdir <nombre> - Crear carpeta (soporta a/b/c)",
             "  touch <nombre> - Crear archivo",
+            "  cp <org> <dst> - Copiar archivo (dst: nombre o carpeta/)",
             "  rm <archivo>   - Mover archivo a papelera",
             "  rmdir <folder> - Mover carpeta a papelera",
             "  trash <op>     - Ver papelera (ver/restore nombre/--empty)",
@@ -260,6 +242,31 @@ class TerminalApp(Application):
         except Exception as e:
             return [f"Error: {e}"]
     
+    def _cmd_cp(self, args):
+        """Copia un archivo (a otro nombre, o a otra carpeta si el destino acaba en /)"""
+        if not self.filesystem:
+            return ["Error: Filesystem no disponible"]
+        
+        if len(args) < 2:
+            return ["Uso: cp <archivo> <destino>"]
+        
+        try:
+            filename, dest = args[0], args[1]
+            dest_dir, _, new_name = dest.rpartition("/")
+            if dest.startswith("/"):
+                dest_path = dest_dir.strip("/")
+            elif dest_dir:
+                dest_path = f"{self.current_path}/{dest_dir}".strip("/")
+            else:
+                dest_path = self.current_path
+            
+            if self.filesystem.copy_file(self.current_path, filename, dest_path, new_name or filename):
+                return [f"Archivo '{filename}' copiado a '/{dest_path}/{new_name or filename}'"]
+            return [f"Error: Archivo '{filename}' o destino '{dest}' no encontrado"]
+        
+        except Exception as e:
+            return [f"Error: {e}"]
+    
     def _cmd_mkdir(self, args):
         """Crea carpeta (soporta rutas anidadas como a/b/c)"""
         if not self.filesystem:
@@ -517,7 +524,14 @@ class TerminalApp(Application):
                 self.last_mouse_y = event.pos[1]
     
     def update(self, dt):
+        blink_phase = int(self.cursor_blink * 2) % 2
         self.cursor_blink += dt
+        if int(self.cursor_blink * 2) % 2 != blink_phase:
+            self.invalidate()  # El cursor cambió de estado
+    
+    def next_deadline(self):
+        """El cursor parpadea cada medio segundo"""
+        return 0.5 - (self.cursor_blink % 0.5)
     
     def render(self, surface, rect):
         # Fondo oscuro pastel
@@ -525,10 +539,7 @@ class TerminalApp(Application):
         pygame.draw.rect(surface, bg_color, rect)
         
         # Renderizar líneas
-        try:
-            font = pygame.font.Font(FONT_PATH, 13)
-        except:
-            font = pygame.font.Font(None, 13)
+        font = self.get_font(13)
         
         y = rect.y + 10
         line_height = 18
@@ -552,9 +563,9 @@ class TerminalApp(Application):
             line = self.lines[line_idx]
             # Colorear comandos (>)
             if line.startswith(">"):
-                text = font.render(line, True, (150, 200, 255))
+                text = self.render_text(font, line, (150, 200, 255))
             else:
-                text = font.render(line, True, (150, 255, 150))
+                text = self.render_text(font, line, (150, 255, 150))
             surface.blit(text, (rect.x + 10, y))
             y += line_height
         
@@ -578,13 +589,16 @@ class TerminalApp(Application):
         current_dir = f"~/{self.current_path}" if self.current_path else "~"
         prompt = f"{current_dir}> {self.current_input}"
         cursor = "|" if int(self.cursor_blink * 2) % 2 == 0 else " "
-        text = font.render(prompt + cursor, True, (100, 200, 255))
+        text = self.render_text(font, prompt + cursor, (100, 200, 255))
         surface.blit(text, (rect.x + 10, y))
 
 
 class TextEditorApp(Application):
     """Editor de texto simple"""
     
+    damage_tracking = True
+    event_types = {pygame.KEYDOWN}
+    
     def __init__(self):
         super().__init__(tr("app.text_editor"), color=Colors.BLUE, app_id="text_editor")
         self.lines = [""]
@@ -669,17 +683,21 @@ class TextEditorApp(Application):
                     self.cursor_col += 1
     
     def update(self, dt):
+        blink_phase = int(self.cursor_blink * 2) % 2
         self.cursor_blink += dt
+        if int(self.cursor_blink * 2) % 2 != blink_phase:
+            self.invalidate()  # El cursor cambió de estado
+    
+    def next_deadline(self):
+        """El cursor parpadea cada medio segundo"""
+        return 0.5 - (self.cursor_blink % 0.5)
     
     def render(self, surface, rect):
         # Fondo blanco suave
         pygame.draw.rect(surface, (255, 255, 255), rect)
         
         # Renderizar texto
-        try:
-            font = pygame.font.Font(FONT_PATH, 14)
-        except:
-            font = pygame.font.Font(None, 14)
+        font = self.get_font(14)
         
         y = rect.y + 10
         line_height = 22
@@ -703,7 +721,7 @@ class TextEditorApp(Application):
                 pygame.draw.rect(surface, Colors.HOVER, highlight)
             
             # Texto
-            text = font.render(line if line else " ", True, Colors.TEXT_PRIMARY)
+            text = self.render_text(font, line if line else " ", Colors.TEXT_PRIMARY)
             surface.blit(text, (rect.x + 10, y))
             
             # Cursor
@@ -734,6 +752,9 @@ class TextEditorApp(Application):
 class FileManagerApp(Application):
     """Explorador de archivos integrado con filesystem virtual"""
     
+    damage_tracking = True
+    event_types = {pygame.MOUSEBUTTONDOWN}
+    
     def __init__(self):
         super().__init__(tr("app.file_manager"), color=Colors.YELLOW, app_id="file_manager")
         self.current_path = ""  # Ruta actual (relativo a root)
@@ -850,27 +871,23 @@ class FileManagerApp(Application):
         # Fondo
         pygame.draw.rect(surface, Colors.WINDOW_BG, rect)
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 14)
-            small_font = pygame.font.Font(FONT_PATH, 11)
-        except:
-            font = pygame.font.Font(None, 14)
-            small_font = pygame.font.Font(None, 11)
+        font = self.get_font(14)
+        small_font = self.get_font(11)
         
         # Botones de navegación
         back_btn = pygame.Rect(rect.x + 10, rect.y + 10, 80, 30)
         pygame.draw.rect(surface, (220, 220, 230), back_btn, border_radius=4)
-        back_text = font.render("← Atrás", True, Colors.TEXT_PRIMARY)
+        back_text = self.render_text(font, "← Atrás", Colors.TEXT_PRIMARY)
         surface.blit(back_text, (back_btn.x + 8, back_btn.y + 7))
         
         refresh_btn = pygame.Rect(rect.x + 100, rect.y + 10, 90, 30)
         pygame.draw.rect(surface, (220, 220, 230), refresh_btn, border_radius=4)
-        refresh_text = font.render("↻ Refrescar", True, Colors.TEXT_PRIMARY)
+        refresh_text = self.render_text(font, "↻ Refrescar", Colors.TEXT_PRIMARY)
         surface.blit(refresh_text, (refresh_btn.x + 8, refresh_btn.y + 7))
         
         # Ruta actual
         path_display = f"📁 /{self.current_path}" if self.current_path else "📁 Raíz"
-        path_text = small_font.render(path_display, True, (100, 100, 120))
+        path_text = self.render_text(small_font, path_display, (100, 100, 120))
         surface.blit(path_text, (rect.x + 200, rect.y + 18))
         
         # Lista de archivos
@@ -888,7 +905,7 @@ class FileManagerApp(Application):
             
             # Icono y nombre del item
             icon = "📁" if item_type == "folder" else "📄"
-            text = font.render(f"{icon} {name}", True, Colors.TEXT_PRIMARY)
+            text = self.render_text(font, f"{icon} {name}", Colors.TEXT_PRIMARY)
             surface.blit(text, (item_rect.x + 10, item_rect.y + 10))
             
             y += item_height
@@ -897,6 +914,8 @@ class FileManagerApp(Application):
 class SettingsApp(Application):
     """Configuración del sistema"""
     
+    damage_tracking = True
+    
     def __init__(self):
         super().__init__(tr("app.settings"), color=Colors.PURPLE, app_id="settings")
         self.sections = [
@@ -917,10 +936,7 @@ class SettingsApp(Application):
         sidebar = pygame.Rect(rect.x, rect.y, sidebar_width, rect.height)
         pygame.draw.rect(surface, (245, 245, 255), sidebar)
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 14)
-        except:
-            font = pygame.font.Font(None, 14)
+        font = self.get_font(14)
         
         # Secciones
         y = rect.y + 20
@@ -930,24 +946,27 @@ class SettingsApp(Application):
             if i == self.selected:
                 pygame.draw.rect(surface, Colors.ACTIVE, section_rect, border_radius=6)
             
-            text = font.render(section, True, Colors.TEXT_PRIMARY)
+            text = self.render_text(font, section, Colors.TEXT_PRIMARY)
             surface.blit(text, (section_rect.x + 10, section_rect.y + 10))
             y += 40
         
         # Panel de contenido
         content_x = rect.x + sidebar_width + 20
-        title_font = pygame.font.Font(None, 24)
-        title = title_font.render(self.sections[self.selected], True, Colors.TEXT_PRIMARY)
+        title_font = self.theme_manager.get_font_at(24, path=None)
+        title = self.render_text(title_font, self.sections[self.selected], Colors.TEXT_PRIMARY)
         surface.blit(title, (content_x, rect.y + 20))
         
         # Contenido de ejemplo
-        content = font.render(tr("settings.options"), True, Colors.TEXT_SECONDARY)
+        content = self.render_text(font, tr("settings.options"), Colors.TEXT_SECONDARY)
         surface.blit(content, (content_x, rect.y + 60))
 
 
 class MiniBrowserApp(Application):
     """Mini navegador web con soporte HTML básico"""
     
+    damage_tracking = True
+    event_types = {pygame.KEYDOWN}
+    
     def __init__(self):
         super().__init__(tr("app.mini_browser"), color=Colors.BLUE, app_id="mini_browser")
         self.url = "https://pixel-os.local"
@@ -1083,12 +1102,8 @@ class MiniBrowserApp(Application):
         # Fondo
         pygame.draw.rect(surface, Colors.WINDOW_BG, rect)
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 11)
-            title_font = pygame.font.Font(FONT_PATH, 13)
-        except:
-            font = pygame.font.Font(None, 11)
-            title_font = pygame.font.Font(None, 13)
+        font = self.get_font(11)
+        title_font = self.get_font(13)
         
         # Barra de direcciones
         address_bar = pygame.Rect(rect.x + 10, rect.y + 10, rect.width - 90, 28)
@@ -1097,7 +1112,7 @@ class MiniBrowserApp(Application):
         
         # URL texto
         url_display = self.url[:40] + "..." if len(self.url) > 40 else self.url
-        url_text = font.render(url_display, True, Colors.TEXT_PRIMARY)
+        url_text = self.render_text(font, url_display, Colors.TEXT_PRIMARY)
         surface.blit(url_text, (address_bar.x + 6, address_bar.y + 6))
         
         # Botones
@@ -1109,9 +1124,9 @@ class MiniBrowserApp(Application):
             pygame.draw.rect(surface, (200, 200, 220), btn, border_radius=3)
             pygame.draw.rect(surface, Colors.BORDER, btn, width=1, border_radius=3)
         
-        back_text = font.render("←", True, Colors.TEXT_PRIMARY)
-        reload_text = font.render("↻", True, Colors.TEXT_PRIMARY)
-        home_text = font.render("⌂", True, Colors.TEXT_PRIMARY)
+        back_text = self.render_text(font, "←", Colors.TEXT_PRIMARY)
+        reload_text = self.render_text(font, "↻", Colors.TEXT_PRIMARY)
+        home_text = self.render_text(font, "⌂", Colors.TEXT_PRIMARY)
         
         surface.blit(back_text, (back_btn.centerx - 4, back_btn.centery - 6))
         surface.blit(reload_text, (reload_btn.centerx - 4, reload_btn.centery - 6))
@@ -1137,7 +1152,7 @@ class MiniBrowserApp(Application):
                 text, is_title = display_lines[line_idx]
                 text_color = Colors.ACTIVE if is_title else Colors.TEXT_PRIMARY
                 font_to_use = title_font if is_title else font
-                line_text = font_to_use.render(text, True, text_color)
+                line_text = self.render_text(font_to_use, text, text_color)
                 surface.blit(line_text, (content_rect.x + 15, y))
                 y += line_height
 
@@ -1145,6 +1160,9 @@ class MiniBrowserApp(Application):
 class CodeEditorApp(Application):
     """Editor de código con soporte para lenguaje Goul, scrollbars funcionales e inspirado en VS Code"""
     
+    damage_tracking = True
+    event_types = {pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION}
+    
     def __init__(self):
         super().__init__(tr("app.code_editor"), color=Colors.YELLOW, app_id="code_editor")
         self.code_lines = [
@@ -1427,10 +1445,7 @@ class CodeEditorApp(Application):
                     if 0 <= line_idx < len(self.code_lines):
                         self.cursor_line = line_idx
                         # Calcular posición del cursor en la línea
-                        try:
-                            font = pygame.font.Font(FONT_PATH, 12)
-                        except:
-                            font = pygame.font.Font(None, 12)
+                        font = self.get_font(12)
                         line = self.code_lines[self.cursor_line]
                         # Aproximación simple: basada en ancho de caracteres
                         char_width = font.size("x")[0]
@@ -1495,7 +1510,14 @@ class CodeEditorApp(Application):
         self.show_output = True
     
     def update(self, dt):
+        blink_phase = int(self.cursor_blink * 2) % 2
         self.cursor_blink += dt
+        if int(self.cursor_blink * 2) % 2 != blink_phase:
+            self.invalidate()  # El cursor cambió de estado
+    
+    def next_deadline(self):
+        """El cursor parpadea cada medio segundo"""
+        return 0.5 - (self.cursor_blink % 0.5)
     
     def _get_folder_contents(self, folder_path):
         """Obtiene los contenidos de una carpeta desde el filesystem"""
@@ -1539,7 +1561,7 @@ class CodeEditorApp(Application):
         
         # Título del explorador
         title = "📁 Explorer"
-        title_text = font.render(title, True, (200, 200, 200))
+        title_text = self.render_text(font, title, (200, 200, 200))
         surface.blit(title_text, (tree_rect.x + 8, tree_rect.y + 8))
         
         # Área de contenido del árbol
@@ -1549,7 +1571,7 @@ class CodeEditorApp(Application):
 
         # Ruta actual
         path_display = f"/{self.current_folder}" if self.current_folder else "/"
-        path_text = font.render(path_display, True, (140, 140, 160))
+        path_text = self.render_text(font, path_display, (140, 140, 160))
         surface.blit(path_text, (content_x, content_y))
         content_y += line_height
 
@@ -1558,11 +1580,11 @@ class CodeEditorApp(Application):
             for item in items[:20]:
                 label = item["label"]
                 color = (150, 180, 220) if item["type"] in ("folder", "up") else (200, 200, 200)
-                item_text = font.render(label, True, color)
+                item_text = self.render_text(font, label, color)
                 surface.blit(item_text, (content_x, content_y))
                 content_y += line_height
         except Exception:
-            error_text = font.render("Error al cargar", True, (200, 100, 100))
+            error_text = self.render_text(font, "Error al cargar", (200, 100, 100))
             surface.blit(error_text, (content_x, content_y))
     
     def render(self, surface, rect):
@@ -1570,17 +1592,14 @@ class CodeEditorApp(Application):
         # Fondo
         pygame.draw.rect(surface, (30, 30, 40), rect)
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 12)
-        except:
-            font = pygame.font.Font(None, 12)
+        font = self.get_font(12)
         
         tree_width = 160 if self.show_file_tree else 0
         
         # Barra superior
         header_rect = pygame.Rect(rect.x, rect.y, rect.width, 25)
         pygame.draw.rect(surface, (40, 40, 50), header_rect)
-        file_text = font.render(f"📝 {self.current_file}", True, (180, 180, 200))
+        file_text = self.render_text(font, f"📝 {self.current_file}", (180, 180, 200))
         surface.blit(file_text, (rect.x + 10, rect.y + 5))
         
         # Renderizar file tree
@@ -1612,7 +1631,7 @@ class CodeEditorApp(Application):
             line = self.code_lines[line_idx]
             
             # Número de línea
-            line_num = font.render(f"{line_idx + 1:4d}", True, (100, 100, 120))
+            line_num = self.render_text(font, f"{line_idx + 1:4d}", (100, 100, 120))
             surface.blit(line_num, (code_start_x + 5, y))
             
             # Highlight de la línea actual
@@ -1627,7 +1646,7 @@ class CodeEditorApp(Application):
             elif any(kw in line for kw in ['echo', 'var', 'fn', 'return', 'if', 'else']):
                 code_color = (200, 150, 200)
             
-            code_text = font.render(line if line else " ", True, code_color)
+            code_text = self.render_text(font, line if line else " ", code_color)
             surface.blit(code_text, (code_start_x + 35, y))
             
             # Cursor parpadeante
@@ -1668,13 +1687,13 @@ class CodeEditorApp(Application):
             pygame.draw.rect(surface, (50, 50, 70), output_rect, 1)
             
             # Título
-            title_text = font.render("Output", True, (150, 150, 200))
+            title_text = self.render_text(font, "Output", (150, 150, 200))
             surface.blit(title_text, (code_start_x + 10, output_y + 5))
             
             # Líneas de output
             out_y = output_y + 25
             for line in self.output_lines[:10]:
-                out_text = font.render(str(line), True, (200, 200, 150))
+                out_text = self.render_text(font, str(line), (200, 200, 150))
                 surface.blit(out_text, (code_start_x + 10, out_y))
                 out_y += line_height
         
@@ -1691,7 +1710,7 @@ class CodeEditorApp(Application):
         for btn_x_pos, btn_text, btn_color in buttons:
             btn_rect = pygame.Rect(btn_x_pos, btn_y, 80, 30)
             pygame.draw.rect(surface, btn_color, btn_rect, border_radius=4)
-            text = font.render(btn_text, True, (255, 255, 255))
+            text = self.render_text(font, btn_text, (255, 255, 255))
             surface.blit(text, (btn_x_pos + 10, btn_y + 8))
         
         # Diálogo de guardado
@@ -1711,7 +1730,7 @@ class CodeEditorApp(Application):
         pygame.draw.rect(surface, (100, 100, 150), pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height), 2)
         
         # Título del diálogo
-        title_text = font.render("Guardar archivo", True, (200, 200, 200))
+        title_text = self.render_text(font, "Guardar archivo", (200, 200, 200))
         surface.blit(title_text, (dialog_x + 15, dialog_y + 10))
         
         # Campo de entrada
@@ -1719,22 +1738,25 @@ class CodeEditorApp(Application):
         pygame.draw.rect(surface, (60, 60, 70), input_rect)
         pygame.draw.rect(surface, (100, 100, 150), input_rect, 1)
         
-        input_text = font.render(self.save_input, True, (200, 200, 200))
+        input_text = self.render_text(font, self.save_input, (200, 200, 200))
         surface.blit(input_text, (input_rect.x + 5, input_rect.y + 5))
         
         # Cursor en el input
         cursor = "|" if int(self.cursor_blink * 2) % 2 == 0 else " "
-        cursor_text = font.render(cursor, True, (200, 200, 200))
+        cursor_text = self.render_text(font, cursor, (200, 200, 200))
         surface.blit(cursor_text, (input_rect.x + 5 + font.size(self.save_input)[0], input_rect.y + 5))
         
         # Hint
-        hint = font.render("Presiona Enter para guardar, ESC para cancelar", True, (150, 150, 150))
+        hint = self.render_text(font, "Presiona Enter para guardar, ESC para cancelar", (150, 150, 150))
         surface.blit(hint, (dialog_x + 15, dialog_y + 70))
 
 
 class VideoPlayerApp(Application):
     """Reproductor de video simple"""
     
+    damage_tracking = True
+    event_types = {pygame.KEYDOWN}
+    
     def __init__(self):
         super().__init__(tr("app.video_player"), color=Colors.PEACH, app_id="video_player")
         self.playlist = [
@@ -1763,17 +1785,18 @@ class VideoPlayerApp(Application):
     def update(self, dt):
         if self.is_playing:
             self.current_time = min(self.current_time + dt, self.duration)
+            self.invalidate()
+    
+    def next_deadline(self):
+        """Mientras reproduce, la barra de progreso avanza en cada frame"""
+        return 0.0 if self.is_playing else None
     
     def render(self, surface, rect):
         # Pantalla negra
         pygame.draw.rect(surface, Colors.BLACK, rect)
         
-        try:
-            font = pygame.font.Font(FONT_PATH, 14)
-            title_font = pygame.font.Font(FONT_PATH, 16)
-        except:
-            font = pygame.font.Font(None, 14)
-            title_font = pygame.font.Font(None, 16)
+        font = self.get_font(14)
+        title_font = self.get_font(16)
         
         # Área de video
         video_rect = pygame.Rect(rect.x + 20, rect.y + 20, rect.width - 40, rect.height - 120)
@@ -1781,13 +1804,13 @@ class VideoPlayerApp(Application):
         
         # Nombre del video
         video_name = self.playlist[self.current_video]
-        video_text = title_font.render(video_name, True, (200, 200, 200))
+        video_text = self.render_text(title_font, video_name, (200, 200, 200))
         surface.blit(video_text, (video_rect.x + 10, video_rect.y + 10))
         
         # Botón de play/pausa
         play_btn = pygame.Rect(rect.x + rect.width // 2 - 30, video_rect.y + video_rect.height // 2 - 15, 60, 30)
         pygame.draw.rect(surface, (100, 100, 150), play_btn, border_radius=6)
-        play_text = font.render(tr("video_player.button.play") if not self.is_playing else tr("video_player.button.pause"), True, (200, 200, 200))
+        play_text = self.render_text(font, tr("video_player.button.play") if not self.is_playing else tr("video_player.button.pause"), (200, 200, 200))
         surface.blit(play_text, (play_btn.x + 8, play_btn.y + 6))
         
         # Barra de progreso
@@ -1804,9 +1827,9 @@ class VideoPlayerApp(Application):
         time_sec = int(self.current_time) % 60
         dur_min = self.duration // 60
         dur_sec = self.duration % 60
-        time_text = font.render(f"{time_min}:{time_sec:02d} / {dur_min}:{dur_sec:02d}", True, (180, 180, 200))
+        time_text = self.render_text(font, f"{time_min}:{time_sec:02d} / {dur_min}:{dur_sec:02d}", (180, 180, 200))
         surface.blit(time_text, (rect.x + 20, rect.y + rect.height - 35))
         
         # Instrucciones
-        help_text = font.render(tr("video_player.help"), True, (120, 120, 140))
+        help_text = self.render_text(font, tr("video_player.help"), (120, 120, 140))
         surface.blit(help_text, (rect.x + 20, rect.y + rect.height - 15))
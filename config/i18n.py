@@ -3,598 +3,16 @@ Sistema simple de internacionalización (i18n) para Pixel-OS
 """
 from __future__ import annotations
 
+import importlib
 from typing import Dict
 
 DEFAULT_LANGUAGE = "es"
 _current_language = DEFAULT_LANGUAGE
 
 
-TRANSLATIONS: Dict[str, Dict[str, str]] = {
-    "es": {
-        "app.terminal": "Terminal",
-        "app.text_editor": "Editor de Texto",
-        "app.file_manager": "Explorador de Archivos",
-        "app.settings": "Configuración",
-        "app.calculator": "Calculadora",
-        "app.paint": "Paint",
-        "app.mini_browser": "Mini Navegador",
-        "app.code_editor": "Editor de Código",
-        "app.video_player": "Reproductor de Video",
-        "wizard.title": "Bienvenido a Pixel-OS",
-        "wizard.subtitle": "Configuración inicial",
-        "wizard.step": "Paso {current} de {total}",
-        "wizard.select_language": "Selecciona tu idioma",
-        "wizard.select_apps": "Apps pre-instaladas",
-        "wizard.create_account": "Crea tu cuenta local",
-        "wizard.username": "Nombre de usuario",
-        "wizard.password": "Contraseña",
-        "wizard.tab_hint": "Pulsa TAB para cambiar de campo",
-        "wizard.back": "Atrás",
-        "wizard.next": "Siguiente",
-        "wizard.finish": "Finalizar",
-        "terminal.welcome": "Pixel-OS Terminal v1.0",
-        "terminal.help_hint": "Escribe 'help' para ver comandos",
-        "terminal.cmds.title": "Comandos disponibles:",
-        "terminal.cmds.help": "  help  - Muestra esta ayuda",
-        "terminal.cmds.clear": "  clear - Limpia la pantalla",
-        "terminal.cmds.echo": "  echo  - Repite el texto",
-        "terminal.cmds.date": "  date  - Muestra la fecha",
-        "terminal.cmds.color": "  color - Cambia el color",
-        "terminal.unknown": "Comando desconocido: {cmd}",
-        "terminal.color.changed": "Color cambiado a {color}",
-        "terminal.color.usage": "Usa: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 Documentos",
-        "file_manager.folder.images": "📁 Imágenes",
-        "file_manager.folder.music": "📁 Música",
-        "file_manager.folder.videos": "📁 Videos",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notas.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← Atrás",
-        "settings.section.personalization": "🎨 Personalización",
-        "settings.section.sound": "🔊 Sonido",
-        "settings.section.display": "🖥️ Pantalla",
-        "settings.section.system": "⚙️ Sistema",
-        "settings.section.plugins": "🔌 Plugins",
-        "settings.options": "Opciones de configuración aquí...",
-        "mini_browser.button.back": "← Atrás",
-        "mini_browser.button.reload": "↻ Recargar",
-        "mini_browser.loading": "Cargando...",
-        "mini_browser.placeholder": "Buscador próximamente...",
-        "code_editor.template.python": "# Python template",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "ESPACIO:Play/Pausa  ← →:Anterior/Siguiente",
-        "code_editor.title": "Editor de Código",
-        "code_editor.placeholder": "Editor de código en construcción",
-        "video_player.title": "Reproductor de Video",
-        "video_player.placeholder": "Reproductor de video próximamente",
-        "console.logo_fail": "⚠️ No se pudo cargar el logo del sistema",
-        "console.started": "✨ Pixel-OS iniciado correctamente",
-        "console.closing": "👋 Cerrando Pixel-OS...",
-        "console.run_main": "❌ Ejecuta main.py para iniciar Pixel-OS",
-        "console.system_started": "✨ Sistema iniciado correctamente",
-        "console.desktop_hint": "📌 Haz click en los iconos del escritorio para abrir aplicaciones",
-        "console.enjoy": "🎨 Disfruta de la experiencia Pixel-OS!",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "pt": {
-        "app.terminal": "Terminal",
-        "app.text_editor": "Editor de Texto",
-        "app.file_manager": "Explorador de Arquivos",
-        "app.settings": "Configurações",
-        "app.calculator": "Calculadora",
-        "app.paint": "Paint",
-        "app.mini_browser": "Mini Navegador",
-        "app.code_editor": "Editor de Código",
-        "app.video_player": "Reprodutor de Vídeo",
-        "wizard.title": "Bem-vindo ao Pixel-OS",
-        "wizard.subtitle": "Configuração inicial",
-        "wizard.step": "Etapa {current} de {total}",
-        "wizard.select_language": "Selecione seu idioma",
-        "wizard.select_apps": "Apps pré-instalados",
-        "wizard.create_account": "Crie sua conta local",
-        "wizard.username": "Nome de usuário",
-        "wizard.password": "Senha",
-        "wizard.tab_hint": "Pressione TAB para alternar",
-        "wizard.back": "Voltar",
-        "wizard.next": "Avançar",
-        "wizard.finish": "Finalizar",
-        "terminal.welcome": "Pixel-OS Terminal v1.0",
-        "terminal.help_hint": "Digite 'help' para ver comandos",
-        "terminal.cmds.title": "Comandos disponíveis:",
-        "terminal.cmds.help": "  help  - Mostra esta ajuda",
-        "terminal.cmds.clear": "  clear - Limpa a tela",
-        "terminal.cmds.echo": "  echo  - Repete o texto",
-        "terminal.cmds.date": "  date  - Mostra a data",
-        "terminal.cmds.color": "  color - Muda a cor",
-        "terminal.unknown": "Comando desconhecido: {cmd}",
-        "terminal.color.changed": "Cor alterada para {color}",
-        "terminal.color.usage": "Use: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 Documentos",
-        "file_manager.folder.images": "📁 Imagens",
-        "file_manager.folder.music": "📁 Música",
-        "file_manager.folder.videos": "📁 Vídeos",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notas.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← Voltar",
-        "settings.section.personalization": "🎨 Personalização",
-        "settings.section.sound": "🔊 Som",
-        "settings.section.display": "🖥️ Tela",
-        "settings.section.system": "⚙️ Sistema",
-        "settings.section.plugins": "🔌 Plugins",
-        "settings.options": "Opções de configuração aqui...",
-        "mini_browser.button.back": "← Voltar",
-        "mini_browser.button.reload": "↻ Recarregar",
-        "mini_browser.loading": "Carregando...",
-        "mini_browser.placeholder": "Buscador em breve...",
-        "code_editor.template.python": "# Template Python",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "ESPAÇO:Play/Pausa  ← →:Anterior/Próximo",
-        "code_editor.title": "Editor de Código",
-        "code_editor.placeholder": "Editor de código em construção",
-        "video_player.title": "Reprodutor de Vídeo",
-        "video_player.placeholder": "Reprodutor de vídeo em breve",
-        "console.logo_fail": "⚠️ Não foi possível carregar o logo do sistema",
-        "console.started": "✨ Pixel-OS iniciado corretamente",
-        "console.closing": "👋 Encerrando Pixel-OS...",
-        "console.run_main": "❌ Execute main.py para iniciar o Pixel-OS",
-        "console.system_started": "✨ Sistema iniciado corretamente",
-        "console.desktop_hint": "📌 Clique nos ícones do desktop para abrir aplicativos",
-        "console.enjoy": "🎨 Aproveite a experiência Pixel-OS!",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "en": {
-        "app.terminal": "Terminal",
-        "app.text_editor": "Text Editor",
-        "app.file_manager": "File Manager",
-        "app.settings": "Settings",
-        "app.calculator": "Calculator",
-        "app.paint": "Paint",
-        "app.mini_browser": "Mini Browser",
-        "app.code_editor": "Code Editor",
-        "app.video_player": "Video Player",
-        "wizard.title": "Welcome to Pixel-OS",
-        "wizard.subtitle": "Initial setup",
-        "wizard.step": "Step {current} of {total}",
-        "wizard.select_language": "Choose your language",
-        "wizard.select_apps": "Pre-installed apps",
-        "wizard.create_account": "Create your local account",
-        "wizard.username": "Username",
-        "wizard.password": "Password",
-        "wizard.tab_hint": "Press TAB to switch fields",
-        "wizard.back": "Back",
-        "wizard.next": "Next",
-        "wizard.finish": "Finish",
-        "terminal.welcome": "Pixel-OS Terminal v1.0",
-        "terminal.help_hint": "Type 'help' to see commands",
-        "terminal.cmds.title": "Available commands:",
-        "terminal.cmds.help": "  help  - Show this help",
-        "terminal.cmds.clear": "  clear - Clear the screen",
-        "terminal.cmds.echo": "  echo  - Echo text",
-        "terminal.cmds.date": "  date  - Show date",
-        "terminal.cmds.color": "  color - Change color",
-        "terminal.unknown": "Unknown command: {cmd}",
-        "terminal.color.changed": "Color changed to {color}",
-        "terminal.color.usage": "Use: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 Documents",
-        "file_manager.folder.images": "📁 Images",
-        "file_manager.folder.music": "📁 Music",
-        "file_manager.folder.videos": "📁 Videos",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notes.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← Back",
-        "settings.section.personalization": "🎨 Personalization",
-        "settings.section.sound": "🔊 Sound",
-        "settings.section.display": "🖥️ Display",
-        "settings.section.system": "⚙️ System",
-        "settings.section.plugins": "🔌 Plugins",
-        "settings.options": "Settings options here...",
-        "mini_browser.button.back": "← Back",
-        "mini_browser.button.reload": "↻ Reload",
-        "mini_browser.loading": "Loading...",
-        "mini_browser.placeholder": "Search coming soon...",
-        "code_editor.template.python": "# Python template",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "SPACE:Play/Pause  ← →:Previous/Next",
-        "code_editor.title": "Code Editor",
-        "code_editor.placeholder": "Code editor under construction",
-        "video_player.title": "Video Player",
-        "video_player.placeholder": "Video player coming soon",
-        "console.logo_fail": "⚠️ Failed to load system logo",
-        "console.started": "✨ Pixel-OS started successfully",
-        "console.closing": "👋 Closing Pixel-OS...",
-        "console.run_main": "❌ Run main.py to start Pixel-OS",
-        "console.system_started": "✨ System started successfully",
-        "console.desktop_hint": "📌 Click desktop icons to open apps",
-        "console.enjoy": "🎨 Enjoy the Pixel-OS experience!",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "de": {
-        "app.terminal": "Terminal",
-        "app.text_editor": "Texteditor",
-        "app.file_manager": "Dateimanager",
-        "app.settings": "Einstellungen",
-        "app.calculator": "Rechner",
-        "app.paint": "Paint",
-        "app.mini_browser": "Mini-Browser",
-        "app.code_editor": "Code-Editor",
-        "app.video_player": "Videoplayer",
-        "wizard.title": "Willkommen bei Pixel-OS",
-        "wizard.subtitle": "Ersteinrichtung",
-        "wizard.step": "Schritt {current} von {total}",
-        "wizard.select_language": "Sprache auswählen",
-        "wizard.select_apps": "Vorinstallierte Apps",
-        "wizard.create_account": "Lokales Konto erstellen",
-        "wizard.username": "Benutzername",
-        "wizard.password": "Passwort",
-        "wizard.tab_hint": "TAB drücken, um zu wechseln",
-        "wizard.back": "Zurück",
-        "wizard.next": "Weiter",
-        "wizard.finish": "Fertig",
-        "terminal.welcome": "Pixel-OS Terminal v1.0",
-        "terminal.help_hint": "Tippe 'help' für Befehle",
-        "terminal.cmds.title": "Verfügbare Befehle:",
-        "terminal.cmds.help": "  help  - Hilfe anzeigen",
-        "terminal.cmds.clear": "  clear - Bildschirm leeren",
-        "terminal.cmds.echo": "  echo  - Text wiederholen",
-        "terminal.cmds.date": "  date  - Datum anzeigen",
-        "terminal.cmds.color": "  color - Farbe ändern",
-        "terminal.unknown": "Unbekannter Befehl: {cmd}",
-        "terminal.color.changed": "Farbe geändert zu {color}",
-        "terminal.color.usage": "Verwendung: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 Dokumente",
-        "file_manager.folder.images": "📁 Bilder",
-        "file_manager.folder.music": "📁 Musik",
-        "file_manager.folder.videos": "📁 Videos",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notizen.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← Zurück",
-        "settings.section.personalization": "🎨 Personalisierung",
-        "settings.section.sound": "🔊 Sound",
-        "settings.section.display": "🖥️ Anzeige",
-        "settings.section.system": "⚙️ System",
-        "settings.section.plugins": "🔌 Plugins",
-        "settings.options": "Einstellungen hier...",
-        "mini_browser.button.back": "← Zurück",
-        "mini_browser.button.reload": "↻ Aktualisieren",
-        "mini_browser.loading": "Wird geladen...",
-        "mini_browser.placeholder": "Suche bald verfügbar...",
-        "code_editor.template.python": "# Python Vorlage",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "LEERTASTE:Wiedergabe/Pause  ← →:Zurück/Vor",
-        "code_editor.title": "Code-Editor",
-        "code_editor.placeholder": "Code-Editor in Arbeit",
-        "video_player.title": "Videoplayer",
-        "video_player.placeholder": "Videoplayer bald verfügbar",
-        "console.logo_fail": "⚠️ Systemlogo konnte nicht geladen werden",
-        "console.started": "✨ Pixel-OS erfolgreich gestartet",
-        "console.closing": "👋 Pixel-OS wird geschlossen...",
-        "console.run_main": "❌ main.py ausführen, um Pixel-OS zu starten",
-        "console.system_started": "✨ System erfolgreich gestartet",
-        "console.desktop_hint": "📌 Klicke auf Desktop-Icons, um Apps zu öffnen",
-        "console.enjoy": "🎨 Viel Spaß mit Pixel-OS!",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "fr": {
-        "app.terminal": "Terminal",
-        "app.text_editor": "Éditeur de texte",
-        "app.file_manager": "Explorateur de fichiers",
-        "app.settings": "Paramètres",
-        "app.calculator": "Calculatrice",
-        "app.paint": "Paint",
-        "app.mini_browser": "Mini Navigateur",
-        "app.code_editor": "Éditeur de code",
-        "app.video_player": "Lecteur vidéo",
-        "wizard.title": "Bienvenue sur Pixel-OS",
-        "wizard.subtitle": "Configuration initiale",
-        "wizard.step": "Étape {current} sur {total}",
-        "wizard.select_language": "Choisissez votre langue",
-        "wizard.select_apps": "Apps préinstallées",
-        "wizard.create_account": "Créer un compte local",
-        "wizard.username": "Nom d'utilisateur",
-        "wizard.password": "Mot de passe",
-        "wizard.tab_hint": "Appuyez sur TAB pour changer",
-        "wizard.back": "Retour",
-        "wizard.next": "Suivant",
-        "wizard.finish": "Terminer",
-        "terminal.welcome": "Pixel-OS Terminal v1.0",
-        "terminal.help_hint": "Tapez 'help' pour voir les commandes",
-        "terminal.cmds.title": "Commandes disponibles :",
-        "terminal.cmds.help": "  help  - Afficher l'aide",
-        "terminal.cmds.clear": "  clear - Effacer l'écran",
-        "terminal.cmds.echo": "  echo  - Répéter le texte",
-        "terminal.cmds.date": "  date  - Afficher la date",
-        "terminal.cmds.color": "  color - Changer la couleur",
-        "terminal.unknown": "Commande inconnue : {cmd}",
-        "terminal.color.changed": "Couleur changée en {color}",
-        "terminal.color.usage": "Utilisation : color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 Documents",
-        "file_manager.folder.images": "📁 Images",
-        "file_manager.folder.music": "📁 Musique",
-        "file_manager.folder.videos": "📁 Vidéos",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notes.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← Retour",
-        "settings.section.personalization": "🎨 Personnalisation",
-        "settings.section.sound": "🔊 Son",
-        "settings.section.display": "🖥️ Écran",
-        "settings.section.system": "⚙️ Système",
-        "settings.section.plugins": "🔌 Plugins",
-        "settings.options": "Options de configuration ici...",
-        "mini_browser.button.back": "← Retour",
-        "mini_browser.button.reload": "↻ Actualiser",
-        "mini_browser.loading": "Chargement...",
-        "mini_browser.placeholder": "Recherche bientôt...",
-        "code_editor.template.python": "# Modèle Python",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "ESPACE:Jouer/Pause  ← →:Précédent/Suivant",
-        "code_editor.title": "Éditeur de code",
-        "code_editor.placeholder": "Éditeur de code en construction",
-        "video_player.title": "Lecteur vidéo",
-        "video_player.placeholder": "Lecteur vidéo bientôt disponible",
-        "console.logo_fail": "⚠️ Impossible de charger le logo du système",
-        "console.started": "✨ Pixel-OS démarré avec succès",
-        "console.closing": "👋 Fermeture de Pixel-OS...",
-        "console.run_main": "❌ Exécutez main.py pour démarrer Pixel-OS",
-        "console.system_started": "✨ Système démarré avec succès",
-        "console.desktop_hint": "📌 Cliquez sur les icônes pour ouvrir les apps",
-        "console.enjoy": "🎨 Profitez de l'expérience Pixel-OS !",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "zh": {
-        "app.terminal": "终端",
-        "app.text_editor": "文本编辑器",
-        "app.file_manager": "文件管理器",
-        "app.settings": "设置",
-        "app.calculator": "计算器",
-        "app.paint": "画图",
-        "app.mini_browser": "迷你浏览器",
-        "app.code_editor": "代码编辑器",
-        "app.video_player": "视频播放器",
-        "wizard.title": "欢迎使用 Pixel-OS",
-        "wizard.subtitle": "初始设置",
-        "wizard.step": "第 {current} 步 / 共 {total} 步",
-        "wizard.select_language": "选择语言",
-        "wizard.select_apps": "预装应用",
-        "wizard.create_account": "创建本地账户",
-        "wizard.username": "用户名",
-        "wizard.password": "密码",
-        "wizard.tab_hint": "按 TAB 切换输入框",
-        "wizard.back": "返回",
-        "wizard.next": "下一步",
-        "wizard.finish": "完成",
-        "terminal.welcome": "Pixel-OS 终端 v1.0",
-        "terminal.help_hint": "输入 'help' 查看命令",
-        "terminal.cmds.title": "可用命令：",
-        "terminal.cmds.help": "  help  - 显示帮助",
-        "terminal.cmds.clear": "  clear - 清空屏幕",
-        "terminal.cmds.echo": "  echo  - 输出文本",
-        "terminal.cmds.date": "  date  - 显示日期",
-        "terminal.cmds.color": "  color - 更改颜色",
-        "terminal.unknown": "未知命令：{cmd}",
-        "terminal.color.changed": "颜色已更改为 {color}",
-        "terminal.color.usage": "用法：color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 文档",
-        "file_manager.folder.images": "📁 图片",
-        "file_manager.folder.music": "📁 音乐",
-        "file_manager.folder.videos": "📁 视频",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notes.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← 返回",
-        "settings.section.personalization": "🎨 个性化",
-        "settings.section.sound": "🔊 声音",
-        "settings.section.display": "🖥️ 显示",
-        "settings.section.system": "⚙️ 系统",
-        "settings.section.plugins": "🔌 插件",
-        "settings.options": "设置选项将在此显示...",
-        "mini_browser.button.back": "← 返回",
-        "mini_browser.button.reload": "↻ 刷新",
-        "mini_browser.loading": "正在加载...",
-        "mini_browser.placeholder": "搜索功能即将推出...",
-        "code_editor.template.python": "# Python 模板",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "空格:播放/暂停  ← →:上一个/下一个",
-        "code_editor.title": "代码编辑器",
-        "code_editor.placeholder": "代码编辑器开发中",
-        "video_player.title": "视频播放器",
-        "video_player.placeholder": "视频播放器即将推出",
-        "console.logo_fail": "⚠️ 无法加载系统徽标",
-        "console.started": "✨ Pixel-OS 启动成功",
-        "console.closing": "👋 正在关闭 Pixel-OS...",
-        "console.run_main": "❌ 运行 main.py 启动 Pixel-OS",
-        "console.system_started": "✨ 系统启动成功",
-        "console.desktop_hint": "📌 点击桌面图标打开应用",
-        "console.enjoy": "🎨 享受 Pixel-OS 的体验！",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "ko": {
-        "app.terminal": "터미널",
-        "app.text_editor": "텍스트 편집기",
-        "app.file_manager": "파일 관리자",
-        "app.settings": "설정",
-        "app.calculator": "계산기",
-        "app.paint": "그림판",
-        "app.mini_browser": "미니 브라우저",
-        "app.code_editor": "코드 편집기",
-        "app.video_player": "비디오 플레이어",
-        "wizard.title": "Pixel-OS에 오신 것을 환영합니다",
-        "wizard.subtitle": "초기 설정",
-        "wizard.step": "{total}단계 중 {current}단계",
-        "wizard.select_language": "언어 선택",
-        "wizard.select_apps": "사전 설치 앱",
-        "wizard.create_account": "로컬 계정 만들기",
-        "wizard.username": "사용자 이름",
-        "wizard.password": "비밀번호",
-        "wizard.tab_hint": "TAB을 눌러 필드 전환",
-        "wizard.back": "뒤로",
-        "wizard.next": "다음",
-        "wizard.finish": "완료",
-        "terminal.welcome": "Pixel-OS 터미널 v1.0",
-        "terminal.help_hint": "'help' 입력으로 명령 보기",
-        "terminal.cmds.title": "사용 가능한 명령:",
-        "terminal.cmds.help": "  help  - 도움말 표시",
-        "terminal.cmds.clear": "  clear - 화면 지우기",
-        "terminal.cmds.echo": "  echo  - 텍스트 출력",
-        "terminal.cmds.date": "  date  - 날짜 표시",
-        "terminal.cmds.color": "  color - 색상 변경",
-        "terminal.unknown": "알 수 없는 명령: {cmd}",
-        "terminal.color.changed": "색상이 {color}(으)로 변경됨",
-        "terminal.color.usage": "사용법: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 문서",
-        "file_manager.folder.images": "📁 이미지",
-        "file_manager.folder.music": "📁 음악",
-        "file_manager.folder.videos": "📁 비디오",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notes.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← 뒤로",
-        "settings.section.personalization": "🎨 개인 설정",
-        "settings.section.sound": "🔊 사운드",
-        "settings.section.display": "🖥️ 디스플레이",
-        "settings.section.system": "⚙️ 시스템",
-        "settings.section.plugins": "🔌 플러그인",
-        "settings.options": "설정 옵션이 여기에 표시됩니다...",
-        "mini_browser.button.back": "← 뒤로",
-        "mini_browser.button.reload": "↻ 새로고침",
-        "mini_browser.loading": "로드 중...",
-        "mini_browser.placeholder": "검색 기능 준비 중...",
-        "code_editor.template.python": "# Python 템플릿",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "스페이스:재생/일시중지  ← →:이전/다음",
-        "code_editor.title": "코드 편집기",
-        "code_editor.placeholder": "코드 편집기 개발 중",
-        "video_player.title": "비디오 플레이어",
-        "video_player.placeholder": "비디오 플레이어 준비 중",
-        "console.logo_fail": "⚠️ 시스템 로고를 불러올 수 없습니다",
-        "console.started": "✨ Pixel-OS가 성공적으로 시작됨",
-        "console.closing": "👋 Pixel-OS 종료 중...",
-        "console.run_main": "❌ Pixel-OS를 시작하려면 main.py를 실행하세요",
-        "console.system_started": "✨ 시스템이 성공적으로 시작됨",
-        "console.desktop_hint": "📌 데스크톱 아이콘을 클릭하여 앱을 여세요",
-        "console.enjoy": "🎨 Pixel-OS를 즐겨보세요!",
-        "taskbar.brand": "Pixel-OS",
-    },
-    "ja": {
-        "app.terminal": "ターミナル",
-        "app.text_editor": "テキストエディター",
-        "app.file_manager": "ファイルマネージャー",
-        "app.settings": "設定",
-        "app.calculator": "電卓",
-        "app.paint": "ペイント",
-        "app.mini_browser": "ミニブラウザ",
-        "app.code_editor": "コードエディター",
-        "app.video_player": "ビデオプレーヤー",
-        "wizard.title": "Pixel-OSへようこそ",
-        "wizard.subtitle": "初期設定",
-        "wizard.step": "全{total}中 {current}",
-        "wizard.select_language": "言語を選択",
-        "wizard.select_apps": "プリインストールアプリ",
-        "wizard.create_account": "ローカルアカウントを作成",
-        "wizard.username": "ユーザー名",
-        "wizard.password": "パスワード",
-        "wizard.tab_hint": "TABでフィールド切替",
-        "wizard.back": "戻る",
-        "wizard.next": "次へ",
-        "wizard.finish": "完了",
-        "terminal.welcome": "Pixel-OS ターミナル v1.0",
-        "terminal.help_hint": "'help' でコマンド一覧",
-        "terminal.cmds.title": "使用可能なコマンド：",
-        "terminal.cmds.help": "  help  - ヘルプを表示",
-        "terminal.cmds.clear": "  clear - 画面をクリア",
-        "terminal.cmds.echo": "  echo  - テキストを表示",
-        "terminal.cmds.date": "  date  - 日付を表示",
-        "terminal.cmds.color": "  color - 色を変更",
-        "terminal.unknown": "不明なコマンド: {cmd}",
-        "terminal.color.changed": "色が {color} に変更されました",
-        "terminal.color.usage": "使い方: color [pink|blue|green|yellow|purple|peach]",
-        "file_manager.path_root": "/",
-        "file_manager.folder.documents": "📁 ドキュメント",
-        "file_manager.folder.images": "📁 画像",
-        "file_manager.folder.music": "📁 音楽",
-        "file_manager.folder.videos": "📁 動画",
-        "file_manager.file.readme": "📄 readme.txt",
-        "file_manager.file.notes": "📄 notes.txt",
-        "file_manager.icon.folder": "📁",
-        "file_manager.icon.file": "📄",
-        "file_manager.button.back": "← 戻る",
-        "settings.section.personalization": "🎨 パーソナライズ",
-        "settings.section.sound": "🔊 サウンド",
-        "settings.section.display": "🖥️ 画面",
-        "settings.section.system": "⚙️ システム",
-        "settings.section.plugins": "🔌 プラグイン",
-        "settings.options": "設定オプションはここに表示されます...",
-        "mini_browser.button.back": "← 戻る",
-        "mini_browser.button.reload": "↻ 更新",
-        "mini_browser.loading": "読み込み中...",
-        "mini_browser.placeholder": "検索機能は近日公開...",
-        "code_editor.template.python": "# Pythonテンプレート",
-        "video_player.sample.video1": "video_1.mp4",
-        "video_player.sample.video2": "video_2.mp4",
-        "video_player.sample.video3": "video_3.mp4",
-        "video_player.button.play": "▶",
-        "video_player.button.pause": "⏸",
-        "video_player.help": "スペース:再生/一時停止  ← →:前へ/次へ",
-        "code_editor.title": "コードエディター",
-        "code_editor.placeholder": "コードエディターは準備中",
-        "video_player.title": "ビデオプレーヤー",
-        "video_player.placeholder": "ビデオプレーヤーは近日公開",
-        "console.logo_fail": "⚠️ システムロゴを読み込めません",
-        "console.started": "✨ Pixel-OS を起動しました",
-        "console.closing": "👋 Pixel-OS を終了しています...",
-        "console.run_main": "❌ Pixel-OS を起動するには main.py を実行してください",
-        "console.system_started": "✨ システムが起動しました",
-        "console.desktop_hint": "📌 デスクトップのアイコンをクリックしてアプリを開いてください",
-        "console.enjoy": "🎨 Pixel-OS をお楽しみください！",
-        "taskbar.brand": "Pixel-OS",
-    },
-}
+# Tablas ya cargadas; cada idioma vive en config/locales/<código>.py y se
+# importa la primera vez que se usa
+TRANSLATIONS: Dict[str, Dict[str, str]] = {}
 
 
 LANGUAGE_NAMES = [
@@ -609,9 +27,21 @@ LANGUAGE_NAMES = [
 ]
 
 
+LANGUAGE_CODES = {language["code"] for language in LANGUAGE_NAMES}
+
+
+def _get_table(code: str) -> Dict[str, str]:
+    """Devuelve la tabla de un idioma, importándola si aún no se cargó."""
+    table = TRANSLATIONS.get(code)
+    if table is None:
+        table = importlib.import_module(f"config.locales.{code}").STRINGS
+        TRANSLATIONS[code] = table
+    return table
+
+
 def set_language(code: str) -> None:
     global _current_language
-    if code in TRANSLATIONS:
+    if code in LANGUAGE_CODES:
         _current_language = code
     else:
         _current_language = DEFAULT_LANGUAGE
@@ -623,8 +53,9 @@ def get_language() -> str:
 
 def tr(key: str, **kwargs) -> str:
     """Devuelve la traducción para la clave en el idioma actual."""
-    lang_table = TRANSLATIONS.get(_current_language, TRANSLATIONS[DEFAULT_LANGUAGE])
-    text = lang_table.get(key, TRANSLATIONS[DEFAULT_LANGUAGE].get(key, key))
+    text = _get_table(_current_language).get(key)
+    if text is None:
+        text = _get_table(DEFAULT_LANGUAGE).get(key, key)
     try:
         return text.format(**kwargs)
     except Exception:
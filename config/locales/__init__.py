@@ -0,0 +1,3 @@
+"""
+Tablas de traducción, una por idioma (se cargan al usarse)
+"""
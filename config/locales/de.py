@@ -0,0 +1,77 @@
+"""
+Traducciones: Deutsch
+"""
+
+STRINGS = {
+    "app.terminal": "Terminal",
+    "app.text_editor": "Texteditor",
+    "app.file_manager": "Dateimanager",
+    "app.settings": "Einstellungen",
+    "app.calculator": "Rechner",
+    "app.paint": "Paint",
+    "app.mini_browser": "Mini-Browser",
+    "app.code_editor": "Code-Editor",
+    "app.video_player": "Videoplayer",
+    "wizard.title": "Willkommen bei Pixel-OS",
+    "wizard.subtitle": "Ersteinrichtung",
+    "wizard.step": "Schritt {current} von {total}",
+    "wizard.select_language": "Sprache auswählen",
+    "wizard.select_apps": "Vorinstallierte Apps",
+    "wizard.create_account": "Lokales Konto erstellen",
+    "wizard.username": "Benutzername",
+    "wizard.password": "Passwort",
+    "wizard.tab_hint": "TAB drücken, um zu wechseln",
+    "wizard.back": "Zurück",
+    "wizard.next": "Weiter",
+    "wizard.finish": "Fertig",
+    "terminal.welcome": "Pixel-OS Terminal v1.0",
+    "terminal.help_hint": "Tippe 'help' für Befehle",
+    "terminal.cmds.title": "Verfügbare Befehle:",
+    "terminal.cmds.help": "  help  - Hilfe anzeigen",
+    "terminal.cmds.clear": "  clear - Bildschirm leeren",
+    "terminal.cmds.echo": "  echo  - Text wiederholen",
+    "terminal.cmds.date": "  date  - Datum anzeigen",
+    "terminal.cmds.color": "  color - Farbe ändern",
+    "terminal.unknown": "Unbekannter Befehl: {cmd}",
+    "terminal.color.changed": "Farbe geändert zu {color}",
+    "terminal.color.usage": "Verwendung: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 Dokumente",
+    "file_manager.folder.images": "📁 Bilder",
+    "file_manager.folder.music": "📁 Musik",
+    "file_manager.folder.videos": "📁 Videos",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notizen.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← Zurück",
+    "settings.section.personalization": "🎨 Personalisierung",
+    "settings.section.sound": "🔊 Sound",
+    "settings.section.display": "🖥️ Anzeige",
+    "settings.section.system": "⚙️ System",
+    "settings.section.plugins": "🔌 Plugins",
+    "settings.options": "Einstellungen hier...",
+    "mini_browser.button.back": "← Zurück",
+    "mini_browser.button.reload": "↻ Aktualisieren",
+    "mini_browser.loading": "Wird geladen...",
+    "mini_browser.placeholder": "Suche bald verfügbar...",
+    "code_editor.template.python": "# Python Vorlage",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "LEERTASTE:Wiedergabe/Pause  ← →:Zurück/Vor",
+    "code_editor.title": "Code-Editor",
+    "code_editor.placeholder": "Code-Editor in Arbeit",
+    "video_player.title": "Videoplayer",
+    "video_player.placeholder": "Videoplayer bald verfügbar",
+    "console.logo_fail": "⚠️ Systemlogo konnte nicht geladen werden",
+    "console.started": "✨ Pixel-OS erfolgreich gestartet",
+    "console.closing": "👋 Pixel-OS wird geschlossen...",
+    "console.run_main": "❌ main.py ausführen, um Pixel-OS zu starten",
+    "console.system_started": "✨ System erfolgreich gestartet",
+    "console.desktop_hint": "📌 Klicke auf Desktop-Icons, um Apps zu öffnen",
+    "console.enjoy": "🎨 Viel Spaß mit Pixel-OS!",
+    "taskbar.brand": "Pixel-OS",
+}
@@ -0,0 +1,77 @@
+"""
+Traducciones: English
+"""
+
+STRINGS = {
+    "app.terminal": "Terminal",
+    "app.text_editor": "Text Editor",
+    "app.file_manager": "File Manager",
+    "app.settings": "Settings",
+    "app.calculator": "Calculator",
+    "app.paint": "Paint",
+    "app.mini_browser": "Mini Browser",
+    "app.code_editor": "Code Editor",
+    "app.video_player": "Video Player",
+    "wizard.title": "Welcome to Pixel-OS",
+    "wizard.subtitle": "Initial setup",
+    "wizard.step": "Step {current} of {total}",
+    "wizard.select_language": "Choose your language",
+    "wizard.select_apps": "Pre-installed apps",
+    "wizard.create_account": "Create your local account",
+    "wizard.username": "Username",
+    "wizard.password": "Password",
+    "wizard.tab_hint": "Press TAB to switch fields",
+    "wizard.back": "Back",
+    "wizard.next": "Next",
+    "wizard.finish": "Finish",
+    "terminal.welcome": "Pixel-OS Terminal v1.0",
+    "terminal.help_hint": "Type 'help' to see commands",
+    "terminal.cmds.title": "Available commands:",
+    "terminal.cmds.help": "  help  - Show this help",
+    "terminal.cmds.clear": "  clear - Clear the screen",
+    "terminal.cmds.echo": "  echo  - Echo text",
+    "terminal.cmds.date": "  date  - Show date",
+    "terminal.cmds.color": "  color - Change color",
+    "terminal.unknown": "Unknown command: {cmd}",
+    "terminal.color.changed": "Color changed to {color}",
+    "terminal.color.usage": "Use: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 Documents",
+    "file_manager.folder.images": "📁 Images",
+    "file_manager.folder.music": "📁 Music",
+    "file_manager.folder.videos": "📁 Videos",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notes.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← Back",
+    "settings.section.personalization": "🎨 Personalization",
+    "settings.section.sound": "🔊 Sound",
+    "settings.section.display": "🖥️ Display",
+    "settings.section.system": "⚙️ System",
+    "settings.section.plugins": "🔌 Plugins",
+    "settings.options": "Settings options here...",
+    "mini_browser.button.back": "← Back",
+    "mini_browser.button.reload": "↻ Reload",
+    "mini_browser.loading": "Loading...",
+    "mini_browser.placeholder": "Search coming soon...",
+    "code_editor.template.python": "# Python template",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "SPACE:Play/Pause  ← →:Previous/Next",
+    "code_editor.title": "Code Editor",
+    "code_editor.placeholder": "Code editor under construction",
+    "video_player.title": "Video Player",
+    "video_player.placeholder": "Video player coming soon",
+    "console.logo_fail": "⚠️ Failed to load system logo",
+    "console.started": "✨ Pixel-OS started successfully",
+    "console.closing": "👋 Closing Pixel-OS...",
+    "console.run_main": "❌ Run main.py to start Pixel-OS",
+    "console.system_started": "✨ System started successfully",
+    "console.desktop_hint": "📌 Click desktop icons to open apps",
+    "console.enjoy": "🎨 Enjoy the Pixel-OS experience!",
+    "taskbar.brand": "Pixel-OS",
+}
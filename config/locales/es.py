@@ -0,0 +1,77 @@
+"""
+Traducciones: Español
+"""
+
+STRINGS = {
+    "app.terminal": "Terminal",
+    "app.text_editor": "Editor de Texto",
+    "app.file_manager": "Explorador de Archivos",
+    "app.settings": "Configuración",
+    "app.calculator": "Calculadora",
+    "app.paint": "Paint",
+    "app.mini_browser": "Mini Navegador",
+    "app.code_editor": "Editor de Código",
+    "app.video_player": "Reproductor de Video",
+    "wizard.title": "Bienvenido a Pixel-OS",
+    "wizard.subtitle": "Configuración inicial",
+    "wizard.step": "Paso {current} de {total}",
+    "wizard.select_language": "Selecciona tu idioma",
+    "wizard.select_apps": "Apps pre-instaladas",
+    "wizard.create_account": "Crea tu cuenta local",
+    "wizard.username": "Nombre de usuario",
+    "wizard.password": "Contraseña",
+    "wizard.tab_hint": "Pulsa TAB para cambiar de campo",
+    "wizard.back": "Atrás",
+    "wizard.next": "Siguiente",
+    "wizard.finish": "Finalizar",
+    "terminal.welcome": "Pixel-OS Terminal v1.0",
+    "terminal.help_hint": "Escribe 'help' para ver comandos",
+    "terminal.cmds.title": "Comandos disponibles:",
+    "terminal.cmds.help": "  help  - Muestra esta ayuda",
+    "terminal.cmds.clear": "  clear - Limpia la pantalla",
+    "terminal.cmds.echo": "  echo  - Repite el texto",
+    "terminal.cmds.date": "  date  - Muestra la fecha",
+    "terminal.cmds.color": "  color - Cambia el color",
+    "terminal.unknown": "Comando desconocido: {cmd}",
+    "terminal.color.changed": "Color cambiado a {color}",
+    "terminal.color.usage": "Usa: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 Documentos",
+    "file_manager.folder.images": "📁 Imágenes",
+    "file_manager.folder.music": "📁 Música",
+    "file_manager.folder.videos": "📁 Videos",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notas.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← Atrás",
+    "settings.section.personalization": "🎨 Personalización",
+    "settings.section.sound": "🔊 Sonido",
+    "settings.section.display": "🖥️ Pantalla",
+    "settings.section.system": "⚙️ Sistema",
+    "settings.section.plugins": "🔌 Plugins",
+    "settings.options": "Opciones de configuración aquí...",
+    "mini_browser.button.back": "← Atrás",
+    "mini_browser.button.reload": "↻ Recargar",
+    "mini_browser.loading": "Cargando...",
+    "mini_browser.placeholder": "Buscador próximamente...",
+    "code_editor.template.python": "# Python template",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "ESPACIO:Play/Pausa  ← →:Anterior/Siguiente",
+    "code_editor.title": "Editor de Código",
+    "code_editor.placeholder": "Editor de código en construcción",
+    "video_player.title": "Reproductor de Video",
+    "video_player.placeholder": "Reproductor de video próximamente",
+    "console.logo_fail": "⚠️ No se pudo cargar el logo del sistema",
+    "console.started": "✨ Pixel-OS iniciado correctamente",
+    "console.closing": "👋 Cerrando Pixel-OS...",
+    "console.run_main": "❌ Ejecuta main.py para iniciar Pixel-OS",
+    "console.system_started": "✨ Sistema iniciado correctamente",
+    "console.desktop_hint": "📌 Haz click en los iconos del escritorio para abrir aplicaciones",
+    "console.enjoy": "🎨 Disfruta de la experiencia Pixel-OS!",
+    "taskbar.brand": "Pixel-OS",
+}
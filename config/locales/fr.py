@@ -0,0 +1,77 @@
+"""
+Traducciones: Français
+"""
+
+STRINGS = {
+    "app.terminal": "Terminal",
+    "app.text_editor": "Éditeur de texte",
+    "app.file_manager": "Explorateur de fichiers",
+    "app.settings": "Paramètres",
+    "app.calculator": "Calculatrice",
+    "app.paint": "Paint",
+    "app.mini_browser": "Mini Navigateur",
+    "app.code_editor": "Éditeur de code",
+    "app.video_player": "Lecteur vidéo",
+    "wizard.title": "Bienvenue sur Pixel-OS",
+    "wizard.subtitle": "Configuration initiale",
+    "wizard.step": "Étape {current} sur {total}",
+    "wizard.select_language": "Choisissez votre langue",
+    "wizard.select_apps": "Apps préinstallées",
+    "wizard.create_account": "Créer un compte local",
+    "wizard.username": "Nom d'utilisateur",
+    "wizard.password": "Mot de passe",
+    "wizard.tab_hint": "Appuyez sur TAB pour changer",
+    "wizard.back": "Retour",
+    "wizard.next": "Suivant",
+    "wizard.finish": "Terminer",
+    "terminal.welcome": "Pixel-OS Terminal v1.0",
+    "terminal.help_hint": "Tapez 'help' pour voir les commandes",
+    "terminal.cmds.title": "Commandes disponibles :",
+    "terminal.cmds.help": "  help  - Afficher l'aide",
+    "terminal.cmds.clear": "  clear - Effacer l'écran",
+    "terminal.cmds.echo": "  echo  - Répéter le texte",
+    "terminal.cmds.date": "  date  - Afficher la date",
+    "terminal.cmds.color": "  color - Changer la couleur",
+    "terminal.unknown": "Commande inconnue : {cmd}",
+    "terminal.color.changed": "Couleur changée en {color}",
+    "terminal.color.usage": "Utilisation : color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 Documents",
+    "file_manager.folder.images": "📁 Images",
+    "file_manager.folder.music": "📁 Musique",
+    "file_manager.folder.videos": "📁 Vidéos",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notes.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← Retour",
+    "settings.section.personalization": "🎨 Personnalisation",
+    "settings.section.sound": "🔊 Son",
+    "settings.section.display": "🖥️ Écran",
+    "settings.section.system": "⚙️ Système",
+    "settings.section.plugins": "🔌 Plugins",
+    "settings.options": "Options de configuration ici...",
+    "mini_browser.button.back": "← Retour",
+    "mini_browser.button.reload": "↻ Actualiser",
+    "mini_browser.loading": "Chargement...",
+    "mini_browser.placeholder": "Recherche bientôt...",
+    "code_editor.template.python": "# Modèle Python",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "ESPACE:Jouer/Pause  ← →:Précédent/Suivant",
+    "code_editor.title": "Éditeur de code",
+    "code_editor.placeholder": "Éditeur de code en construction",
+    "video_player.title": "Lecteur vidéo",
+    "video_player.placeholder": "Lecteur vidéo bientôt disponible",
+    "console.logo_fail": "⚠️ Impossible de charger le logo du système",
+    "console.started": "✨ Pixel-OS démarré avec succès",
+    "console.closing": "👋 Fermeture de Pixel-OS...",
+    "console.run_main": "❌ Exécutez main.py pour démarrer Pixel-OS",
+    "console.system_started": "✨ Système démarré avec succès",
+    "console.desktop_hint": "📌 Cliquez sur les icônes pour ouvrir les apps",
+    "console.enjoy": "🎨 Profitez de l'expérience Pixel-OS !",
+    "taskbar.brand": "Pixel-OS",
+}
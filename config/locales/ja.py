@@ -0,0 +1,77 @@
+"""
+Traducciones: 日本語
+"""
+
+STRINGS = {
+    "app.terminal": "ターミナル",
+    "app.text_editor": "テキストエディター",
+    "app.file_manager": "ファイルマネージャー",
+    "app.settings": "設定",
+    "app.calculator": "電卓",
+    "app.paint": "ペイント",
+    "app.mini_browser": "ミニブラウザ",
+    "app.code_editor": "コードエディター",
+    "app.video_player": "ビデオプレーヤー",
+    "wizard.title": "Pixel-OSへようこそ",
+    "wizard.subtitle": "初期設定",
+    "wizard.step": "全{total}中 {current}",
+    "wizard.select_language": "言語を選択",
+    "wizard.select_apps": "プリインストールアプリ",
+    "wizard.create_account": "ローカルアカウントを作成",
+    "wizard.username": "ユーザー名",
+    "wizard.password": "パスワード",
+    "wizard.tab_hint": "TABでフィールド切替",
+    "wizard.back": "戻る",
+    "wizard.next": "次へ",
+    "wizard.finish": "完了",
+    "terminal.welcome": "Pixel-OS ターミナル v1.0",
+    "terminal.help_hint": "'help' でコマンド一覧",
+    "terminal.cmds.title": "使用可能なコマンド：",
+    "terminal.cmds.help": "  help  - ヘルプを表示",
+    "terminal.cmds.clear": "  clear - 画面をクリア",
+    "terminal.cmds.echo": "  echo  - テキストを表示",
+    "terminal.cmds.date": "  date  - 日付を表示",
+    "terminal.cmds.color": "  color - 色を変更",
+    "terminal.unknown": "不明なコマンド: {cmd}",
+    "terminal.color.changed": "色が {color} に変更されました",
+    "terminal.color.usage": "使い方: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 ドキュメント",
+    "file_manager.folder.images": "📁 画像",
+    "file_manager.folder.music": "📁 音楽",
+    "file_manager.folder.videos": "📁 動画",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notes.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← 戻る",
+    "settings.section.personalization": "🎨 パーソナライズ",
+    "settings.section.sound": "🔊 サウンド",
+    "settings.section.display": "🖥️ 画面",
+    "settings.section.system": "⚙️ システム",
+    "settings.section.plugins": "🔌 プラグイン",
+    "settings.options": "設定オプションはここに表示されます...",
+    "mini_browser.button.back": "← 戻る",
+    "mini_browser.button.reload": "↻ 更新",
+    "mini_browser.loading": "読み込み中...",
+    "mini_browser.placeholder": "検索機能は近日公開...",
+    "code_editor.template.python": "# Pythonテンプレート",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "スペース:再生/一時停止  ← →:前へ/次へ",
+    "code_editor.title": "コードエディター",
+    "code_editor.placeholder": "コードエディターは準備中",
+    "video_player.title": "ビデオプレーヤー",
+    "video_player.placeholder": "ビデオプレーヤーは近日公開",
+    "console.logo_fail": "⚠️ システムロゴを読み込めません",
+    "console.started": "✨ Pixel-OS を起動しました",
+    "console.closing": "👋 Pixel-OS を終了しています...",
+    "console.run_main": "❌ Pixel-OS を起動するには main.py を実行してください",
+    "console.system_started": "✨ システムが起動しました",
+    "console.desktop_hint": "📌 デスクトップのアイコンをクリックしてアプリを開いてください",
+    "console.enjoy": "🎨 Pixel-OS をお楽しみください！",
+    "taskbar.brand": "Pixel-OS",
+}
@@ -0,0 +1,77 @@
+"""
+Traducciones: 한국어
+"""
+
+STRINGS = {
+    "app.terminal": "터미널",
+    "app.text_editor": "텍스트 편집기",
+    "app.file_manager": "파일 관리자",
+    "app.settings": "설정",
+    "app.calculator": "계산기",
+    "app.paint": "그림판",
+    "app.mini_browser": "미니 브라우저",
+    "app.code_editor": "코드 편집기",
+    "app.video_player": "비디오 플레이어",
+    "wizard.title": "Pixel-OS에 오신 것을 환영합니다",
+    "wizard.subtitle": "초기 설정",
+    "wizard.step": "{total}단계 중 {current}단계",
+    "wizard.select_language": "언어 선택",
+    "wizard.select_apps": "사전 설치 앱",
+    "wizard.create_account": "로컬 계정 만들기",
+    "wizard.username": "사용자 이름",
+    "wizard.password": "비밀번호",
+    "wizard.tab_hint": "TAB을 눌러 필드 전환",
+    "wizard.back": "뒤로",
+    "wizard.next": "다음",
+    "wizard.finish": "완료",
+    "terminal.welcome": "Pixel-OS 터미널 v1.0",
+    "terminal.help_hint": "'help' 입력으로 명령 보기",
+    "terminal.cmds.title": "사용 가능한 명령:",
+    "terminal.cmds.help": "  help  - 도움말 표시",
+    "terminal.cmds.clear": "  clear - 화면 지우기",
+    "terminal.cmds.echo": "  echo  - 텍스트 출력",
+    "terminal.cmds.date": "  date  - 날짜 표시",
+    "terminal.cmds.color": "  color - 색상 변경",
+    "terminal.unknown": "알 수 없는 명령: {cmd}",
+    "terminal.color.changed": "색상이 {color}(으)로 변경됨",
+    "terminal.color.usage": "사용법: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 문서",
+    "file_manager.folder.images": "📁 이미지",
+    "file_manager.folder.music": "📁 음악",
+    "file_manager.folder.videos": "📁 비디오",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notes.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← 뒤로",
+    "settings.section.personalization": "🎨 개인 설정",
+    "settings.section.sound": "🔊 사운드",
+    "settings.section.display": "🖥️ 디스플레이",
+    "settings.section.system": "⚙️ 시스템",
+    "settings.section.plugins": "🔌 플러그인",
+    "settings.options": "설정 옵션이 여기에 표시됩니다...",
+    "mini_browser.button.back": "← 뒤로",
+    "mini_browser.button.reload": "↻ 새로고침",
+    "mini_browser.loading": "로드 중...",
+    "mini_browser.placeholder": "검색 기능 준비 중...",
+    "code_editor.template.python": "# Python 템플릿",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "스페이스:재생/일시중지  ← →:이전/다음",
+    "code_editor.title": "코드 편집기",
+    "code_editor.placeholder": "코드 편집기 개발 중",
+    "video_player.title": "비디오 플레이어",
+    "video_player.placeholder": "비디오 플레이어 준비 중",
+    "console.logo_fail": "⚠️ 시스템 로고를 불러올 수 없습니다",
+    "console.started": "✨ Pixel-OS가 성공적으로 시작됨",
+    "console.closing": "👋 Pixel-OS 종료 중...",
+    "console.run_main": "❌ Pixel-OS를 시작하려면 main.py를 실행하세요",
+    "console.system_started": "✨ 시스템이 성공적으로 시작됨",
+    "console.desktop_hint": "📌 데스크톱 아이콘을 클릭하여 앱을 여세요",
+    "console.enjoy": "🎨 Pixel-OS를 즐겨보세요!",
+    "taskbar.brand": "Pixel-OS",
+}
@@ -0,0 +1,77 @@
+"""
+Traducciones: Português
+"""
+
+STRINGS = {
+    "app.terminal": "Terminal",
+    "app.text_editor": "Editor de Texto",
+    "app.file_manager": "Explorador de Arquivos",
+    "app.settings": "Configurações",
+    "app.calculator": "Calculadora",
+    "app.paint": "Paint",
+    "app.mini_browser": "Mini Navegador",
+    "app.code_editor": "Editor de Código",
+    "app.video_player": "Reprodutor de Vídeo",
+    "wizard.title": "Bem-vindo ao Pixel-OS",
+    "wizard.subtitle": "Configuração inicial",
+    "wizard.step": "Etapa {current} de {total}",
+    "wizard.select_language": "Selecione seu idioma",
+    "wizard.select_apps": "Apps pré-instalados",
+    "wizard.create_account": "Crie sua conta local",
+    "wizard.username": "Nome de usuário",
+    "wizard.password": "Senha",
+    "wizard.tab_hint": "Pressione TAB para alternar",
+    "wizard.back": "Voltar",
+    "wizard.next": "Avançar",
+    "wizard.finish": "Finalizar",
+    "terminal.welcome": "Pixel-OS Terminal v1.0",
+    "terminal.help_hint": "Digite 'help' para ver comandos",
+    "terminal.cmds.title": "Comandos disponíveis:",
+    "terminal.cmds.help": "  help  - Mostra esta ajuda",
+    "terminal.cmds.clear": "  clear - Limpa a tela",
+    "terminal.cmds.echo": "  echo  - Repete o texto",
+    "terminal.cmds.date": "  date  - Mostra a data",
+    "terminal.cmds.color": "  color - Muda a cor",
+    "terminal.unknown": "Comando desconhecido: {cmd}",
+    "terminal.color.changed": "Cor alterada para {color}",
+    "terminal.color.usage": "Use: color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 Documentos",
+    "file_manager.folder.images": "📁 Imagens",
+    "file_manager.folder.music": "📁 Música",
+    "file_manager.folder.videos": "📁 Vídeos",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notas.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← Voltar",
+    "settings.section.personalization": "🎨 Personalização",
+    "settings.section.sound": "🔊 Som",
+    "settings.section.display": "🖥️ Tela",
+    "settings.section.system": "⚙️ Sistema",
+    "settings.section.plugins": "🔌 Plugins",
+    "settings.options": "Opções de configuração aqui...",
+    "mini_browser.button.back": "← Voltar",
+    "mini_browser.button.reload": "↻ Recarregar",
+    "mini_browser.loading": "Carregando...",
+    "mini_browser.placeholder": "Buscador em breve...",
+    "code_editor.template.python": "# Template Python",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "ESPAÇO:Play/Pausa  ← →:Anterior/Próximo",
+    "code_editor.title": "Editor de Código",
+    "code_editor.placeholder": "Editor de código em construção",
+    "video_player.title": "Reprodutor de Vídeo",
+    "video_player.placeholder": "Reprodutor de vídeo em breve",
+    "console.logo_fail": "⚠️ Não foi possível carregar o logo do sistema",
+    "console.started": "✨ Pixel-OS iniciado corretamente",
+    "console.closing": "👋 Encerrando Pixel-OS...",
+    "console.run_main": "❌ Execute main.py para iniciar o Pixel-OS",
+    "console.system_started": "✨ Sistema iniciado corretamente",
+    "console.desktop_hint": "📌 Clique nos ícones do desktop para abrir aplicativos",
+    "console.enjoy": "🎨 Aproveite a experiência Pixel-OS!",
+    "taskbar.brand": "Pixel-OS",
+}
@@ -0,0 +1,77 @@
+"""
+Traducciones: 中文
+"""
+
+STRINGS = {
+    "app.terminal": "终端",
+    "app.text_editor": "文本编辑器",
+    "app.file_manager": "文件管理器",
+    "app.settings": "设置",
+    "app.calculator": "计算器",
+    "app.paint": "画图",
+    "app.mini_browser": "迷你浏览器",
+    "app.code_editor": "代码编辑器",
+    "app.video_player": "视频播放器",
+    "wizard.title": "欢迎使用 Pixel-OS",
+    "wizard.subtitle": "初始设置",
+    "wizard.step": "第 {current} 步 / 共 {total} 步",
+    "wizard.select_language": "选择语言",
+    "wizard.select_apps": "预装应用",
+    "wizard.create_account": "创建本地账户",
+    "wizard.username": "用户名",
+    "wizard.password": "密码",
+    "wizard.tab_hint": "按 TAB 切换输入框",
+    "wizard.back": "返回",
+    "wizard.next": "下一步",
+    "wizard.finish": "完成",
+    "terminal.welcome": "Pixel-OS 终端 v1.0",
+    "terminal.help_hint": "输入 'help' 查看命令",
+    "terminal.cmds.title": "可用命令：",
+    "terminal.cmds.help": "  help  - 显示帮助",
+    "terminal.cmds.clear": "  clear - 清空屏幕",
+    "terminal.cmds.echo": "  echo  - 输出文本",
+    "terminal.cmds.date": "  date  - 显示日期",
+    "terminal.cmds.color": "  color - 更改颜色",
+    "terminal.unknown": "未知命令：{cmd}",
+    "terminal.color.changed": "颜色已更改为 {color}",
+    "terminal.color.usage": "用法：color [pink|blue|green|yellow|purple|peach]",
+    "file_manager.path_root": "/",
+    "file_manager.folder.documents": "📁 文档",
+    "file_manager.folder.images": "📁 图片",
+    "file_manager.folder.music": "📁 音乐",
+    "file_manager.folder.videos": "📁 视频",
+    "file_manager.file.readme": "📄 readme.txt",
+    "file_manager.file.notes": "📄 notes.txt",
+    "file_manager.icon.folder": "📁",
+    "file_manager.icon.file": "📄",
+    "file_manager.button.back": "← 返回",
+    "settings.section.personalization": "🎨 个性化",
+    "settings.section.sound": "🔊 声音",
+    "settings.section.display": "🖥️ 显示",
+    "settings.section.system": "⚙️ 系统",
+    "settings.section.plugins": "🔌 插件",
+    "settings.options": "设置选项将在此显示...",
+    "mini_browser.button.back": "← 返回",
+    "mini_browser.button.reload": "↻ 刷新",
+    "mini_browser.loading": "正在加载...",
+    "mini_browser.placeholder": "搜索功能即将推出...",
+    "code_editor.template.python": "# Python 模板",
+    "video_player.sample.video1": "video_1.mp4",
+    "video_player.sample.video2": "video_2.mp4",
+    "video_player.sample.video3": "video_3.mp4",
+    "video_player.button.play": "▶",
+    "video_player.button.pause": "⏸",
+    "video_player.help": "空格:播放/暂停  ← →:上一个/下一个",
+    "code_editor.title": "代码编辑器",
+    "code_editor.placeholder": "代码编辑器开发中",
+    "video_player.title": "视频播放器",
+    "video_player.placeholder": "视频播放器即将推出",
+    "console.logo_fail": "⚠️ 无法加载系统徽标",
+    "console.started": "✨ Pixel-OS 启动成功",
+    "console.closing": "👋 正在关闭 Pixel-OS...",
+    "console.run_main": "❌ 运行 main.py 启动 Pixel-OS",
+    "console.system_started": "✨ 系统启动成功",
+    "console.desktop_hint": "📌 点击桌面图标打开应用",
+    "console.enjoy": "🎨 享受 Pixel-OS 的体验！",
+    "taskbar.brand": "Pixel-OS",
+}
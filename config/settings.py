@@ -16,12 +16,55 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 TITLE = "Pixel-OS"
+VERSION = "1.4"
+
+IDLE_MAX_WAIT = 1.0  # Segundos máximos durmiendo sin eventos ni animaciones
+
+# Bucle de simulación a paso fijo
+SIMULATION_HZ = 60  # Ticks de update por segundo
+MAX_CATCHUP_STEPS = 5  # Ticks máximos por frame; el retraso sobrante se descarta
+RENDER_FPS_CAP = FPS  # Frames dibujados por segundo como máximo
+
+# Presupuesto por app: las que lo superan se dibujan a ritmo reducido
+APP_RENDER_BUDGET_MS = 8.0  # Media máxima de Application.render
+APP_UPDATE_BUDGET_MS = 4.0  # Media máxima de Application.update
+APP_DEGRADED_INTERVAL = 0.25  # Segundos entre refrescos de una app degradada
+
+# Compositor (dirty rectangles)
+COMPOSITOR_MAX_RECTS = 8  # Por encima de este número se fusionan en uno solo
+
+# Hit-testing del puntero
+HIT_GRID_CELL = 64  # Lado en píxeles de cada celda del índice espacial
+
+# Profiler (F12 muestra/oculta, Shift+F12 guarda un perfil)
+PROFILER_HISTORY = 240  # Frames recordados por componente
+PROFILER_REFRESH = 0.25  # Segundos entre refrescos del panel
+PROFILES_DIR = os.path.join(USER_DATA_DIR, "profiles")
+
+# Perfil de arranque (python main.py --profile-startup o PIXELOS_PROFILE_STARTUP=1)
+STARTUP_HISTORY_FILE = os.path.join(PROFILES_DIR, "startup_history.json")
+STARTUP_HISTORY_SIZE = 100  # Arranques guardados en el historial
+STARTUP_REPORT_IMPORTS = 15  # Módulos más lentos que muestra el informe
+
+# Filesystem virtual: los cambios se guardan en segundo plano
+FS_SAVE_DELAY = 0.5  # Segundos sin cambios antes de escribir a disco
+FS_SAVE_MAX_DELAY = 5.0  # Segundos máximos con cambios sin guardar
+FS_JOURNAL_MAX_BYTES = 256 * 1024  # Tamaño del diario a partir del cual se compacta
+FS_BLOB_CACHE_BYTES = 8 * 1024 * 1024  # Contenido de archivos en memoria (caché LRU, en caracteres)
+FS_SNAPSHOT_GENERATIONS = 3  # Instantáneas anteriores que se conservan (filesystem.json.1, .2...)
+
+# Portapapeles compartido por las apps
+CLIPBOARD_HISTORY = 20  # Textos copiados que se recuerdan
+CLIPBOARD_BACKEND = "auto"  # "auto", "tk", "scrap" (pygame.scrap) o "none" (solo Pixel-OS)
 
 # Fuente principal
 FONT_PATH = os.path.join(FONTS_DIR, "Monocraft.ttc")
 FONT_SIZE_SMALL = 12
 FONT_SIZE_MEDIUM = 16
 FONT_SIZE_LARGE = 24
+FONT_CACHE_SIZE = 32  # Máximo de fuentes (ruta, tamaño, estilo) en memoria
+TEXT_CACHE_SIZE = 1024  # Máximo de textos rasterizados en memoria
+ASSET_CACHE_SIZE = 128  # Máximo de imágenes escaladas en memoria
 
 # Logo del sistema
 SYSTEM_LOGO = os.path.join(IMGS_DIR, "System.png")
@@ -65,6 +108,7 @@ EASING = "ease_out"     # Tipo de easing
 # Sistema de ventanas (inspirado en Windows 11)
 WINDOW_BORDER_RADIUS = 12
 WINDOW_SHADOW_SIZE = 8
+CHROME_COLORKEY = (255, 0, 255)  # Recorta las esquinas del marco opaco; no usar en el marco
 WINDOW_TITLEBAR_HEIGHT = 40
 WINDOW_MIN_WIDTH = 400
 WINDOW_MIN_HEIGHT = 300
@@ -78,3 +122,9 @@ TASKBAR_POSITION = "bottom"  # bottom, top, left, right
 DESKTOP_ICON_SIZE = 48
 DESKTOP_ICON_SPACING = 20
 DESKTOP_GRID_SNAP = True
+
+# Iconos de apps: se empaquetan en el atlas a estos tamaños (lado en píxeles)
+DESKTOP_APP_ICON_SIZE = DESKTOP_ICON_SIZE - 8
+TASKBAR_APP_ICON_SIZE = TASKBAR_ICON_SIZE - 10
+START_MENU_ICON_SIZE = 32
+ICON_ATLAS_SIZES = (DESKTOP_APP_ICON_SIZE, TASKBAR_APP_ICON_SIZE, START_MENU_ICON_SIZE)
@@ -0,0 +1,202 @@
+"""
+Assets - Carga de imágenes compartida por todo el sistema
+
+Cada imagen se lee de disco una sola vez y se convierte al formato de la
+pantalla (convert_alpha si tiene transparencia, convert si no), así los
+blits no tienen que convertir píxeles. Las versiones escaladas se guardan
+en un caché LRU por tamaño.
+
+Los iconos de las apps, además, se empaquetan al arrancar en un IconAtlas
+con los tamaños que usan el escritorio, la barra de tareas y el menú de
+inicio; abrir una ventana no lee nada de disco.
+"""
+import math
+import os
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from config.settings import *
+
+
+class AssetLoader:
+    """Caché de imágenes normalizadas al formato de la pantalla
+
+    Las superficies devueltas son compartidas: no hay que dibujar sobre ellas.
+    """
+
+    def __init__(self, max_variants: int = ASSET_CACHE_SIZE):
+        """Inicializa el cargador
+
+        Args:
+            max_variants: Número máximo de versiones escaladas en memoria
+        """
+        self.max_variants = max_variants
+        self._originals: Dict[str, Optional[pygame.Surface]] = {}  # None = no se pudo cargar
+        self._variants: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str, size: Optional[Tuple[int, int]] = None,
+             smooth: bool = True) -> Optional[pygame.Surface]:
+        """Obtiene una imagen, opcionalmente escalada
+
+        Args:
+            path: Ruta del archivo
+            size: Tamaño deseado (None = tamaño original)
+            smooth: smoothscale si es True; escalado sin suavizar (pixel art) si no
+
+        Returns:
+            Superficie en el formato de la pantalla, o None si no existe
+        """
+        original = self._load_original(path)
+        if original is None or size is None or tuple(size) == original.get_size():
+            return original
+
+        key = (path, tuple(size), smooth)
+        surface = self._variants.get(key)
+        if surface is not None:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if smooth:
+            surface = pygame.transform.smoothscale(original, size)
+        else:
+            surface = pygame.transform.scale(original, size)
+        self._variants[key] = surface
+        if len(self._variants) > self.max_variants:
+            self._variants.popitem(last=False)
+        return surface
+
+    def app_icon(self, app_id: Optional[str], size: int,
+                 smooth: bool = True) -> Optional[pygame.Surface]:
+        """Obtiene el icono de una app (assets/imgs/icon_<app_id>.png)
+
+        Args:
+            app_id: Identificador de la app
+            size: Lado del icono en píxeles
+            smooth: Ver load()
+        """
+        if not app_id:
+            return None
+        return self.load(os.path.join(IMGS_DIR, f"icon_{app_id}.png"), (size, size), smooth)
+
+    def _load_original(self, path: str) -> Optional[pygame.Surface]:
+        """Carga y convierte una imagen la primera vez que se pide"""
+        if path in self._originals:
+            return self._originals[path]
+
+        surface = None
+        if os.path.exists(path):
+            try:
+                surface = self._normalize(pygame.image.load(path))
+            except (pygame.error, OSError) as e:
+                print(f"⚠️ No se pudo cargar la imagen {path}: {e}")
+        self._originals[path] = surface
+        return surface
+
+    @staticmethod
+    def _normalize(surface: pygame.Surface) -> pygame.Surface:
+        """Convierte una superficie al formato de la pantalla"""
+        if not pygame.display.get_surface():
+            return surface  # Sin modo de vídeo todavía no hay formato al que convertir
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve estadísticas de uso del caché"""
+        return {
+            'images': sum(1 for s in self._originals.values() if s is not None),
+            'variants': len(self._variants),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def clear(self):
+        """Vacía el caché (por ejemplo al cambiar de tema)"""
+        self._originals.clear()
+        self._variants.clear()
+
+
+class IconAtlas:
+    """Iconos de todas las apps, una hoja por tamaño
+
+    Se construye al arrancar (y otra vez tras cargar los mods); cada icono
+    es una subsuperficie de la hoja de su tamaño, buscada por app_id.
+    """
+
+    def __init__(self, assets: AssetLoader, sizes: Tuple[int, ...] = ICON_ATLAS_SIZES):
+        """Inicializa un atlas vacío
+
+        Args:
+            assets: Cargador del que salen las imágenes originales
+            sizes: Lados en píxeles a empaquetar
+        """
+        self.assets = assets
+        self.sizes = tuple(sorted(set(sizes)))
+        self._sheets: Dict[int, pygame.Surface] = {}
+        self._icons: Dict[Tuple[str, int], pygame.Surface] = {}
+        self._paths: Dict[str, str] = {}  # Apps empaquetadas (con o sin imagen)
+
+    def build(self, icon_paths: Dict[str, str]):
+        """Empaqueta los iconos de las apps
+
+        Args:
+            icon_paths: app_id -> ruta del icono (relativa a BASE_DIR o absoluta)
+        """
+        paths = {app_id: path if os.path.isabs(path) else os.path.join(BASE_DIR, path)
+                 for app_id, path in icon_paths.items()}
+        sheets: Dict[int, pygame.Surface] = {}
+        icons: Dict[Tuple[str, int], pygame.Surface] = {}
+
+        for size in self.sizes:
+            # Pixel art: se escala sin suavizar
+            images = [(app_id, self.assets.load(path, (size, size), smooth=False))
+                      for app_id, path in paths.items()]
+            images = [(app_id, image) for app_id, image in images if image is not None]
+            if not images:
+                continue
+            columns = math.ceil(math.sqrt(len(images)))
+            rows = math.ceil(len(images) / columns)
+            sheet = pygame.Surface((columns * size, rows * size), pygame.SRCALPHA)
+            if pygame.display.get_surface():
+                sheet = sheet.convert_alpha()
+            sheet.fill((0, 0, 0, 0))
+            for index, (app_id, image) in enumerate(images):
+                rect = pygame.Rect((index % columns) * size, (index // columns) * size, size, size)
+                # Sumar sobre transparente copia los píxeles tal cual, alfa incluido
+                sheet.blit(image, rect, special_flags=pygame.BLEND_RGBA_ADD)
+                icons[(app_id, size)] = sheet.subsurface(rect)
+            sheets[size] = sheet
+
+        self._sheets = sheets
+        self._icons = icons
+        self._paths = paths
+
+    def get(self, app_id: Optional[str], size: int) -> Optional[pygame.Surface]:
+        """Devuelve el icono de una app
+
+        Args:
+            app_id: Identificador de la app
+            size: Lado en píxeles (uno de ICON_ATLAS_SIZES para no escalar)
+
+        Returns:
+            Subsuperficie compartida, o None si la app no tiene icono
+        """
+        if not app_id:
+            return None
+        icon = self._icons.get((app_id, size))
+        if icon is not None or (app_id in self._paths and size in self.sizes):
+            return icon
+        # App registrada después del último build o tamaño fuera del atlas
+        return self.assets.app_icon(app_id, size, smooth=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve el número de iconos y el tamaño de las hojas"""
+        return {
+            'icons': len(self._icons),
+            'sheets': len(self._sheets),
+            'pixels': sum(s.get_width() * s.get_height() for s in self._sheets.values()),
+        }
@@ -0,0 +1,107 @@
+"""
+Benchmark de renderizado sin pantalla para Pixel-OS
+
+Uso:
+    python -m core.benchmark --windows 2 --frames 300
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Optional
+
+# Permite ejecutar el módulo desde la raíz del proyecto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from config.settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+from core.engine import PixelOS
+from core.frame_stats import FrameStats
+
+
+def open_benchmark_windows(pixel_os: PixelOS, windows_per_app: int):
+    """Abre varias ventanas de cada app integrada
+
+    La primera ventana usa la instancia registrada; las demás usan
+    instancias nuevas creadas con la misma factory. Todas se abren con
+    launch_app, igual que desde el escritorio.
+    """
+    plugin_manager = pixel_os.plugin_manager
+    for descriptor in list(plugin_manager.descriptors.values()):
+        plugin_manager.launch_app(descriptor)
+        for _ in range(windows_per_app - 1):
+            plugin_manager.launch_app(descriptor.factory())
+
+
+def run_benchmark(windows_per_app: int = 1, frames: int = 300,
+                  full_redraw: bool = True) -> FrameStats:
+    """Ejecuta el benchmark y devuelve las estadísticas por componente
+
+    Args:
+        windows_per_app: Ventanas a abrir por cada app integrada
+        frames: Número de frames a simular
+        full_redraw: Fuerza redibujar toda la pantalla en cada frame
+                     (peor caso); si es False solo se mide el daño real
+
+    Returns:
+        Estadísticas con una muestra por frame y componente
+    """
+    pixel_os = PixelOS(headless=True)
+    open_benchmark_windows(pixel_os, windows_per_app)
+
+    stats = FrameStats()
+    pixel_os.frame_stats = stats
+    dt = 1.0 / FPS
+
+    for frame in range(frames):
+        # Barrido del ratón para ejercitar el hover de ventanas y barra
+        x = (frame * 17) % SCREEN_WIDTH
+        y = (frame * 11) % SCREEN_HEIGHT
+        pygame.event.post(pygame.event.Event(
+            pygame.MOUSEMOTION, pos=(x, y), rel=(17, 11), buttons=(0, 0, 0)
+        ))
+        if full_redraw:
+            pixel_os.compositor.invalidate()
+        pixel_os.run_frame(dt)
+
+    pixel_os.filesystem.close()  # Detiene la escritura en segundo plano
+    pygame.quit()
+    return stats
+
+
+def format_report(stats: FrameStats) -> str:
+    """Formatea las estadísticas como tabla de texto"""
+    summary = stats.summary()
+    width = max([32] + [len(name) + 2 for name in summary])
+    lines = [f"{'componente':<{width}}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for name, row in summary.items():
+        lines.append(
+            f"{name:<{width}}{row['count']:>6}{row['p50']:>10.3f}{row['p95']:>10.3f}"
+            f"{row['p99']:>10.3f}{row['max']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Benchmark de renderizado de Pixel-OS")
+    parser.add_argument("--windows", type=int, default=1,
+                        help="ventanas por cada app integrada")
+    parser.add_argument("--frames", type=int, default=300,
+                        help="frames a simular")
+    parser.add_argument("--damage-only", action="store_true",
+                        help="medir solo las regiones modificadas en lugar de la pantalla completa")
+    parser.add_argument("--json", metavar="RUTA",
+                        help="guardar el resumen en un archivo JSON")
+    args = parser.parse_args(argv)
+
+    stats = run_benchmark(args.windows, args.frames, full_redraw=not args.damage_only)
+    print(format_report(stats))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(stats.summary(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Blob Store - Contenido de los archivos del filesystem virtual
+
+El índice (filesystem.json y su diario) solo guarda nombres, tamaños,
+fechas y el identificador del blob de cada archivo; el texto vive aquí,
+un fichero por blob en blobs/<2 primeros caracteres>/<id>. Los blobs se
+leen al pedir el contenido y se guardan en un caché LRU limitado por
+tamaño, así que la memoria no crece con los bytes almacenados.
+
+El id de un blob es el sha256 de su contenido: archivos iguales (copias,
+plantillas, la papelera) comparten un único blob en disco y en el caché.
+Cada blob lleva la cuenta de los archivos que lo usan; cuando llega a
+cero queda como candidato para borrarse en la próxima compactación.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set
+from config.settings import FS_BLOB_CACHE_BYTES
+
+
+class BlobStore:
+    """Almacén de contenidos en disco con caché LRU"""
+
+    def __init__(self, path: str, cache_bytes: int = FS_BLOB_CACHE_BYTES):
+        """Inicializa el almacén
+
+        Args:
+            path: Carpeta de los blobs
+            cache_bytes: Caracteres máximos de contenido en el caché
+        """
+        self.path = path
+        self.cache_bytes = cache_bytes
+        self._lock = threading.Lock()
+        self._unsaved: Dict[str, str] = {}  # Creados pero aún no escritos (no se expulsan)
+        self._refs: Dict[str, int] = {}  # Archivos del árbol que usan cada blob
+        self._released: Set[str] = set()  # Blobs que se quedaron sin archivos
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def blob_path(self, blob_id: str) -> str:
+        """Ruta del fichero de un blob"""
+        return os.path.join(self.path, blob_id[:2], blob_id)
+
+    @staticmethod
+    def blob_id(content: str) -> str:
+        """Identificador de un contenido (sha256)"""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def put(self, content: str) -> str:
+        """Guarda un contenido; si ya existe no se duplica
+
+        Los blobs nuevos se escriben a disco en el próximo flush(). La
+        referencia la toma quien lo use, con acquire().
+
+        Returns:
+            Identificador del blob
+        """
+        blob_id = self.blob_id(content)
+        with self._lock:
+            if self._refs.get(blob_id, 0) == 0 and blob_id not in self._unsaved:
+                self._unsaved[blob_id] = content
+        return blob_id
+
+    def acquire(self, blob_id: str):
+        """Anota un archivo más que usa el blob"""
+        with self._lock:
+            self._refs[blob_id] = self._refs.get(blob_id, 0) + 1
+
+    def release(self, blob_id: str):
+        """Anota un archivo menos que usa el blob"""
+        with self._lock:
+            count = self._refs.get(blob_id, 0) - 1
+            if count > 0:
+                self._refs[blob_id] = count
+            else:
+                self._refs.pop(blob_id, None)
+                self._released.add(blob_id)
+
+    def reset_refs(self, blob_ids: Iterable[str]):
+        """Recalcula las referencias a partir de los blobs de todos los archivos"""
+        refs: Dict[str, int] = {}
+        for blob_id in blob_ids:
+            refs[blob_id] = refs.get(blob_id, 0) + 1
+        with self._lock:
+            self._refs = refs
+
+    def ref_count(self, blob_id: str) -> int:
+        """Número de archivos que usan un blob"""
+        with self._lock:
+            return self._refs.get(blob_id, 0)
+
+    def get(self, blob_id: str) -> str:
+        """Devuelve el contenido de un blob (cadena vacía si no existe)"""
+        with self._lock:
+            content = self._unsaved.get(blob_id)
+            if content is None:
+                content = self._cache.get(blob_id)
+                if content is not None:
+                    self._cache.move_to_end(blob_id)
+            if content is not None:
+                self.hits += 1
+                return content
+            self.misses += 1
+
+        try:
+            with open(self.blob_path(blob_id), 'r', encoding='utf-8', newline='') as f:
+                content = f.read()
+        except OSError as e:
+            print(f"Error leyendo contenido del filesystem ({blob_id}): {e}")
+            return ""
+
+        with self._lock:
+            self._remember(blob_id, content)
+        return content
+
+    def flush(self):
+        """Escribe a disco los blobs pendientes"""
+        with self._lock:
+            unsaved = dict(self._unsaved)
+
+        for blob_id, content in unsaved.items():
+            path = self.blob_path(blob_id)
+            if os.path.exists(path):
+                continue  # Mismo contenido que un blob que ya estaba en disco
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            for blob_id, content in unsaved.items():
+                del self._unsaved[blob_id]
+                self._remember(blob_id, content)
+
+    def collect(self, keep: Iterable[str]) -> int:
+        """Borra de disco los blobs sin referencias
+
+        Solo mira los que se quedaron sin archivos desde la última vez; los
+        que siguen en keep se vuelven a mirar en la próxima.
+
+        Args:
+            keep: Blobs que usan las instantáneas guardadas
+
+        Returns:
+            Número de blobs borrados
+        """
+        keep_ids = self._keep_ids(keep)
+        with self._lock:
+            # Los que volvieron a usarse ya no son candidatos
+            self._released = {blob_id for blob_id in self._released if blob_id not in self._refs}
+            candidates = [blob_id for blob_id in self._released if blob_id not in keep_ids]
+
+        removed = 0
+        for blob_id in candidates:
+            if self._remove(blob_id):
+                removed += 1
+        return removed
+
+    def sweep(self, keep: Iterable[str]) -> int:
+        """Recorre el disco y borra todo blob sin referencias
+
+        Recoge los que quedaron huérfanos en sesiones anteriores (por
+        ejemplo, si se cerró antes de compactar).
+
+        Args:
+            keep: Blobs que usan las instantáneas guardadas
+
+        Returns:
+            Número de blobs borrados
+        """
+        keep_ids = self._keep_ids(keep)
+        removed = 0
+        if not os.path.isdir(self.path):
+            return 0
+        for shard in os.listdir(self.path):
+            shard_path = os.path.join(self.path, shard)
+            if not os.path.isdir(shard_path):
+                continue
+            for name in os.listdir(shard_path):
+                if name not in keep_ids and self._remove(name):
+                    removed += 1
+        return removed
+
+    def _keep_ids(self, keep: Iterable[str]) -> Set[str]:
+        """Blobs que no se pueden borrar: keep, los referenciados y los pendientes"""
+        keep_ids: Set[str] = set(keep)
+        with self._lock:
+            keep_ids.update(self._refs)
+            keep_ids.update(self._unsaved)
+        return keep_ids
+
+    def _remove(self, blob_id: str) -> bool:
+        """Borra un blob del disco y del caché (si nadie lo ha vuelto a usar)"""
+        with self._lock:
+            if blob_id in self._refs or blob_id in self._unsaved:
+                return False
+            self._released.discard(blob_id)
+            self._forget(blob_id)
+        try:
+            os.remove(self.blob_path(blob_id))
+            return True
+        except OSError:
+            return False
+
+    def _remember(self, blob_id: str, content: str):
+        """Añade un contenido al caché, expulsando los menos usados (con el lock)"""
+        if blob_id in self._cache:
+            return
+        self._cache[blob_id] = content
+        self._cache_size += len(content)
+        while self._cache_size > self.cache_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_size -= len(evicted)
+
+    def _forget(self, blob_id: str):
+        """Quita un blob del caché (con el lock)"""
+        content: Optional[str] = self._cache.pop(blob_id, None)
+        if content is not None:
+            self._cache_size -= len(content)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve estadísticas de uso del caché"""
+        with self._lock:
+            return {
+                'cached': len(self._cache),
+                'cached_chars': self._cache_size,
+                'unsaved': len(self._unsaved),
+                'referenced': len(self._refs),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
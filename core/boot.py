@@ -0,0 +1,153 @@
+"""
+Boot Pipeline - Arranque por etapas con progreso real
+
+Cada etapa informa de su avance y se mide su duración. Las etapas que
+solo hacen E/S o importan módulos corren en un hilo de trabajo mientras
+el bucle principal sigue dibujando la pantalla de carga; las que crean
+superficies de pygame se ejecutan en el hilo principal entre frames.
+
+Si falla una etapa obligatoria el arranque se aborta con su excepción;
+las opcionales (como los mods) solo dejan el error anotado.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class BootStage:
+    """Una etapa del arranque"""
+
+    def __init__(self, name: str, label: str, func: Callable[[Callable[[float], None]], None],
+                 weight: float = 1.0, threaded: bool = False, required: bool = True):
+        """Inicializa la etapa
+
+        Args:
+            name: Identificador corto (para los tiempos de arranque)
+            label: Texto que muestra la pantalla de carga
+            func: Trabajo de la etapa; recibe report(fracción 0.0-1.0)
+            weight: Peso relativo en la barra de progreso
+            threaded: Si se ejecuta en un hilo de trabajo
+            required: Si un error en la etapa aborta el arranque
+        """
+        self.name = name
+        self.label = label
+        self.func = func
+        self.weight = weight
+        self.threaded = threaded
+        self.required = required
+        self.fraction = 0.0
+        self.elapsed = 0.0  # Segundos que tardó func
+        self.error: Optional[Exception] = None
+
+    def report(self, fraction: float):
+        """Actualiza el avance de la etapa"""
+        self.fraction = max(0.0, min(1.0, fraction))
+
+
+class BootPipeline:
+    """Ejecuta las etapas de arranque en orden"""
+
+    def __init__(self, stages: List[BootStage]):
+        """Inicializa el pipeline
+
+        Args:
+            stages: Etapas en el orden en que deben ejecutarse
+        """
+        self.stages = stages
+        self.timings: Dict[str, float] = {}  # Segundos por etapa
+        self._index = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def done(self) -> bool:
+        """Indica si todas las etapas terminaron"""
+        return self._index >= len(self.stages)
+
+    @property
+    def current_stage(self) -> Optional[BootStage]:
+        """Etapa en curso, o None si el arranque terminó"""
+        return None if self.done else self.stages[self._index]
+
+    @property
+    def progress(self) -> float:
+        """Avance total entre 0.0 y 1.0, ponderado por etapa"""
+        total = sum(stage.weight for stage in self.stages)
+        if total <= 0:
+            return 1.0
+        completed = sum(stage.weight for stage in self.stages[:self._index])
+        stage = self.current_stage
+        if stage is not None:
+            completed += stage.weight * stage.fraction
+        return completed / total
+
+    def step(self, budget: float = 0.0) -> bool:
+        """Avanza el arranque sin bloquear; se llama una vez por frame
+
+        Las etapas del hilo principal se ejecutan enteras; las de hilo de
+        trabajo se lanzan y se consultan en las siguientes llamadas. Se
+        encadenan etapas mientras quede presupuesto, así la pantalla de
+        carga se redibuja sin retrasar el arranque un frame por etapa.
+
+        Args:
+            budget: Segundos que puede ocupar esta llamada (0 = una etapa)
+
+        Returns:
+            True si el arranque terminó
+
+        Raises:
+            Exception: El error de una etapa obligatoria que falló
+        """
+        start = time.perf_counter()
+        while not self.done:
+            stage = self.stages[self._index]
+            if stage.threaded:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run_stage, args=(stage,),
+                                                    name=f"boot-{stage.name}", daemon=True)
+                    self._thread.start()
+                if self._thread.is_alive():
+                    return False
+                self._thread = None
+            else:
+                self._run_stage(stage)
+            self._finish_stage(stage)
+            if time.perf_counter() - start >= budget:
+                break
+        return self.done
+
+    def run_all(self):
+        """Ejecuta todas las etapas en el hilo actual (sin pantalla de carga)
+
+        Raises:
+            Exception: El error de una etapa obligatoria que falló
+        """
+        while not self.done:
+            stage = self.stages[self._index]
+            self._run_stage(stage)
+            self._finish_stage(stage)
+
+    def _run_stage(self, stage: BootStage):
+        """Ejecuta una etapa guardando su error (puede correr en el hilo de trabajo)"""
+        start = time.perf_counter()
+        try:
+            stage.func(stage.report)
+        except Exception as e:
+            stage.error = e
+        stage.elapsed = time.perf_counter() - start
+
+    def _finish_stage(self, stage: BootStage):
+        """Cierra una etapa; si era obligatoria y falló, aborta el arranque"""
+        if stage.error is not None:
+            if stage.required:
+                print(f"❌ Error en la etapa de arranque '{stage.name}', abortando: {stage.error}")
+                raise stage.error
+            print(f"❌ Error en la etapa de arranque '{stage.name}': {stage.error}")
+        stage.fraction = 1.0
+        self.timings[stage.name] = stage.elapsed
+        self._index += 1
+
+    def format_timings(self) -> str:
+        """Resume los tiempos de arranque en una línea"""
+        parts = [f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.timings.items()]
+        total = sum(self.timings.values()) * 1000
+        return f"{', '.join(parts)} (total {total:.0f} ms)"
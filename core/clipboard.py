@@ -0,0 +1,273 @@
+"""
+Clipboard - Portapapeles compartido por todas las apps
+
+Pixel-OS guarda su propio historial de textos copiados, así que copiar y
+pegar nunca espera al sistema operativo. La sincronización con el
+portapapeles del sistema usa pygame.scrap, que es rápido pero solo puede
+llamarse desde el hilo principal (el de SDL): se consulta en refresh(),
+al pegar y cuando la ventana recupera el foco. Si scrap no está
+disponible se usa Tk en un hilo de trabajo propio, que crea y usa su raíz
+Tk siempre desde ese mismo hilo.
+"""
+import queue
+import threading
+from collections import deque
+from typing import List, Optional
+from config.settings import CLIPBOARD_BACKEND, CLIPBOARD_HISTORY
+
+
+class _TkBackend:
+    """Portapapeles del sistema a través de una raíz Tk oculta y persistente
+
+    Tk exige usarse desde el hilo que creó la raíz: solo lo toca el hilo de trabajo.
+    """
+
+    def __init__(self):
+        import tkinter as tk
+        self.root = tk.Tk()
+        self.root.withdraw()  # Ocultar ventana
+
+    def get_text(self) -> Optional[str]:
+        try:
+            return self.root.clipboard_get()
+        except Exception:
+            return None
+
+    def set_text(self, text: str):
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+        self.root.update()  # Necesario para actualizar clipboard
+
+    def close(self):
+        self.root.destroy()
+
+
+class _ScrapBackend:
+    """Portapapeles del sistema a través de pygame.scrap (SDL)
+
+    SDL solo admite estas llamadas desde el hilo principal.
+    """
+
+    def __init__(self):
+        import pygame
+        if not pygame.display.get_init():
+            raise RuntimeError("pygame.scrap necesita la pantalla iniciada")
+        self.pygame = pygame
+        self.scrap = pygame.scrap
+        # get_text/put_text solo existen en versiones recientes de pygame
+        self.has_text_api = hasattr(self.scrap, "get_text")
+        if not self.has_text_api:
+            self.scrap.init()
+
+    def get_text(self) -> Optional[str]:
+        if self.has_text_api:
+            return self.scrap.get_text() or None
+        data = self.scrap.get(self.pygame.SCRAP_TEXT)
+        if not data:
+            return None
+        return data.decode("utf-8", errors="replace").rstrip("\x00")
+
+    def set_text(self, text: str):
+        if self.has_text_api:
+            self.scrap.put_text(text)
+        else:
+            self.scrap.put(self.pygame.SCRAP_TEXT, text.encode("utf-8"))
+
+    def close(self):
+        pass
+
+
+class ClipboardService:
+    """Historial de textos copiados con sincronización diferida al sistema"""
+
+    def __init__(self, history_size: int = CLIPBOARD_HISTORY, backend: str = CLIPBOARD_BACKEND):
+        """Inicializa el servicio
+
+        Args:
+            history_size: Textos que se recuerdan (el más reciente primero)
+            backend: "auto", "tk", "scrap" o "none"
+        """
+        self._history = deque(maxlen=history_size)
+        self._generation = 0  # Aumenta con cada copia hecha en Pixel-OS
+        self._lock = threading.Lock()
+        self.backend_name = backend
+        self._scrap: Optional[_ScrapBackend] = None  # Solo se usa desde el hilo principal
+        self._backend = None  # Tk, solo se usa desde el hilo de trabajo
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def syncs_with_system(self) -> bool:
+        """Indica si se sincroniza con el portapapeles del sistema"""
+        return self.backend_name != "none"
+
+    @property
+    def history(self) -> List[str]:
+        """Textos copiados, del más reciente al más antiguo"""
+        with self._lock:
+            return list(self._history)
+
+    def copy(self, text: str) -> bool:
+        """Copia un texto; no espera al sistema operativo
+
+        Returns:
+            True si el texto quedó en el portapapeles de Pixel-OS
+        """
+        if not isinstance(text, str) or not text:
+            return False
+        with self._lock:
+            self._generation += 1
+        self._push(text)
+
+        scrap = self._scrap_backend()
+        if scrap is not None:
+            try:
+                scrap.set_text(text)
+            except Exception as e:
+                self._disable(e)
+        else:
+            self._request("write", text)
+        return True
+
+    def paste(self) -> str:
+        """Devuelve el último texto copiado sin bloquear
+
+        Antes relee el portapapeles del sistema. Con pygame.scrap (desde el
+        hilo principal) la lectura es inmediata; con Tk se hace en el hilo
+        de trabajo y, hasta que termina, se devuelve el texto anterior: lo
+        copiado en otro programa puede no aparecer en el primer Ctrl+V.
+        """
+        self.refresh()
+        with self._lock:
+            return self._history[0] if self._history else ""
+
+    def refresh(self):
+        """Relee el portapapeles del sistema
+
+        Con pygame.scrap se lee ya (es rápido y no bloquea); con Tk se pide
+        al hilo de trabajo y el historial se actualiza cuando responde.
+        """
+        scrap = self._scrap_backend()
+        if scrap is None:
+            self._request("read", self._generation)
+            return
+        generation = self._generation
+        try:
+            current = scrap.get_text()
+        except Exception as e:
+            self._disable(e)
+            return
+        if current:
+            self._push(current, generation)
+
+    def clear(self):
+        """Vacía el historial de Pixel-OS"""
+        with self._lock:
+            self._history.clear()
+
+    def shutdown(self, timeout: float = 1.0):
+        """Termina las escrituras pendientes y libera el backend"""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(("stop", None))
+            self._worker.join(timeout)
+        self._worker = None
+
+    def _push(self, text: str, generation: Optional[int] = None):
+        """Añade un texto al historial (sin repetir el más reciente)
+
+        Args:
+            text: Texto copiado
+            generation: Para lecturas del sistema, la generación al pedirla;
+                        una copia local posterior tiene prioridad
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if self._history and self._history[0] == text:
+                return
+            if text in self._history:
+                self._history.remove(text)
+            self._history.appendleft(text)
+
+    def _scrap_backend(self) -> Optional[_ScrapBackend]:
+        """pygame.scrap, si se usa y se está en el hilo principal
+
+        En modo "auto" se prueba la primera vez; si no funciona se pasa a Tk.
+        """
+        if self.backend_name not in ("auto", "scrap"):
+            return None
+        if threading.current_thread() is not threading.main_thread():
+            return None  # SDL no admite el portapapeles desde otros hilos
+        if self._scrap is None:
+            try:
+                self._scrap = _ScrapBackend()
+            except Exception:
+                if self.backend_name == "auto":
+                    self.backend_name = "tk"
+                else:
+                    self._disable()
+                return None
+            self.backend_name = "scrap"
+        return self._scrap
+
+    def _disable(self, error: Optional[Exception] = None):
+        """Deja de sincronizar con el sistema (un backend que falla no se reintenta)"""
+        if error is not None:
+            print(f"⚠️ Error sincronizando el portapapeles ({error}); se usa solo el de Pixel-OS")
+        else:
+            print("⚠️ Portapapeles del sistema no disponible; se usa solo el de Pixel-OS")
+        self.backend_name = "none"
+        self._scrap = None
+
+    def _request(self, op: str, arg=None):
+        """Encola una operación para el hilo de Tk, creándolo si hace falta"""
+        if self.backend_name != "tk":
+            return
+        if op == "read" and self._queue.qsize() > 0:
+            return  # Ya hay una lectura o escritura en camino
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="clipboard", daemon=True)
+            self._worker.start()
+        self._queue.put((op, arg))
+
+    def _run(self):
+        """Bucle del hilo de trabajo: la raíz Tk se crea y se usa solo desde aquí"""
+        try:
+            self._backend = _TkBackend()
+        except Exception:
+            self._disable()
+
+        while True:
+            op, arg = self._queue.get()
+            if op == "stop":
+                break
+            if self._backend is None:
+                continue
+            try:
+                if op == "write":
+                    self._backend.set_text(arg)
+                elif op == "read":
+                    current = self._backend.get_text()
+                    if current:
+                        self._push(current, generation=arg)
+            except Exception as e:
+                self._disable(e)
+                break
+
+        if self._backend is not None:
+            try:
+                self._backend.close()
+            except Exception:
+                pass
+            self._backend = None
+
+
+_service: Optional[ClipboardService] = None
+
+
+def get_clipboard_service() -> ClipboardService:
+    """Devuelve el portapapeles compartido, creándolo la primera vez"""
+    global _service
+    if _service is None:
+        _service = ClipboardService()
+    return _service
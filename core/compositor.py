@@ -0,0 +1,96 @@
+"""
+Compositor - Seguimiento de regiones dañadas (dirty rectangles)
+Solo se redibujan y se envían a pantalla las zonas que cambiaron
+"""
+import pygame
+from typing import List, Optional
+from config.settings import *
+
+
+class Compositor:
+    """Acumula las regiones modificadas de cada frame y las presenta"""
+
+    def __init__(self, screen: pygame.Surface):
+        """Inicializa el compositor
+
+        Args:
+            screen: Superficie principal
+        """
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.dirty_rects: List[pygame.Rect] = []
+        self.full_redraw = True  # El primer frame siempre es completo
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None):
+        """Marca una región como modificada
+
+        Args:
+            rect: Región a redibujar; None fuerza un redibujado completo
+        """
+        if rect is None:
+            self.full_redraw = True
+            return
+
+        clipped = self.screen_rect.clip(rect)
+        if clipped.width > 0 and clipped.height > 0:
+            self.dirty_rects.append(clipped)
+
+    def invalidate_all(self, rects: List[pygame.Rect]):
+        """Marca varias regiones como modificadas"""
+        for rect in rects:
+            self.invalidate(rect)
+
+    def has_damage(self) -> bool:
+        """Indica si hay algo pendiente de redibujar"""
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def take_damage(self) -> List[pygame.Rect]:
+        """Devuelve las regiones a redibujar en este frame y limpia el estado
+
+        Las regiones solapadas se fusionan; si quedan demasiadas se
+        colapsan en un único rectángulo envolvente.
+
+        Returns:
+            Lista de rectángulos en coordenadas de pantalla
+        """
+        if self.full_redraw:
+            rects = [self.screen_rect.copy()]
+        else:
+            rects = self._merge(self.dirty_rects)
+            if len(rects) > COMPOSITOR_MAX_RECTS:
+                rects = [rects[0].unionall(rects[1:])]
+
+        self.dirty_rects = []
+        self.full_redraw = False
+        return rects
+
+    def present(self, rects: List[pygame.Rect]):
+        """Envía a pantalla las regiones redibujadas
+
+        Args:
+            rects: Regiones devueltas por take_damage
+        """
+        if not rects:
+            return
+        if len(rects) == 1 and rects[0] == self.screen_rect:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    @staticmethod
+    def _merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Fusiona rectángulos que se solapan hasta que ninguno se toque"""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            current = rect.copy()
+            changed = True
+            while changed:
+                changed = False
+                for other in merged:
+                    if current.colliderect(other):
+                        current.union_ip(other)
+                        merged.remove(other)
+                        changed = True
+                        break
+            merged.append(current)
+        return merged
@@ -2,41 +2,57 @@
 Motor principal de Pixel-OS
 Gestiona el ciclo de vida del sistema operativo simulado
 """
-import pygame
+import os
 import sys
-from typing import List, Optional
+import time
+import pygame
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from config.settings import *
+from config.i18n import tr
 from core.window_manager import WindowManager
 from core.theme_manager import ThemeManager
-from core.plugin_manager import PluginManager
+from core.plugin_manager import AppDescriptor, Application, PluginManager
 from core.filesystem import VirtualFilesystem
+from core.compositor import Compositor
+from core.frame_stats import FrameStats
+from core.scheduler import FrameScheduler
+from core.profiler import ProfilerOverlay
+from core.boot import BootPipeline, BootStage
+from core.clipboard import get_clipboard_service
 from ui.desktop import Desktop
 from ui.taskbar import TaskBar
-from apps.builtin_apps import (
-    TerminalApp,
-    TextEditorApp,
-    FileManagerApp,
-    SettingsApp,
-    MiniBrowserApp,
-    CodeEditorApp,
-    VideoPlayerApp,
-)
+
+
+def _builtin_app(class_name: str) -> Callable[[], Application]:
+    """Fábrica que importa apps.builtin_apps solo al abrir la app por primera vez"""
+    def factory():
+        from apps import builtin_apps
+        return getattr(builtin_apps, class_name)()
+    return factory
 
 
 class LoadingScreen:
-    """Pantalla de carga estilo retro"""
+    """Pantalla de carga estilo retro
+    
+    La barra refleja el avance real del BootPipeline y la pantalla termina
+    en cuanto el arranque acaba.
+    """
     
-    def __init__(self, screen: pygame.Surface, theme_manager):
+    def __init__(self, screen: pygame.Surface, theme_manager, pipeline: BootPipeline):
         self.screen = screen
         self.theme_manager = theme_manager
-        self.progress = 0.0  # 0.0 a 1.0
+        self.pipeline = pipeline
+        self.progress = 0.0  # 0.0 a 1.0, lo que muestra la barra
         self.elapsed_time = 0.0
     
     def update(self, dt: float):
-        """Actualiza la pantalla de carga"""
+        """Avanza el arranque y la barra de progreso"""
         self.elapsed_time += dt
-        # Transición suave
-        self.progress = min(1.0, self.elapsed_time / 2.0)  # 2 segundos para llenar
+        # Medio frame para el arranque, el resto para dibujar la pantalla
+        self.pipeline.step(budget=0.5 / RENDER_FPS_CAP)
+        # Transición suave hacia el avance real
+        target = self.pipeline.progress
+        self.progress = min(target, self.progress + (target - self.progress) * min(1.0, dt * 12) + 0.002)
     
     def render(self):
         """Renderiza la pantalla de carga"""
@@ -47,7 +63,7 @@ class LoadingScreen:
         # Logo/Texto central
         try:
             font_title = self.theme_manager.get_font(FONT_SIZE_LARGE)
-            logo_text = font_title.render("Pixel-OS", True, Colors.BLUE)
+            logo_text = self.theme_manager.render_text(font_title, "Pixel-OS", Colors.BLUE)
             logo_rect = logo_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
             self.screen.blit(logo_text, logo_rect)
         except:
@@ -72,16 +88,18 @@ class LoadingScreen:
         # Porcentaje
         try:
             font_small = self.theme_manager.get_font(FONT_SIZE_SMALL)
-            percent_text = font_small.render(f"{int(self.progress * 100)}%", True, Colors.TEXT_PRIMARY)
+            percent_text = self.theme_manager.render_text(font_small, f"{int(self.progress * 100)}%", Colors.TEXT_PRIMARY)
             percent_rect = percent_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y + 40))
             self.screen.blit(percent_text, percent_rect)
         except:
             pass
         
-        # Mensaje de carga
+        # Mensaje de carga: etapa en curso
+        stage = self.pipeline.current_stage
+        message = f"{stage.label}..." if stage else "Inicializando sistema..."
         try:
             font_small = self.theme_manager.get_font(FONT_SIZE_SMALL)
-            msg_text = font_small.render("Inicializando sistema...", True, Colors.TEXT_SECONDARY)
+            msg_text = self.theme_manager.render_text(font_small, message, Colors.TEXT_SECONDARY)
             msg_rect = msg_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
             self.screen.blit(msg_text, msg_rect)
         except:
@@ -89,20 +107,175 @@ class LoadingScreen:
         
         pygame.display.flip()
     
+    def next_deadline(self) -> Optional[float]:
+        """La barra de progreso se anima en cada frame"""
+        return 0.0
+    
     def is_complete(self) -> bool:
-        """Indica si la pantalla de carga finalizó"""
-        return self.progress >= 1.0
+        """Indica si el arranque terminó"""
+        return self.pipeline.done
+
+
+class Subscription:
+    """Suscripción de un manejador a ciertos eventos del EventBus"""
+    
+    def __init__(self, handler: Callable, event_types: Optional[Iterable[int]],
+                 region: Union[pygame.Rect, Callable, None], phase: str, layer: int,
+                 name: Optional[str]):
+        self.handler = handler
+        self.event_types = set(event_types) if event_types is not None else None
+        self.region = region
+        self.phase = phase
+        self.layer = layer
+        self.name = name
+    
+    def accepts(self, event: pygame.event.Event) -> bool:
+        """Indica si el evento cae dentro de la región suscrita"""
+        pos = getattr(event, "pos", None)
+        if self.region is None or pos is None:
+            return True
+        if callable(self.region):
+            return self.region(pos)
+        return self.region.collidepoint(pos)
+
+
+class EventBus:
+    """Enruta eventos de pygame solo a quien se suscribió a ellos
+    
+    Cada suscripción indica tipos de evento, una región opcional (Rect o
+    función pos -> bool) y una capa. Un evento recorre primero la fase de
+    captura, de la capa más baja a la más alta, y después la de burbuja,
+    de la más alta (lo que está encima en pantalla) a la más baja. Si un
+    manejador devuelve True el evento deja de propagarse.
+    """
+    
+    CAPTURE = "capture"
+    BUBBLE = "bubble"
+    
+    # Capas de la pantalla, de abajo arriba
+    LAYER_DESKTOP = 0
+    LAYER_APPS = 10
+    LAYER_WINDOWS = 20
+    LAYER_TASKBAR = 30
+    LAYER_SYSTEM = 100
+    
+    def __init__(self, timer: Optional[Callable] = None):
+        """Inicializa el bus
+        
+        Args:
+            timer: Función (nombre, func, *args) para medir los manejadores
+        """
+        self.timer = timer
+        self._subscriptions: List[Subscription] = []
+        self._routes: Dict[int, Tuple[List[Subscription], List[Subscription]]] = {}
+    
+    def subscribe(self, event_types: Optional[Iterable[int]], handler: Callable,
+                  region: Union[pygame.Rect, Callable, None] = None, phase: str = BUBBLE,
+                  layer: int = LAYER_APPS, name: Optional[str] = None) -> Subscription:
+        """Suscribe un manejador
+        
+        Args:
+            event_types: Tipos de evento (None = todos)
+            handler: Función que recibe el evento; True detiene la propagación
+            region: Zona de pantalla para eventos con posición (None = toda)
+            phase: CAPTURE o BUBBLE
+            layer: Capa; en burbuja las capas altas reciben antes el evento
+            name: Nombre para el profiler (None = sin medir)
+            
+        Returns:
+            La suscripción, para poder cancelarla
+        """
+        subscription = Subscription(handler, event_types, region, phase, layer, name)
+        self._subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription):
+        """Cancela una suscripción"""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._routes.clear()
+    
+    def _route(self, event_type: int) -> Tuple[List[Subscription], List[Subscription]]:
+        """Devuelve (captura, burbuja) ya ordenadas para un tipo de evento"""
+        route = self._routes.get(event_type)
+        if route is None:
+            matching = [s for s in self._subscriptions
+                        if s.event_types is None or event_type in s.event_types]
+            # sorted es estable: a igual capa, en orden de suscripción
+            capture = sorted((s for s in matching if s.phase == self.CAPTURE),
+                             key=lambda s: s.layer)
+            bubble = sorted((s for s in matching if s.phase == self.BUBBLE),
+                            key=lambda s: -s.layer)
+            route = self._routes[event_type] = (capture, bubble)
+        return route
+    
+    def dispatch(self, event: pygame.event.Event) -> bool:
+        """Entrega un evento a sus suscriptores
+        
+        Returns:
+            True si algún manejador detuvo la propagación
+        """
+        capture, bubble = self._route(event.type)
+        for subscription in capture + bubble:
+            if not subscription.accepts(event):
+                continue
+            if subscription.name and self.timer:
+                handled = self.timer(f"events.{subscription.name}", subscription.handler, event)
+            else:
+                handled = subscription.handler(event)
+            if handled:
+                return True
+        return False
+    
+    @staticmethod
+    def coalesce(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Fusiona movimientos de ratón consecutivos en uno solo
+        
+        Se conserva la última posición y botones y se suman los
+        desplazamientos; el orden respecto a clicks y teclas no cambia.
+        """
+        result: List[pygame.event.Event] = []
+        for event in events:
+            if (event.type == pygame.MOUSEMOTION and result
+                    and result[-1].type == pygame.MOUSEMOTION):
+                previous = result[-1]
+                rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+                result[-1] = pygame.event.Event(pygame.MOUSEMOTION, pos=event.pos, rel=rel,
+                                                buttons=event.buttons)
+            else:
+                result.append(event)
+        return result
 
 
 class PixelOS:
     """Clase principal del sistema operativo"""
     
-    def __init__(self):
-        """Inicializa el sistema operativo"""
+    def __init__(self, headless: bool = False, startup_profile=None):
+        """Inicializa el sistema operativo
+        
+        Args:
+            headless: Renderiza sin pantalla real (driver dummy de SDL),
+                      útil para CI y benchmarks
+            startup_profile: StartupProfile opcional que mide el arranque
+        """
+        self.headless = headless
+        self.startup_profile = startup_profile
+        self._startup_mark("imports")
+        if headless:
+            # El driver se elige al iniciar el subsistema de vídeo
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+            if pygame.display.get_init():
+                pygame.display.quit()
         pygame.init()
         
-        # Configurar pantalla - Fullscreen sin bordes
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.NOFRAME)
+        if headless:
+            # Superficie en memoria del tamaño de la pantalla
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            # Configurar pantalla - Fullscreen sin bordes
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.NOFRAME)
         pygame.display.set_caption(TITLE)
         
         # Cargar logo
@@ -111,76 +284,255 @@ class PixelOS:
             pygame.display.set_icon(logo)
         except:
             print("⚠️ No se pudo cargar el logo del sistema")
+        self._startup_mark("pygame.display")
         
-        # Reloj para controlar FPS
-        self.clock = pygame.time.Clock()
+        # Planificador de frames: duerme cuando no hay nada que animar
+        self.scheduler = FrameScheduler()
+        self.clock = self.scheduler.clock
         self.running = True
         
-        # Pantalla de carga
+        # Pantalla de carga (necesita las fuentes antes que nada)
         self.theme_manager = ThemeManager()
-        self.loading_screen = LoadingScreen(self.screen, self.theme_manager)
-        self.show_loading = True
+        self.boot = BootPipeline(self._create_boot_stages())
+        self.boot_timings = self.boot.timings  # Segundos por etapa de arranque
+        self.loading_screen = LoadingScreen(self.screen, self.theme_manager, self.boot)
+        self.show_loading = not headless
+        self._startup_mark("theme_manager")
+        
+        # Tiempos por fase y componente (None = sin medir)
+        self.frame_stats: Optional[FrameStats] = None
+        
+        # Simulación a paso fijo: el tiempo real se acumula y se consume en ticks
+        self.tick_dt = 1.0 / SIMULATION_HZ
+        self._accumulator = 0.0
+        self.render_alpha = 0.0  # Fracción del tick pendiente, para interpolar
+        
+        # Apps degradadas: última imagen de su contenido y las que se
+        # componen desde ella en el frame actual
+        self._content_cache = {}
+        self._deferred_apps = set()
+        self._hovered_app = None  # App con el puntero encima
+        self.profiler = ProfilerOverlay(self.screen, self.theme_manager)
         
         # Managers del sistema
         self.window_manager = WindowManager(self.screen, self.theme_manager)
+        self.compositor = Compositor(self.screen)
         self.plugin_manager = PluginManager(self)
-        self.filesystem = VirtualFilesystem()
+        self.clipboard = get_clipboard_service()  # Compartido por todas las apps
+        self.event_bus = EventBus(timer=self._timed)
+        self._startup_mark("managers")
         
-        # Componentes de UI
+        # El resto del arranque lo hacen las etapas del BootPipeline; sin
+        # pantalla de carga se ejecutan ya, si no, frame a frame
+        if not self.show_loading:
+            self.boot.run_all()
+            self._startup_mark("boot")
+    
+    def _startup_mark(self, name: str):
+        """Anota un paso de inicialización si se está perfilando el arranque"""
+        if self.startup_profile:
+            self.startup_profile.mark(name)
+    
+    def _create_boot_stages(self):
+        """Define las etapas de arranque, en orden"""
+        return [
+            BootStage("filesystem", "Montando el sistema de archivos", self._boot_filesystem,
+                      weight=2, threaded=True),
+            BootStage("desktop", "Preparando el escritorio", self._boot_desktop),
+            BootStage("apps", "Registrando aplicaciones", lambda report: self._register_builtin_apps()),
+            BootStage("plugins", "Buscando mods", self._boot_plugins, weight=2, threaded=True,
+                      required=False),
+            BootStage("mods", "Cargando mods", self._boot_mods, required=False),
+            BootStage("events", "Iniciando el sistema", self._boot_finish),
+        ]
+    
+    def _boot_filesystem(self, report):
+        """Carga el filesystem virtual (solo E/S, en un hilo de trabajo)"""
+        self.filesystem = VirtualFilesystem()
+    
+    def _boot_desktop(self, report):
+        """Crea escritorio y barra de tareas (cargan imágenes: hilo principal)"""
         self.desktop = Desktop(self.screen, self.theme_manager)
+        report(0.5)
         self.taskbar = TaskBar(self.screen, self.theme_manager, self.window_manager, self.plugin_manager)
-        self._register_builtin_apps()
-        
-        # Cargar plugins y mods
-        self.plugin_manager.load_plugins()
+    
+    def _boot_plugins(self, report):
+        """Busca los mods y lee su código (solo E/S, en un hilo de trabajo)"""
+        self.plugin_manager.discover_plugins(report)
+    
+    def _boot_mods(self, report):
+        """Ejecuta el código de los mods (pueden usar pygame: hilo principal)"""
+        self.plugin_manager.exec_plugins(report)
+    
+    def _boot_finish(self, report):
+        """Construye el menú de inicio y las rutas de eventos"""
+        self._build_icon_atlas()  # Incluye los iconos de los mods
         self.taskbar.start_menu._build_menu_items()
+        self.clipboard.refresh()  # Lectura inicial del portapapeles del sistema
+        # Rutas de eventos: cada componente recibe solo lo que le interesa
+        self._setup_event_routes()
         
+        print(f"⏱️ Arranque: {self.boot.format_timings()}")
         print("✨ Pixel-OS iniciado correctamente")
     
-    def handle_events(self):
-        """Procesa todos los eventos del sistema"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                # Alt+F4 para cerrar
-                if event.key == pygame.K_F4 and pygame.key.get_mods() & pygame.KMOD_ALT:
-                    self.running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                clicked_icon = self.desktop.handle_click(event.pos)
-                if clicked_icon and clicked_icon.app_ref:
-                    self.plugin_manager.launch_app(clicked_icon.app_ref)
-            
-            # Delegar eventos a componentes
-            self.taskbar.handle_event(event)
-            self.window_manager.handle_event(event)
-
-            # Eventos para la app enfocada
-            if self.window_manager.focused_window:
-                window = self.window_manager.focused_window
-                if window.app_ref and hasattr(window.app_ref, "handle_event"):
-                    window.app_ref.handle_event(event)
+    def _setup_event_routes(self):
+        """Suscribe los componentes del sistema al bus de eventos"""
+        bus = self.event_bus
+        window_manager = self.window_manager
+        
+        # Teclas globales antes que nadie
+        bus.subscribe([pygame.QUIT, pygame.KEYDOWN], self._handle_system_event,
+                      phase=EventBus.CAPTURE, layer=EventBus.LAYER_SYSTEM)
+        # Al volver a Pixel-OS, releer lo que se copió en otras aplicaciones
+        bus.subscribe([pygame.WINDOWFOCUSGAINED], lambda event: self.clipboard.refresh(),
+                      phase=EventBus.CAPTURE, layer=EventBus.LAYER_SYSTEM, name="clipboard")
+        
+        # El hover de la barra y del escritorio sigue al puntero (sin consumir el evento)
+        pointer_events = [pygame.MOUSEMOTION, pygame.WINDOWLEAVE]
+        bus.subscribe(pointer_events, self.taskbar.handle_event,
+                      phase=EventBus.CAPTURE, layer=EventBus.LAYER_TASKBAR, name="taskbar")
+        bus.subscribe(pointer_events, self.desktop.handle_event,
+                      phase=EventBus.CAPTURE, layer=EventBus.LAYER_DESKTOP, name="desktop")
+        
+        # De arriba abajo: barra de tareas, ventanas, app enfocada, escritorio
+        bus.subscribe([pygame.MOUSEBUTTONDOWN], self.taskbar.handle_event,
+                      layer=EventBus.LAYER_TASKBAR, name="taskbar")
+        bus.subscribe([pygame.MOUSEBUTTONDOWN], window_manager.handle_event,
+                      region=lambda pos: window_manager.window_at(pos) is not None,
+                      layer=EventBus.LAYER_WINDOWS, name="windows")
+        # Arrastrar una ventana sigue al ratón aunque salga de ella
+        bus.subscribe([pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION], window_manager.handle_event,
+                      layer=EventBus.LAYER_WINDOWS, name="windows")
+        bus.subscribe(None, self._dispatch_to_focused_app, layer=EventBus.LAYER_APPS)
+        bus.subscribe([pygame.MOUSEMOTION], self._track_app_hover, layer=EventBus.LAYER_APPS)
+        bus.subscribe([pygame.MOUSEBUTTONDOWN], self._handle_desktop_click,
+                      region=lambda pos: window_manager.window_at(pos) is None,
+                      layer=EventBus.LAYER_DESKTOP, name="desktop")
+    
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None):
+        """Procesa todos los eventos del sistema
+        
+        Args:
+            events: Eventos ya extraídos de la cola (por ejemplo por el scheduler)
+        """
+        # Los movimientos del ratón se fusionan: uno por frame basta
+        for event in EventBus.coalesce((events or []) + pygame.event.get()):
+            if self.show_loading:
+                # Durante el arranque solo se atiende la salida del sistema
+                if event.type in (pygame.QUIT, pygame.KEYDOWN):
+                    self._handle_system_event(event)
+                continue
+            self.event_bus.dispatch(event)
         
         # Verificar si se solicitó apagar
         if hasattr(self.plugin_manager, 'should_shutdown') and self.plugin_manager.should_shutdown:
             self.running = False
     
+    def _handle_system_event(self, event: pygame.event.Event) -> bool:
+        """Salida del sistema y atajos globales"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.key == pygame.K_ESCAPE:
+            self.running = False
+        # Alt+F4 para cerrar
+        elif event.key == pygame.K_F4 and pygame.key.get_mods() & pygame.KMOD_ALT:
+            self.running = False
+        # F12 muestra el profiler, Shift+F12 guarda el perfil
+        elif event.key == pygame.K_F12:
+            self._handle_profiler_key(event)
+            return True
+        return False
+    
+    def _handle_desktop_click(self, event: pygame.event.Event) -> bool:
+        """Abre la app de un icono del escritorio"""
+        if event.button != 1:
+            return False
+        clicked_icon = self.desktop.handle_click(event.pos)
+        if clicked_icon and clicked_icon.app_ref:
+            self.plugin_manager.launch_app(clicked_icon.app_ref)
+            return True
+        return False
+    
+    def _dispatch_to_focused_app(self, event: pygame.event.Event) -> bool:
+        """Entrega el evento a la app enfocada si está suscrita a su tipo"""
+        window = self.window_manager.focused_window
+        if not window or not window.app_ref or not hasattr(window.app_ref, "handle_event"):
+            return False
+        app = window.app_ref
+        event_types = getattr(app, "event_types", None)
+        if event_types is not None and event.type not in event_types:
+            return False
+        self._timed(f"events.app.{app.app_id}", app.handle_event, event)
+        app.invalidate()
+        return False
+    
+    def _track_app_hover(self, event: pygame.event.Event) -> bool:
+        """El hover dentro de una app cambia su contenido (al entrar y al salir)"""
+        window = self.window_manager.window_at(event.pos)
+        app = window.app_ref if window and window.content_rect.collidepoint(event.pos) else None
+        if app:
+            app.invalidate()
+        if self._hovered_app and self._hovered_app is not app:
+            self._hovered_app.invalidate()
+        self._hovered_app = app
+        return False
+    
+    def _handle_profiler_key(self, event: pygame.event.Event):
+        """Muestra/oculta el profiler o guarda el perfil con Shift"""
+        if event.mod & pygame.KMOD_SHIFT:
+            if self.profiler.stats.frame_count:
+                path = self.profiler.dump()
+                print(f"📊 Perfil guardado en {path}")
+            return
+        
+        self.profiler.toggle()
+        # Solo se mide mientras el panel está visible
+        self.frame_stats = self.profiler.stats if self.profiler.visible else None
+    
+    def simulate(self, elapsed: float, max_steps: Optional[int] = MAX_CATCHUP_STEPS):
+        """Avanza la simulación en ticks fijos de `tick_dt`
+        
+        Args:
+            elapsed: Tiempo real transcurrido en segundos
+            max_steps: Ticks máximos; si se queda atrás descarta el retraso
+                       en lugar de ralentizar el tiempo simulado (None = sin límite)
+        """
+        self._accumulator += elapsed
+        steps = 0
+        while self._accumulator >= self.tick_dt:
+            if max_steps is not None and steps >= max_steps:
+                self._accumulator %= self.tick_dt
+                break
+            self.update(self.tick_dt)
+            self._accumulator -= self.tick_dt
+            steps += 1
+        
+        self.render_alpha = self._accumulator / self.tick_dt
+        self.window_manager.interpolate(self.render_alpha)
+    
     def update(self, dt: float):
-        """Actualiza el estado del sistema
+        """Actualiza el estado del sistema un tick
         
         Args:
-            dt: Delta time en segundos
+            dt: Duración del tick en segundos
         """
         if self.show_loading:
             self.loading_screen.update(dt)
             if self.loading_screen.is_complete():
                 self.show_loading = False
+                self._startup_mark("boot")
+                self.compositor.invalidate()
         else:
-            self.window_manager.update(dt)
-            self.taskbar.update(dt)
-            self.desktop.update(dt)
+            self._timed("update.windows", self.window_manager.update, dt)
+            for window in self.window_manager.windows:
+                if window.app_ref:
+                    app = window.app_ref
+                    app_dt = self.plugin_manager.get_app_stats(app).take_update_dt(dt)
+                    if app_dt is not None:
+                        self._run_app("update", app, app.update, app_dt)
+            self._timed("update.taskbar", self.taskbar.update, dt)
+            self._timed("update.desktop", self.desktop.update, dt)
+            self.profiler.update(dt)
     
     def render(self):
         """Renderiza todos los componentes del sistema"""
@@ -188,37 +540,198 @@ class PixelOS:
             # Mostrar pantalla de carga
             self.loading_screen.render()
         else:
-            # Fondo del desktop
-            self.screen.fill(Colors.BACKGROUND)
+            # Ventanas tapadas o fuera de pantalla no se dibujan
+            self.window_manager.update_visibility()
             
-            # Renderizar componentes en orden
-            self.desktop.render()
+            # Recoger las regiones modificadas de cada componente
+            self.compositor.invalidate_all(self.desktop.collect_damage())
+            self.compositor.invalidate_all(self.window_manager.collect_damage())
+            self.compositor.invalidate_all(self.taskbar.collect_damage())
+            self.compositor.invalidate_all(self.profiler.collect_damage())
+            
+            # Nada cambió: no se redibuja ni se envía nada a pantalla
+            if not self.compositor.has_damage():
+                return
+            
+            dirty_rects = self.compositor.take_damage()
+            self._prepare_app_rendering()
+            for clip in dirty_rects:
+                self._render_region(clip)
+            self.screen.set_clip(None)
+            
+            # Las apps compuestas desde caché siguen pendientes de redibujar
             for window in self.window_manager.windows:
-                window.render(self.screen, self.theme_manager)
-                if window.app_ref and not window.is_minimized:
-                    prev_clip = self.screen.get_clip()
-                    self.screen.set_clip(window.content_rect)
-                    window.app_ref.render(self.screen, window.content_rect)
-                    self.screen.set_clip(prev_clip)
-            self.taskbar.render()
+                if window.app_ref and window.app_ref not in self._deferred_apps:
+                    window.app_ref.needs_redraw = False
             
-            # Actualizar pantalla
-            pygame.display.flip()
+            # Actualizar solo las regiones redibujadas
+            self._timed("render.present", self.compositor.present, dirty_rects)
+    
+    def _render_region(self, clip: pygame.Rect):
+        """Recompone una región de la pantalla
+        
+        Args:
+            clip: Región de pantalla a redibujar
+        """
+        self.screen.set_clip(clip)
+        
+        # Fondo del desktop
+        self.screen.fill(Colors.BACKGROUND)
+        
+        # Renderizar componentes en orden
+        self._timed("render.desktop", self.desktop.render, clip)
+        for window in self.window_manager.windows:
+            if not window.is_visible or not window.get_bounds().colliderect(clip):
+                continue
+            # Clave por ventana: dos ventanas con el mismo título no se mezclan
+            self._timed(f"render.window.{window.title}#{id(window):x}", window.render,
+                        self.screen, self.theme_manager)
+            if window.app_ref:
+                content_clip = window.content_rect.clip(clip)
+                if content_clip.width > 0 and content_clip.height > 0:
+                    self.screen.set_clip(content_clip)
+                    self._render_app(window.app_ref, window.content_rect, content_clip)
+                    self.screen.set_clip(clip)
+        self._timed("render.taskbar", self.taskbar.render, clip)
+        self.profiler.render(clip)
+    
+    def _prepare_app_rendering(self):
+        """Decide una vez por frame qué apps degradadas se componen desde caché"""
+        self._deferred_apps = set()
+        open_apps = set()
+        for window in self.window_manager.windows:
+            app = window.app_ref
+            if not app:
+                continue
+            open_apps.add(app)
+            stats = self.plugin_manager.get_app_stats(app)
+            if not stats.degraded:
+                self._content_cache.pop(app, None)
+                continue
+            cache = self._content_cache.get(app)
+            if (cache is not None and cache.get_size() == window.content_rect.size
+                    and not stats.render_due()):
+                self._deferred_apps.add(app)
+        
+        for app in list(self._content_cache):
+            if app not in open_apps:
+                del self._content_cache[app]
+    
+    def _render_app(self, app, rect: pygame.Rect, content_clip: pygame.Rect):
+        """Dibuja el contenido de una app, o su última imagen si está degradada
+        
+        Args:
+            app: Aplicación a dibujar
+            rect: Área de contenido de su ventana
+            content_clip: Parte de esa área que se redibuja
+        """
+        local_clip = content_clip.move(-rect.x, -rect.y)
+        if app in self._deferred_apps:
+            self.screen.blit(self._content_cache[app], content_clip.topleft, local_clip)
+            return
+        
+        self._run_app("render", app, app.render, self.screen, rect)
+        
+        if self.plugin_manager.is_app_degraded(app):
+            cache = self._content_cache.get(app)
+            if cache is None or cache.get_size() != rect.size:
+                # Caché nueva: se llena entera, no solo con la parte redibujada,
+                # porque los frames diferidos pueden pedir cualquier zona
+                self._content_cache[app] = self._render_app_offscreen(app, rect)
+            else:
+                cache.blit(self.screen, local_clip.topleft, content_clip)
+    
+    def _render_app_offscreen(self, app, rect: pygame.Rect) -> pygame.Surface:
+        """Dibuja el contenido completo de una app fuera de la pantalla
+        
+        Se usa una superficie del tamaño de la pantalla para que la app
+        dibuje con las mismas coordenadas; el resto de la pantalla (y las
+        ventanas que haya encima) no se toca.
+        
+        Args:
+            app: Aplicación a dibujar
+            rect: Área de contenido de su ventana
+            
+        Returns:
+            Imagen del contenido, del tamaño de rect
+        """
+        scratch = pygame.Surface(self.screen.get_size()).convert()
+        scratch.fill(Colors.BACKGROUND)
+        if app.window is not None:
+            app.window.render(scratch, self.theme_manager)  # Fondo del área de contenido
+        scratch.set_clip(rect)
+        app.render(scratch, rect)
+        content = pygame.Surface(rect.size).convert()
+        content.blit(scratch, (0, 0), rect)
+        return content
+    
+    def _run_app(self, phase: str, app, func, *args):
+        """Llama a un método de una app midiendo su duración
+        
+        El tiempo se registra siempre en el PluginManager, que decide si la
+        app excede su presupuesto, y en frame_stats si hay profiling activo.
+        
+        Args:
+            phase: "render" o "update"
+            app: Aplicación medida
+            func: Método a ejecutar
+        """
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        self.plugin_manager.record_app_time(app, phase, elapsed)
+        if self.frame_stats is not None:
+            self.frame_stats.add(f"{phase}.app.{app.app_id}", elapsed)
+    
+    def _timed(self, name: str, func, *args):
+        """Llama a func y, si hay estadísticas activas, mide su duración
+        
+        Args:
+            name: Nombre del componente medido
+            func: Función a ejecutar
+        """
+        if self.frame_stats is None:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self.frame_stats.add(name, time.perf_counter() - start)
+        return result
+    
+    def run_frame(self, dt: float, events: Optional[List[pygame.event.Event]] = None,
+                  idle_time: float = 0.0):
+        """Ejecuta un frame completo: eventos, actualización y render
+        
+        Args:
+            dt: Delta time en segundos
+            events: Eventos ya extraídos de la cola
+            idle_time: Parte de dt que el sistema pasó dormido esperando eventos
+        """
+        if self.frame_stats is not None:
+            self.frame_stats.begin_frame()
+        start = time.perf_counter()
+        
+        # Mientras dormía nada se animaba: esos ticks son baratos y van antes
+        # de los eventos que lo despertaron, sin límite de recuperación
+        idle_time = min(idle_time, dt)
+        if idle_time > 0:
+            self._timed("update.idle", self.simulate, idle_time, None)
+        
+        self._timed("events", self.handle_events, events)
+        self._timed("update", self.simulate, dt - idle_time)
+        self._timed("render", self.render)
+        
+        if self.frame_stats is not None:
+            self.frame_stats.add("frame", time.perf_counter() - start)
+            self.frame_stats.end_frame()
 
     def _register_builtin_apps(self):
-        """Registra aplicaciones integradas y enlaza iconos del escritorio"""
-        apps = [
-            TerminalApp(),
-            TextEditorApp(),
-            FileManagerApp(),
-            SettingsApp(),
-            MiniBrowserApp(),
-            CodeEditorApp(),
-            VideoPlayerApp(),
-        ]
-
+        """Registra aplicaciones integradas y enlaza iconos del escritorio
+        
+        Solo se registran descriptores; cada app se construye al abrirla
+        por primera vez.
+        """
         def app_launcher(app_id: str, path: str, filename: str | None):
-            app = self.plugin_manager.plugins.get(app_id)
+            app = self.plugin_manager.get_app(app_id)
             if not app:
                 return False
             if not app.is_running:
@@ -227,37 +740,82 @@ class PixelOS:
                 app.load_file(path, filename)
             elif not filename and hasattr(app, "open_path"):
                 app.open_path(path)
+            app.invalidate()
             return True
 
-        for app in apps:
-            self.plugin_manager.plugins[app.app_id] = app
-
-        terminal = self.plugin_manager.plugins.get("terminal")
-        if terminal and hasattr(terminal, "set_app_launcher"):
+        def create_terminal():
+            from apps.builtin_apps import TerminalApp
+            terminal = TerminalApp()
             terminal.set_app_launcher(app_launcher)
+            return terminal
+
+        builtin_apps = [
+            ("terminal", "app.terminal", Colors.GREEN, create_terminal),
+            ("text_editor", "app.text_editor", Colors.BLUE, _builtin_app("TextEditorApp")),
+            ("file_manager", "app.file_manager", Colors.YELLOW, _builtin_app("FileManagerApp")),
+            ("settings", "app.settings", Colors.PURPLE, _builtin_app("SettingsApp")),
+            ("mini_browser", "app.mini_browser", Colors.BLUE, _builtin_app("MiniBrowserApp")),
+            ("code_editor", "app.code_editor", Colors.YELLOW, _builtin_app("CodeEditorApp")),
+            ("video_player", "app.video_player", Colors.PEACH, _builtin_app("VideoPlayerApp")),
+        ]
+        for app_id, name_key, color, factory in builtin_apps:
+            self.plugin_manager.register_app(AppDescriptor(app_id, tr(name_key), color, factory))
+        self._build_icon_atlas()
 
         # Re-crear iconos del escritorio con referencias correctas
         self.desktop.icons = []
         default_ids = ["terminal", "text_editor", "file_manager", "settings"]
         for app_id in default_ids:
-            app = self.plugin_manager.plugins.get(app_id)
-            if app:
-                self.desktop.add_icon(app.name, app_ref=app, color=app.color)
+            descriptor = self.plugin_manager.descriptors.get(app_id)
+            if descriptor:
+                self.desktop.add_icon(descriptor.name, app_ref=descriptor, color=descriptor.color)
+    
+    def _build_icon_atlas(self):
+        """Empaqueta los iconos de todas las apps registradas"""
+        self.theme_manager.icons.build({app_id: descriptor.icon_path for app_id, descriptor
+                                        in self.plugin_manager.descriptors.items()})
+    
+    def _schedule_next_frame(self):
+        """Registra en el scheduler cuándo hace falta el siguiente frame"""
+        if self.show_loading:
+            self.scheduler.schedule_in(self.loading_screen.next_deadline())
+            return
+        if self.compositor.has_damage():
+            self.scheduler.schedule_in(0.0)
+        
+        self.scheduler.schedule_in(self.window_manager.next_deadline())
+        self.scheduler.schedule_in(self.taskbar.next_deadline())
+        self.scheduler.schedule_in(self.profiler.next_deadline())
+        for window in self.window_manager.windows:
+            app = window.app_ref
+            if app and window.is_visible:
+                self.scheduler.schedule_in(app.next_deadline())
+                if app in self._deferred_apps and app.needs_redraw:
+                    # Cambio pendiente de una app degradada
+                    stats = self.plugin_manager.get_app_stats(app)
+                    self.scheduler.schedule_in(stats.time_until_render())
     
     def run(self):
         """Bucle principal del sistema"""
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time en segundos
+            # Espera eventos o el próximo plazo; dt en segundos
+            dt, events = self.scheduler.wait()
+            self.run_frame(dt, events, self.scheduler.idle_time)
+            self._schedule_next_frame()
             
-            self.handle_events()
-            self.update(dt)
-            self.render()
+            if self.startup_profile and not self.show_loading:
+                # Primer frame del escritorio: cerrar el perfil de arranque
+                self.startup_profile.finish(self.boot_timings)
+                self.startup_profile = None
         
         self.quit()
     
     def quit(self):
         """Cierra el sistema correctamente"""
         print("👋 Cerrando Pixel-OS...")
+        self.clipboard.shutdown()
+        if hasattr(self, "filesystem"):
+            self.filesystem.close()  # Guardar los cambios pendientes
         pygame.quit()
         sys.exit()
 
@@ -1,15 +1,65 @@
 """
 Virtual Filesystem - Sistema de almacenamiento de archivos para Pixel-OS
 Permite guardar y organizar archivos creados en el SO
+
+Cada cambio se anota como una operación (create, update, delete, move,
+restore) en un diario de solo añadir (filesystem.journal) junto a la
+instantánea completa (filesystem.json). Al cargar se aplica el diario
+sobre la instantánea. Las operaciones no se escriben al momento: un hilo
+de trabajo las añade cuando pasan FS_SAVE_DELAY segundos sin cambios (o
+FS_SAVE_MAX_DELAY desde el primero), y cuando el diario supera
+FS_JOURNAL_MAX_BYTES escribe una instantánea nueva y lo vacía.
+flush() escribe ya, y close() escribe y detiene el hilo al apagar.
+
+Las instantáneas se escriben de forma atómica (temporal + fsync +
+renombrado), llevan un checksum y se conservan las anteriores como
+filesystem.json.1, .2...; al cargar se usa la más reciente que sea válida.
+
+El índice solo guarda metadatos (nombres, tamaños, fechas, tipos); el
+texto de cada archivo está en el BlobStore (blobs/) y se lee al pedirlo.
+Los blobs se identifican por su contenido, así que copiar un archivo o
+llevarlo a la papelera solo cambia metadatos.
 """
+import atexit
+import functools
 import os
 import json
-from typing import Dict, List, Optional
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Set
 from datetime import datetime
+from config.settings import (FS_JOURNAL_MAX_BYTES, FS_SAVE_DELAY, FS_SAVE_MAX_DELAY,
+                             FS_SNAPSHOT_GENERATIONS)
+from core.blob_store import BlobStore
+
+# Las instantáneas son JSON válido; el checksum cubre el texto exacto de "data"
+SNAPSHOT_PREFIX = '{{"checksum":"{checksum}","data":'
+
+
+def _checksum(payload: bytes) -> str:
+    """CRC32 del contenido: detecta escrituras cortadas o corruptas"""
+    return f"{zlib.crc32(payload):08x}"
+
+
+def _mutation(method):
+    """Ejecuta un método que modifica el árbol con el lock del filesystem
+    
+    Así el hilo de escritura nunca serializa una carpeta a medio cambiar.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class VirtualFile:
-    """Representa un archivo en el filesystem virtual"""
+    """Representa un archivo en el filesystem virtual
+    
+    Dentro de un VirtualFilesystem el contenido está en el BlobStore y se
+    lee al acceder a content; un archivo suelto lo guarda en memoria.
+    """
     
     def __init__(self, name: str, content: str = "", file_type: str = "text"):
         """Inicializa un archivo
@@ -20,39 +70,76 @@ class VirtualFile:
             file_type: Tipo de archivo (text, image, document, etc)
         """
         self.name = name
-        self.content = content
+        self._content: Optional[str] = content  # None = está en el almacén de blobs
+        self.blob: Optional[str] = None
+        self.store: Optional[BlobStore] = None
         self.file_type = file_type
         self.created_at = datetime.now().isoformat()
         self.modified_at = datetime.now().isoformat()
         self.size = len(content)
         self.original_path: Optional[str] = None  # Para papelera: dónde estaba antes
     
+    @property
+    def content(self) -> str:
+        """Contenido del archivo (se lee del almacén la primera vez que se pide)"""
+        if self._content is not None:
+            return self._content
+        if self.store is not None and self.blob is not None:
+            return self.store.get(self.blob)
+        return ""
+    
+    @content.setter
+    def content(self, content: str):
+        self._content = content
+        self.blob = None
+    
     def update_content(self, content: str):
         """Actualiza el contenido del archivo"""
         self.content = content
         self.modified_at = datetime.now().isoformat()
         self.size = len(content)
     
+    def set_blob(self, blob: str, size: int, store: Optional[BlobStore]):
+        """Apunta el archivo a un blob del almacén en vez de a un texto en memoria"""
+        self._content = None
+        self.blob = blob
+        self.size = size
+        self.store = store
+    
     def to_dict(self) -> Dict:
-        """Convierte el archivo a diccionario para serialización"""
-        return {
+        """Convierte el archivo a diccionario para serialización
+        
+        Si el contenido está en el almacén solo se guarda el id del blob.
+        """
+        data = {
             'name': self.name,
-            'content': self.content,
             'type': self.file_type,
             'created_at': self.created_at,
             'modified_at': self.modified_at,
             'size': self.size,
             'original_path': self.original_path,
         }
+        if self.blob is not None:
+            data['blob'] = self.blob
+        else:
+            data['content'] = self.content
+        return data
     
     @staticmethod
-    def from_dict(data: Dict) -> 'VirtualFile':
-        """Crea un archivo desde un diccionario"""
+    def from_dict(data: Dict, store: Optional[BlobStore] = None) -> 'VirtualFile':
+        """Crea un archivo desde un diccionario
+        
+        Args:
+            data: Datos de to_dict()
+            store: Almacén del que leer el contenido si data solo trae el blob
+        """
         file = VirtualFile(data['name'], data.get('content', ''), data.get('type', 'text'))
         file.created_at = data.get('created_at', file.created_at)
         file.modified_at = data.get('modified_at', file.modified_at)
         file.size = data.get('size', file.size)
         file.original_path = data.get('original_path')
+        if data.get('blob') is not None:
+            file.set_blob(data['blob'], file.size, store)
         return file
 
 
@@ -120,19 +207,19 @@ class VirtualFolder:
         }
     
     @staticmethod
-    def from_dict(data: Dict) -> 'VirtualFolder':
-        """Crea una carpeta desde un diccionario"""
+    def from_dict(data: Dict, store: Optional[BlobStore] = None) -> 'VirtualFolder':
+        """Crea una carpeta desde un diccionario (store: ver VirtualFile.from_dict)"""
         folder = VirtualFolder(data['name'])
         folder.created_at = data.get('created_at', folder.created_at)
         folder.original_path = data.get('original_path')
         
         # Restaurar archivos
         for file_name, file_data in data.get('files', {}).items():
-            folder.files[file_name] = VirtualFile.from_dict(file_data)
+            folder.files[file_name] = VirtualFile.from_dict(file_data, store)
         
         # Restaurar carpetas
         for folder_name, folder_data in data.get('folders', {}).items():
-            folder.folders[folder_name] = VirtualFolder.from_dict(folder_data)
+            folder.folders[folder_name] = VirtualFolder.from_dict(folder_data, store)
         
         return folder
 
@@ -140,14 +227,50 @@ class VirtualFolder:
 class VirtualFilesystem:
     """Filesystem virtual para Pixel-OS"""
     
-    def __init__(self, storage_path: str = "user_data/filesystem"):
+    SNAPSHOT_FILE = "filesystem.json"
+    JOURNAL_FILE = "filesystem.journal"
+    BLOBS_DIR = "blobs"
+    
+    def __init__(self, storage_path: str = "user_data/filesystem",
+                 save_delay: float = FS_SAVE_DELAY, max_save_delay: float = FS_SAVE_MAX_DELAY,
+                 journal_max_bytes: int = FS_JOURNAL_MAX_BYTES,
+                 generations: int = FS_SNAPSHOT_GENERATIONS):
         """Inicializa el filesystem virtual
         
         Args:
             storage_path: Ruta donde se almacenan los datos del filesystem
+            save_delay: Segundos sin cambios antes de escribir el diario
+            max_save_delay: Segundos máximos que un cambio espera a escribirse
+            journal_max_bytes: Tamaño del diario a partir del cual se compacta
+            generations: Instantáneas anteriores que se conservan
         """
         self.storage_path = storage_path
         self.root = VirtualFolder("root")
+        self.blobs = BlobStore(os.path.join(storage_path, self.BLOBS_DIR))  # Contenido de los archivos
+        self._swept = False  # Si ya se buscaron blobs huérfanos en esta sesión
+        self._generation_blobs: Dict[int, Set[str]] = {}  # Blobs de cada generación en disco
+        self._gap_journal_blobs: Optional[Set[str]] = None  # Blobs de los diarios apartados
+        
+        # Diario de operaciones: cada cambio tiene un número de secuencia;
+        # la instantánea guarda el último que incluye
+        self.journal_max_bytes = journal_max_bytes
+        self.generations = generations
+        self._seq = 0
+        self._pending: List[Dict] = []  # Operaciones aplicadas pero aún no escritas
+        self._journal_size = 0
+        
+        # Escritura diferida: los cambios se agrupan y los escribe un hilo
+        self.save_delay = save_delay
+        self.max_save_delay = max_save_delay
+        self._lock = threading.RLock()  # Protege el árbol mientras se serializa
+        self._save_lock = threading.Lock()  # Una sola escritura a disco a la vez
+        self._changed = threading.Condition(self._lock)
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self.saves = 0  # Instantáneas completas escritas
+        self.appends = 0  # Escrituras al diario
         
         # Crear estructura por defecto
         self._create_default_structure()
@@ -164,42 +287,483 @@ class VirtualFilesystem:
         self.root.create_folder("Descargas")
         self.root.create_folder("Papelera")
     
+    @property
+    def snapshot_path(self) -> str:
+        """Ruta de la instantánea completa"""
+        return os.path.join(self.storage_path, self.SNAPSHOT_FILE)
+    
+    @property
+    def journal_path(self) -> str:
+        """Ruta del diario de operaciones"""
+        return os.path.join(self.storage_path, self.JOURNAL_FILE)
+    
     def save(self):
-        """Guarda el filesystem a archivo"""
+        """Compacta: escribe la instantánea completa ahora mismo y vacía el diario"""
+        with self._save_lock:
+            # El árbol se copia con el lock; la escritura a disco va sin él.
+            # Lo pendiente ya está aplicado al árbol, así que entra en la instantánea
+            with self._lock:
+                self._pending.clear()
+                data = {
+                    'version': '1.0',
+                    'created_at': datetime.now().isoformat(),
+                    'seq': self._seq,
+                    'filesystem': self.root.to_dict(),
+                }
+            
+            try:
+                self.blobs.flush()  # Antes que el índice que los nombra
+                current = self._snapshot_blobs(data)
+                self._write_snapshot(data)
+                self._generation_blobs[0] = current
+                # Si se corta aquí, al cargar se saltan las operaciones con seq <= data['seq']
+                open(self.journal_path, 'w').close()
+                self._journal_size = 0
+                self.saves += 1
+                # La primera vez en la sesión se recorre el disco entero
+                keep = self._referenced_blobs()
+                if self._swept:
+                    self.blobs.collect(keep)
+                else:
+                    self.blobs.sweep(keep)
+                    self._swept = True
+            except Exception as e:
+                # No se sabe qué generaciones llegaron a rotarse: se releerán
+                self._generation_blobs.clear()
+                print(f"Error guardando filesystem: {e}")
+    
+    def _referenced_blobs(self) -> Set[str]:
+        """Blobs que usan la instantánea actual, las generaciones que se conservan
+        y los diarios apartados
+        
+        Cada generación se lee de disco como mucho una vez por sesión; luego
+        su conjunto se mueve con ella al rotar.
+        """
+        blobs: Set[str] = set()
+        for generation in range(self.generations + 1):
+            cached = self._generation_blobs.get(generation)
+            if cached is None:
+                snapshot = self._read_snapshot(self._generation_path(generation))
+                cached = self._snapshot_blobs(snapshot) if snapshot else set()
+                self._generation_blobs[generation] = cached
+            blobs.update(cached)
+        if self._gap_journal_blobs is None:
+            self._gap_journal_blobs = self._read_gap_journal_blobs()
+        blobs.update(self._gap_journal_blobs)
+        return blobs
+    
+    def _read_gap_journal_blobs(self) -> Set[str]:
+        """Blobs que nombran los diarios apartados por _replay_journal
+        
+        No están en ninguna instantánea ni tienen referencias, pero se
+        conservan para poder recuperar esos cambios a mano.
+        """
+        blobs: Set[str] = set()
+        prefix = self.JOURNAL_FILE + ".gap-"
+        try:
+            names = [name for name in os.listdir(self.storage_path) if name.startswith(prefix)]
+        except OSError:
+            return blobs
+        for name in names:
+            try:
+                with open(os.path.join(self.storage_path, name), 'rb') as f:
+                    lines = f.readlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    continue
+                if record.get('blob'):
+                    blobs.add(record['blob'])
+                elif record.get('op') == 'create':
+                    if record.get('kind') == 'folder':
+                        blobs.update(self._folder_blobs(record['data']))
+                    elif record['data'].get('blob'):
+                        blobs.add(record['data']['blob'])
+        return blobs
+    
+    @classmethod
+    def _snapshot_blobs(cls, data: Dict) -> Set[str]:
+        """Blobs que usa una instantánea"""
+        return cls._folder_blobs(data['filesystem'])
+    
+    @staticmethod
+    def _folder_blobs(folder: Dict) -> Set[str]:
+        """Blobs de los archivos de una carpeta serializada y sus subcarpetas"""
+        blobs: Set[str] = set()
+        pending = [folder]
+        while pending:
+            folder = pending.pop()
+            blobs.update(file['blob'] for file in folder.get('files', {}).values() if file.get('blob'))
+            pending.extend(folder.get('folders', {}).values())
+        return blobs
+    
+    def _write_snapshot(self, data: Dict):
+        """Escribe una instantánea de forma atómica
+        
+        Se escribe en un temporal, se fuerza a disco y se renombra sobre
+        filesystem.json; la instantánea anterior pasa a filesystem.json.1, y
+        así hasta FS_SNAPSHOT_GENERATIONS. Un corte deja siempre una
+        generación completa.
+        """
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        
         os.makedirs(self.storage_path, exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(SNAPSHOT_PREFIX.format(checksum=_checksum(payload)).encode('utf-8'))
+            f.write(payload)
+            f.write(b"}")
+            f.flush()
+            os.fsync(f.fileno())
         
-        data = {
-            'version': '1.0',
-            'created_at': datetime.now().isoformat(),
-            'filesystem': self.root.to_dict(),
-        }
+        # Rotar las generaciones anteriores: .1 -> .2, ..., actual -> .1
+        for generation in range(self.generations, 0, -1):
+            source = self._generation_path(generation - 1)
+            if os.path.exists(source):
+                os.replace(source, self._generation_path(generation))
+                cached = self._generation_blobs.pop(generation - 1, None)
+                if cached is None:
+                    self._generation_blobs.pop(generation, None)
+                else:
+                    self._generation_blobs[generation] = cached
+        os.replace(tmp_path, self.snapshot_path)
+        self._fsync_dir()
+    
+    def _generation_path(self, generation: int) -> str:
+        """Ruta de una generación (0 = la actual)"""
+        return self.snapshot_path if generation == 0 else f"{self.snapshot_path}.{generation}"
+    
+    def _fsync_dir(self):
+        """Fuerza a disco los renombrados de la carpeta (no existe en Windows)"""
+        try:
+            fd = os.open(self.storage_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _read_snapshot(path: str) -> Optional[Dict]:
+        """Lee y verifica una instantánea
         
-        filepath = os.path.join(self.storage_path, "filesystem.json")
+        Returns:
+            Los datos, o None si falta, está incompleta o no cuadra el checksum
+        """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error guardando filesystem: {e}")
+            with open(path, 'rb') as f:
+                raw = f.read()
+            document = json.loads(raw.decode('utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict):
+            return None
+        
+        if 'checksum' not in document:
+            # Formato antiguo (sin checksum): se acepta tal cual
+            return document if 'filesystem' in document else None
+        
+        prefix = SNAPSHOT_PREFIX.format(checksum=document['checksum']).encode('utf-8')
+        if not raw.startswith(prefix) or not raw.endswith(b"}"):
+            return None
+        if _checksum(raw[len(prefix):-1]) != document['checksum']:
+            return None
+        return document.get('data')
+    
+    def _write_pending(self):
+        """Escribe los cambios pendientes: en el diario, o en una instantánea
+        si todavía no hay ninguna sobre la que repetirlo"""
+        if not os.path.exists(self.snapshot_path):
+            self.save()
+        else:
+            self._append_journal()
+    
+    def _append_journal(self):
+        """Añade al diario las operaciones pendientes"""
+        with self._save_lock:
+            with self._lock:
+                records, self._pending = self._pending, []
+            if not records:
+                return
+            
+            lines = "".join(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+                            for record in records)
+            try:
+                self.blobs.flush()  # Antes que las operaciones que los nombran
+                os.makedirs(self.storage_path, exist_ok=True)
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._journal_size += len(lines.encode('utf-8'))
+                self.appends += 1
+            except Exception as e:
+                print(f"Error escribiendo el diario del filesystem: {e}")
+                with self._lock:
+                    self._pending[:0] = records  # Se reintenta en la próxima escritura
+    
+    def _commit(self, record: Dict):
+        """Aplica una operación al árbol y la deja pendiente de escribir
+        
+        Returns:
+            Lo que devuelve _apply (el elemento creado, o True)
+        """
+        with self._lock:
+            self._seq += 1
+            record['seq'] = self._seq
+            result = self._apply(record)
+            
+            now = time.monotonic()
+            if not self._pending:
+                self._first_change = now
+            self._last_change = now
+            self._pending.append(record)
+            if self._writer is None and not self._closed:
+                self._writer = threading.Thread(target=self._write_behind, name="filesystem-writer",
+                                                daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+            self._changed.notify()
+            return result
+    
+    def _apply(self, record: Dict):
+        """Aplica una operación del diario al árbol
+        
+        Se usa tanto para los cambios nuevos como al repetir el diario al
+        cargar, así que no debe depender de nada que no esté en el registro.
+        """
+        op = record['op']
+        folder = self.get_path(record['path'])
+        if folder is None:
+            raise KeyError(f"ruta inexistente: {record['path']}")
+        
+        if op == 'create':
+            # Una copia es un create que apunta al mismo blob que el original
+            if record['kind'] == 'folder':
+                item = VirtualFolder.from_dict(record['data'], self.blobs)
+                items = folder.folders
+            else:
+                item = VirtualFile.from_dict(record['data'], self.blobs)
+                items = folder.files
+            self._acquire_blobs(item)
+            self._release_blobs(items.get(item.name))  # Si reemplaza a otro
+            items[item.name] = item
+            return item
+        
+        if op == 'update':
+            file = folder.files[record['name']]
+            old_blob = file.blob
+            if 'blob' in record:
+                file.set_blob(record['blob'], record['size'], self.blobs)
+                self.blobs.acquire(file.blob)
+            else:
+                file.update_content(record['content'])  # Diario antiguo, con el texto dentro
+            if old_blob is not None:
+                self.blobs.release(old_blob)
+            file.modified_at = record['modified_at']
+            return True
+        
+        if op == 'delete':
+            if record['name'] is None:
+                # Vaciar la carpeta entera (papelera)
+                self._release_blobs(folder)
+                folder.files.clear()
+                folder.folders.clear()
+            elif record['kind'] == 'folder':
+                self._release_blobs(folder.folders.pop(record['name']))
+            else:
+                self._release_blobs(folder.files.pop(record['name']))
+            return True
+        
+        if op in ('move', 'restore'):
+            dest = self.get_path(record['dest'])
+            if dest is None:
+                raise KeyError(f"ruta inexistente: {record['dest']}")
+            source = folder.folders if record['kind'] == 'folder' else folder.files
+            target = dest.folders if record['kind'] == 'folder' else dest.files
+            # Solo cambian los metadatos: el contenido sigue en el mismo blob
+            item = source.pop(record['name'])
+            item.original_path = record.get('original_path')
+            self._release_blobs(target.get(record['name']))  # Si reemplaza a otro
+            target[record['name']] = item
+            return True
+        
+        raise ValueError(f"operación desconocida: {op}")
+    
+    @staticmethod
+    def _iter_blobs(item):
+        """Blobs de un archivo, o de todos los archivos de una carpeta"""
+        if isinstance(item, VirtualFile):
+            if item.blob is not None:
+                yield item.blob
+            return
+        pending = [item]
+        while pending:
+            folder = pending.pop()
+            for file in folder.files.values():
+                if file.blob is not None:
+                    yield file.blob
+            pending.extend(folder.folders.values())
+    
+    def _acquire_blobs(self, item):
+        """Suma las referencias de un archivo o carpeta nuevos"""
+        if item is not None:
+            for blob in self._iter_blobs(item):
+                self.blobs.acquire(blob)
+    
+    def _release_blobs(self, item):
+        """Resta las referencias de un archivo o carpeta que desaparecen"""
+        if item is not None:
+            for blob in self._iter_blobs(item):
+                self.blobs.release(blob)
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Indica si hay cambios sin escribir"""
+        return bool(self._pending)
+    
+    def flush(self):
+        """Escribe ya en el diario los cambios pendientes"""
+        if self._pending:
+            self._write_pending()
+    
+    def close(self):
+        """Escribe los cambios pendientes y detiene el hilo de escritura"""
+        with self._lock:
+            self._closed = True
+            self._changed.notify()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=5.0)
+        self.flush()
+    
+    def _write_behind(self):
+        """Hilo de escritura: añade al diario cuando los cambios se calman
+        y compacta cuando el diario crece demasiado"""
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._changed.wait()
+                if self._closed:
+                    return  # close() hace la última escritura
+                
+                # Esperar a que pasen save_delay segundos sin cambios
+                while self._pending and not self._closed:
+                    now = time.monotonic()
+                    deadline = min(self._last_change + self.save_delay,
+                                   self._first_change + self.max_save_delay)
+                    if now >= deadline:
+                        break
+                    self._changed.wait(deadline - now)
+                if self._closed or not self._pending:
+                    continue
+            self._write_pending()
+            if self._journal_size > self.journal_max_bytes:
+                self.save()
     
     def load(self):
-        """Carga el filesystem desde archivo"""
-        filepath = os.path.join(self.storage_path, "filesystem.json")
+        """Carga la instantánea más reciente que sea válida y repite encima el diario"""
+        candidates = [self.snapshot_path + ".tmp"] + [self._generation_path(generation)
+                                                      for generation in range(self.generations + 1)]
+        existing = [path for path in candidates if os.path.exists(path)]
         
-        if os.path.exists(filepath):
+        best_path, best = None, None
+        for path in existing:
+            data = self._read_snapshot(path)
+            if data is not None and (best is None or data.get('seq', 0) > best.get('seq', 0)):
+                best_path, best = path, data
+        
+        if best is not None:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.root = VirtualFolder.from_dict(data['filesystem'])
+                self.root = VirtualFolder.from_dict(best['filesystem'], self.blobs)
+                self._seq = best.get('seq', 0)
             except Exception as e:
                 print(f"Error cargando filesystem: {e}")
                 self._create_default_structure()
+            if best_path != self.snapshot_path:
+                # Corte a mitad de un guardado o instantánea dañada
+                print(f"⚠️ Filesystem recuperado de {os.path.basename(best_path)}")
+        elif existing:
+            print(f"Error cargando filesystem: ninguna instantánea es válida ({len(existing)} dañadas)")
+        
+        self._replay_journal()
+        
+        # Datos de versiones anteriores, con el texto dentro del índice
+        migrated = self._move_content_to_blobs(self.root)
+        self.blobs.reset_refs(self._iter_blobs(self.root))
+        if migrated:
+            self.save()
+    
+    def _move_content_to_blobs(self, folder: VirtualFolder) -> int:
+        """Pasa al almacén de blobs los archivos que aún tienen el texto en memoria
+        
+        Returns:
+            Número de archivos movidos
+        """
+        moved = 0
+        for file in folder.files.values():
+            if file.blob is None:
+                content = file.content
+                file.set_blob(self.blobs.put(content), len(content), self.blobs)
+                moved += 1
+        for subfolder in folder.folders.values():
+            moved += self._move_content_to_blobs(subfolder)
+        return moved
+    
+    def _replay_journal(self):
+        """Aplica las operaciones del diario posteriores a la instantánea"""
+        if not os.path.exists(self.journal_path):
+            return
+        
+        valid_size = 0
+        gap_seq = None
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    # Última línea a medio escribir (corte de luz): se descarta
+                    print("⚠️ Diario del filesystem truncado; se descarta la última operación")
+                    break
+                valid_size += len(line)
+                if record.get('seq', 0) <= self._seq:
+                    continue  # Ya incluida en la instantánea
+                if record['seq'] != self._seq + 1:
+                    # Falta lo que había entre la instantánea y el diario (se
+                    # recuperó una generación anterior): lo que sigue se anotó
+                    # sobre otro árbol y no se puede aplicar
+                    gap_seq = record['seq']
+                    break
+                try:
+                    self._apply(record)
+                except Exception as e:
+                    print(f"Error repitiendo el diario del filesystem: {e}")
+                self._seq = record['seq']
+        
+        if gap_seq is not None:
+            # Se conserva aparte (no se trunca) y se empieza un diario nuevo
+            kept_path = f"{self.journal_path}.gap-{gap_seq}"
+            os.replace(self.journal_path, kept_path)
+            print(f"⚠️ El diario del filesystem no continúa la instantánea (seq {self._seq}, "
+                  f"siguiente {gap_seq}); se guarda sin aplicar en {os.path.basename(kept_path)}")
+            self._journal_size = 0
+            return
+        
+        if valid_size < os.path.getsize(self.journal_path):
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_size)
+        self._journal_size = valid_size
     
     def get_path(self, path: str) -> Optional[VirtualFolder]:
         """Navega hasta una carpeta usando una ruta (ej: "Documentos/Trabajo")
         
         Args:
             path: Ruta separada por barras
-            
+        
         Returns:
             La carpeta destino o None si no existe
         """
@@ -217,6 +781,7 @@ class VirtualFilesystem:
         
         return current
     
+    @_mutation
     def create_file(self, path: str, name: str, content: str = "", file_type: str = "text") -> Optional[VirtualFile]:
         """Crea un archivo en la ruta especificada
         
@@ -225,45 +790,69 @@ class VirtualFilesystem:
             name: Nombre del archivo
             content: Contenido inicial
             file_type: Tipo de archivo
-            
+        
         Returns:
             El archivo creado o None si la ruta no existe
         """
-        folder = self.get_path(path)
-        if folder:
-            file = folder.create_file(name, content, file_type)
-            self.save()
-            return file
+        if self.get_path(path):
+            file = VirtualFile(name, "", file_type)
+            file.set_blob(self.blobs.put(content), len(content), self.blobs)
+            data = file.to_dict()
+            return self._commit({'op': 'create', 'path': path.strip("/"), 'kind': 'file', 'data': data})
         return None
     
+    @_mutation
     def create_folder(self, path: str, name: str) -> Optional[VirtualFolder]:
         """Crea una carpeta en la ruta especificada"""
-        folder = self.get_path(path)
-        if folder:
-            new_folder = folder.create_folder(name)
-            self.save()
-            return new_folder
+        if self.get_path(path):
+            data = VirtualFolder(name).to_dict()
+            return self._commit({'op': 'create', 'path': path.strip("/"), 'kind': 'folder', 'data': data})
         return None
     
+    @_mutation
     def delete_file(self, path: str, name: str) -> bool:
         """Elimina un archivo"""
         folder = self.get_path(path)
-        if folder and folder.delete_file(name):
-            self.save()
-            return True
+        if folder and name in folder.files:
+            return self._commit({'op': 'delete', 'path': path.strip("/"), 'kind': 'file', 'name': name})
         return False
     
+    @_mutation
     def save_file(self, path: str, name: str, content: str) -> bool:
         """Guarda o actualiza el contenido de un archivo"""
         folder = self.get_path(path)
         if folder:
             file = folder.get_file(name)
             if file:
-                file.update_content(content)
-                self.save()
-                return True
+                return self._commit({'op': 'update', 'path': path.strip("/"), 'name': name,
+                                     'blob': self.blobs.put(content), 'size': len(content),
+                                     'modified_at': datetime.now().isoformat()})
         return False
     
+    @_mutation
+    def copy_file(self, path: str, name: str, dest_path: str,
+                  new_name: Optional[str] = None) -> Optional[VirtualFile]:
+        """Copia un archivo; el contenido no se duplica (la copia usa el mismo blob)
+        
+        Args:
+            path: Ruta donde está el archivo
+            name: Nombre del archivo
+            dest_path: Carpeta destino
+            new_name: Nombre de la copia (por defecto el mismo)
+            
+        Returns:
+            La copia, o None si el archivo o la carpeta destino no existen
+        """
+        folder = self.get_path(path)
+        if not folder or not self.get_path(dest_path) or name not in folder.files:
+            return None
+        
+        source = folder.files[name]
+        copy = VirtualFile(new_name or name, "", source.file_type)
+        copy.set_blob(source.blob, source.size, self.blobs)
+        return self._commit({'op': 'create', 'path': dest_path.strip("/"), 'kind': 'file',
+                             'data': copy.to_dict()})
+    
     def list_directory(self, path: str) -> Optional[Dict]:
         """Lista el contenido de una carpeta"""
         folder = self.get_path(path)
@@ -271,6 +860,7 @@ class VirtualFilesystem:
             return folder.list_contents()
         return None
     
+    @_mutation
     def move_to_trash(self, path: str, name: str, is_folder: bool = False) -> bool:
         """Mueve un archivo o carpeta a la papelera
         
@@ -278,7 +868,7 @@ class VirtualFilesystem:
             path: Ruta donde está el elemento
             name: Nombre del elemento
             is_folder: True si es una carpeta, False si es archivo
-            
+        
         Returns:
             True si fue exitoso, False en caso contrario
         """
@@ -291,37 +881,27 @@ class VirtualFilesystem:
             if not trash:
                 return False
             
+            if name not in (folder.folders if is_folder else folder.files):
+                return False
+            
             # Guardar ruta original
             original_path = f"/{path}" if path else "/"
             
-            if is_folder:
-                # Mover carpeta
-                if name not in folder.folders:
-                    return False
-                target = folder.folders.pop(name)
-                target.original_path = original_path
-                trash.folders[name] = target
-            else:
-                # Mover archivo
-                if name not in folder.files:
-                    return False
-                target = folder.files.pop(name)
-                target.original_path = original_path
-                trash.files[name] = target
-            
-            self.save()
-            return True
+            return self._commit({'op': 'move', 'path': path.strip("/"), 'name': name,
+                                 'kind': 'folder' if is_folder else 'file',
+                                 'dest': "Papelera", 'original_path': original_path})
         except Exception as e:
             print(f"Error moviendo a papelera: {e}")
             return False
     
+    @_mutation
     def restore_from_trash(self, name: str, is_folder: bool = False) -> bool:
         """Restaura un archivo o carpeta desde la papelera
         
         Args:
             name: Nombre del elemento a restaurar
             is_folder: True si es una carpeta
-            
+        
         Returns:
             True si fue exitoso
         """
@@ -330,36 +910,24 @@ class VirtualFilesystem:
             if not trash:
                 return False
             
-            if is_folder:
-                if name not in trash.folders:
-                    return False
-                target = trash.folders.pop(name)
-                original_path = target.original_path or ""
-            else:
-                if name not in trash.files:
-                    return False
-                target = trash.files.pop(name)
-                original_path = target.original_path or ""
+            items = trash.folders if is_folder else trash.files
+            if name not in items:
+                return False
+            original_path = (items[name].original_path or "").strip("/")
             
             # Restaurar a la ruta original
-            dest = self.get_path(original_path)
-            if not dest:
+            if not self.get_path(original_path):
                 # Si la ruta original no existe, restaurar a raíz
-                dest = self.root
+                original_path = ""
             
-            if is_folder:
-                target.original_path = None
-                dest.folders[name] = target
-            else:
-                target.original_path = None
-                dest.files[name] = target
-            
-            self.save()
-            return True
+            return self._commit({'op': 'restore', 'path': "Papelera", 'name': name,
+                                 'kind': 'folder' if is_folder else 'file',
+                                 'dest': original_path, 'original_path': None})
         except Exception as e:
             print(f"Error restaurando de papelera: {e}")
             return False
     
+    @_mutation
     def empty_trash(self) -> bool:
         """Vacía completamente la papelera"""
         try:
@@ -367,21 +935,19 @@ class VirtualFilesystem:
             if not trash:
                 return False
             
-            trash.files.clear()
-            trash.folders.clear()
-            self.save()
-            return True
+            return self._commit({'op': 'delete', 'path': "Papelera", 'kind': 'all', 'name': None})
         except Exception as e:
             print(f"Error vaciando papelera: {e}")
             return False
     
+    @_mutation
     def create_nested_folder(self, path: str, nested_path: str) -> Optional[VirtualFolder]:
         """Crea carpetas anidadas (ej: mkdir a/b/c desde raíz)
         
         Args:
             path: Ruta base donde crear
             nested_path: Ruta anidada (ej: "a/b/c")
-            
+        
         Returns:
             La última carpeta creada o None si falla
         """
@@ -390,15 +956,17 @@ class VirtualFilesystem:
             if not current:
                 return None
             
+            current_path = path.strip("/")
             parts = nested_path.strip("/").split("/")
             for part in parts:
                 if part:
                     folder = current.get_folder(part)
                     if not folder:
-                        folder = current.create_folder(part)
+                        folder = self._commit({'op': 'create', 'path': current_path, 'kind': 'folder',
+                                               'data': VirtualFolder(part).to_dict()})
                     current = folder
+                    current_path = f"{current_path}/{part}" if current_path else part
             
-            self.save()
             return current
         except Exception as e:
             print(f"Error creando carpetas anidadas: {e}")
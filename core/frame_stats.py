@@ -0,0 +1,86 @@
+"""
+Frame Stats - Tiempos por frame de cada fase y componente del sistema
+"""
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+class FrameStats:
+    """Acumula tiempos por componente y los agrupa por frame
+
+    Un componente puede medirse varias veces dentro del mismo frame (por
+    ejemplo una app que se redibuja en dos regiones); esos tiempos se suman
+    y se guardan como una sola muestra al cerrar el frame.
+    """
+
+    def __init__(self, max_samples: Optional[int] = None):
+        """Inicializa las estadísticas
+
+        Args:
+            max_samples: Muestras por componente (None = sin límite)
+        """
+        self.max_samples = max_samples
+        self.samples: Dict[str, Deque[float]] = {}
+        self._current: Dict[str, float] = {}
+        self.frame_count = 0
+
+    def begin_frame(self):
+        """Empieza a acumular los tiempos de un nuevo frame"""
+        self._current = {}
+
+    def add(self, name: str, seconds: float):
+        """Suma un tiempo medido al componente dentro del frame actual
+
+        Args:
+            name: Nombre del componente (ej: "render.desktop")
+            seconds: Duración en segundos
+        """
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def end_frame(self):
+        """Cierra el frame y guarda una muestra por componente medido"""
+        for name, seconds in self._current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.max_samples)
+            self.samples[name].append(seconds)
+        self._current = {}
+        self.frame_count += 1
+
+    def percentile(self, name: str, pct: float) -> float:
+        """Devuelve el percentil de un componente en segundos
+
+        Args:
+            name: Nombre del componente
+            pct: Percentil entre 0 y 100
+        """
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return 0.0
+        # Rango más cercano: el menor valor con al menos pct% de muestras <= él
+        index = min(len(values) - 1, max(0, math.ceil(pct * len(values) / 100) - 1))
+        return values[index]
+
+    def get_names(self) -> List[str]:
+        """Devuelve los componentes medidos, ordenados por nombre"""
+        return sorted(self.samples)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Resume cada componente con p50/p95/p99 y máximo en milisegundos"""
+        result = {}
+        for name in self.get_names():
+            values = self.samples[name]
+            result[name] = {
+                'count': len(values),
+                'p50': self.percentile(name, 50) * 1000,
+                'p95': self.percentile(name, 95) * 1000,
+                'p99': self.percentile(name, 99) * 1000,
+                'max': max(values) * 1000,
+            }
+        return result
+
+    def reset(self):
+        """Descarta todas las muestras"""
+        self.samples.clear()
+        self._current = {}
+        self.frame_count = 0
@@ -0,0 +1,67 @@
+"""
+Hit Test - Índice espacial para resolver qué hay bajo el puntero
+
+Las regiones se guardan en una rejilla de celdas fijas. Cada celda
+conoce solo las regiones que la tocan, ordenadas de arriba abajo, así
+que una consulta mira una celda en lugar de recorrer todas las ventanas,
+iconos o entradas de menú. El índice solo se reconstruye cuando cambia
+la geometría.
+"""
+import pygame
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.settings import HIT_GRID_CELL
+
+
+class HitIndex:
+    """Rejilla de regiones ordenadas por z"""
+
+    def __init__(self, cell_size: int = HIT_GRID_CELL):
+        """Inicializa un índice vacío
+
+        Args:
+            cell_size: Lado de cada celda en píxeles
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, pygame.Rect, Any]]] = {}
+        self.dirty = True
+
+    def invalidate(self):
+        """Marca el índice para reconstruirlo antes de la próxima consulta"""
+        self.dirty = True
+
+    def rebuild(self, regions: Iterable[Tuple[pygame.Rect, Any]]):
+        """Reconstruye el índice
+
+        Args:
+            regions: Pares (rect, objetivo) de abajo hacia arriba; una región
+                     posterior tapa a las anteriores
+        """
+        cells: Dict[Tuple[int, int], List[Tuple[int, pygame.Rect, Any]]] = {}
+        size = self.cell_size
+        for z, (rect, target) in enumerate(regions):
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            rect = pygame.Rect(rect)
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    cells.setdefault((cx, cy), []).append((z, rect, target))
+
+        # De arriba abajo: la primera región que contiene el punto es la visible
+        for entries in cells.values():
+            entries.reverse()
+        self._cells = cells
+        self.dirty = False
+
+    def hit(self, pos: Tuple[int, int]) -> Optional[Any]:
+        """Devuelve el objetivo más alto bajo `pos`, o None"""
+        for _, rect, target in self._cells.get((pos[0] // self.cell_size,
+                                               pos[1] // self.cell_size), ()):
+            if rect.collidepoint(pos):
+                return target
+        return None
+
+    def hit_all(self, pos: Tuple[int, int]) -> List[Any]:
+        """Devuelve todos los objetivos bajo `pos`, de arriba abajo"""
+        return [target for _, rect, target in
+                self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ())
+                if rect.collidepoint(pos)]
@@ -3,10 +3,12 @@ Plugin Manager - Sistema modular para cargar mods y aplicaciones
 Inspirado en el sistema de plugins de Linux
 """
 import os
+import time
 import importlib.util
 import inspect
-from typing import List, Dict, Type, Optional, Tuple
-from config.settings import MODS_DIR
+from typing import Callable, List, Dict, Type, Optional, Tuple, Union
+from config.settings import (MODS_DIR, IMGS_DIR, APP_RENDER_BUDGET_MS, APP_UPDATE_BUDGET_MS,
+                             APP_DEGRADED_INTERVAL)
 
 
 class Application:
@@ -15,6 +17,18 @@ class Application:
     Los mods deben heredar de esta clase para ser cargados correctamente
     """
     
+    # Si es False el compositor redibuja el contenido en cada frame.
+    # Las apps que llaman a invalidate() cuando cambian pueden activarlo.
+    damage_tracking = False
+    
+    # Segundos entre frames de una app sin damage_tracking (0.0 = cada frame).
+    # Las apps que no necesitan animación fluida pueden subirlo.
+    frame_interval = 0.0
+    
+    # Tipos de evento de pygame que recibe handle_event mientras la app
+    # está enfocada (None = todos)
+    event_types = None
+    
     def __init__(self, name: str = "Unnamed App", icon_path: Optional[str] = None,
                  color: Optional[Tuple[int, int, int]] = None, app_id: Optional[str] = None):
         """Inicializa una aplicación
@@ -31,6 +45,12 @@ class Application:
         self.color = color
         self.window = None
         self.is_running = False
+        self.needs_redraw = True
+        self.theme_manager = None  # Lo asigna el PluginManager al lanzar la app
+    
+    def invalidate(self):
+        """Solicita redibujar el contenido de la app en el próximo frame"""
+        self.needs_redraw = True
     
     # Métodos opcionales que pueden ser implementados en subclases
     def load_file(self, path: str, filename: str) -> None:
@@ -49,6 +69,40 @@ class Application:
         """Asigna el filesystem (implementar en subclases)"""
         pass
     
+    def get_font(self, size: int, style: str = "regular"):
+        """Obtiene una fuente Monocraft del caché compartido del ThemeManager
+        
+        Args:
+            size: Tamaño de la fuente
+            style: regular, bold, italic o bold_italic
+        """
+        return self.theme_manager.get_font_at(size, style=style)
+    
+    def render_text(self, font, text: str, color, antialias: bool = True):
+        """Renderiza texto usando el caché compartido del ThemeManager
+        
+        Args:
+            font: Fuente con la que renderizar
+            text: Texto a renderizar
+            color: Color del texto
+            antialias: Si se suavizan los bordes
+        """
+        return self.theme_manager.render_text(font, text, color, antialias)
+    
+    def load_image(self, path: str, size: Optional[Tuple[int, int]] = None,
+                   smooth: bool = True):
+        """Carga una imagen a través del AssetLoader compartido del ThemeManager
+        
+        Args:
+            path: Ruta del archivo
+            size: Tamaño deseado (None = tamaño original)
+            smooth: smoothscale si es True; sin suavizar (pixel art) si no
+            
+        Returns:
+            Superficie compartida (no dibujar sobre ella), o None si no existe
+        """
+        return self.theme_manager.assets.load(path, size, smooth)
+    
     def on_open(self):
         """Llamado cuando se abre la aplicación"""
         pass
@@ -57,6 +111,17 @@ class Application:
         """Llamado cuando se cierra la aplicación"""
         pass
     
+    def on_visibility_changed(self, visible: bool):
+        """Llamado cuando la ventana queda tapada, fuera de pantalla o minimizada
+        
+        Mientras no es visible el motor no llama a render(); las apps pueden
+        aprovecharlo para pausar trabajo costoso.
+        
+        Args:
+            visible: True si alguna parte de la ventana vuelve a verse
+        """
+        pass
+    
     def update(self, dt: float):
         """Actualiza el estado de la aplicación
         
@@ -65,6 +130,20 @@ class Application:
         """
         pass
     
+    def next_deadline(self):
+        """Segundos hasta que la app necesite otro frame (None = ninguno)
+        
+        Mientras ninguna app ni ventana pida un frame, el sistema duerme
+        esperando eventos. Por defecto las apps sin damage_tracking
+        piden frames continuos (cada frame_interval), y ninguno mientras su
+        ventana está minimizada o tapada.
+        """
+        if self.damage_tracking:
+            return None
+        if self.window is not None and not self.window.is_visible:
+            return None
+        return self.frame_interval
+    
     def render(self, surface, rect):
         """Renderiza el contenido de la aplicación
         
@@ -83,6 +162,143 @@ class Application:
         pass
 
 
+class AppDescriptor:
+    """Datos de una app registrada, sin construirla
+    
+    El menú de inicio, el escritorio y el launcher de la terminal trabajan
+    con el descriptor; la Application se crea la primera vez que se abre.
+    """
+    
+    def __init__(self, app_id: str, name: str, color: Optional[Tuple[int, int, int]],
+                 factory: Callable[[], Application], icon_path: Optional[str] = None):
+        """Inicializa el descriptor
+        
+        Args:
+            app_id: Identificador estable de la app
+            name: Nombre visible
+            color: Color de acento pastel
+            factory: Función sin argumentos que crea la Application
+            icon_path: Ruta al icono (por defecto assets/imgs/icon_<app_id>.png)
+        """
+        self.app_id = app_id
+        self.name = name
+        self.color = color
+        self.factory = factory
+        self.icon_path = icon_path or os.path.join(IMGS_DIR, f"icon_{app_id}.png")
+        self.instance: Optional[Application] = None
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Indica si la app ya se construyó"""
+        return self.instance is not None
+    
+    @property
+    def is_running(self) -> bool:
+        """Indica si la app está abierta (sin construirla)"""
+        return self.instance is not None and self.instance.is_running
+
+
+class AppStats:
+    """Tiempos de render/update de una app medidos por el motor
+    
+    Si la media supera el presupuesto la app queda degradada: se dibuja y
+    actualiza cada APP_DEGRADED_INTERVAL segundos y entre medias el motor
+    reutiliza la última imagen de su contenido. Se recupera cuando la media
+    baja de la mitad del presupuesto.
+    """
+    
+    SMOOTHING = 0.2  # Peso de cada muestra en la media móvil
+    WARMUP_CALLS = 10  # Muestras antes de juzgar (el primer render suele ser lento)
+    
+    def __init__(self):
+        self.render_avg = 0.0  # Segundos, media móvil exponencial
+        self.update_avg = 0.0
+        self.render_max = 0.0
+        self.update_max = 0.0
+        self.render_calls = 0
+        self.update_calls = 0
+        self.degraded = False
+        self.last_render = 0.0  # time.monotonic() del último render real
+        self._pending_update_dt = 0.0
+    
+    def record(self, phase: str, seconds: float) -> bool:
+        """Registra una medición
+        
+        Args:
+            phase: "render" o "update"
+            seconds: Duración medida
+            
+        Returns:
+            True si la app cambió de estado (degradada o recuperada)
+        """
+        if phase == "render":
+            self.render_calls += 1
+            self.render_max = max(self.render_max, seconds)
+            self.render_avg = self._smooth(self.render_avg, seconds, self.render_calls)
+            self.last_render = time.monotonic()
+        else:
+            self.update_calls += 1
+            self.update_max = max(self.update_max, seconds)
+            self.update_avg = self._smooth(self.update_avg, seconds, self.update_calls)
+        return self._check_budget()
+    
+    def _smooth(self, avg: float, seconds: float, calls: int) -> float:
+        if calls == 1:
+            return seconds
+        return avg + (seconds - avg) * self.SMOOTHING
+    
+    def _check_budget(self) -> bool:
+        render_budget = APP_RENDER_BUDGET_MS / 1000
+        update_budget = APP_UPDATE_BUDGET_MS / 1000
+        if not self.degraded:
+            over = ((self.render_calls >= self.WARMUP_CALLS and self.render_avg > render_budget) or
+                    (self.update_calls >= self.WARMUP_CALLS and self.update_avg > update_budget))
+            if over:
+                self.degraded = True
+                return True
+        elif self.render_avg < render_budget / 2 and self.update_avg < update_budget / 2:
+            self.degraded = False
+            return True
+        return False
+    
+    def render_due(self) -> bool:
+        """Indica si una app degradada ya puede volver a dibujarse"""
+        return self.time_until_render() <= 0
+    
+    def time_until_render(self) -> float:
+        """Segundos hasta el próximo render permitido"""
+        if not self.degraded:
+            return 0.0
+        return max(0.0, self.last_render + APP_DEGRADED_INTERVAL - time.monotonic())
+    
+    def take_update_dt(self, dt: float) -> Optional[float]:
+        """Acumula el tiempo de update de una app degradada
+        
+        Args:
+            dt: Duración del tick
+            
+        Returns:
+            dt a pasar a Application.update, o None si aún no le toca
+        """
+        self._pending_update_dt += dt
+        if self.degraded and self._pending_update_dt < APP_DEGRADED_INTERVAL:
+            return None
+        dt, self._pending_update_dt = self._pending_update_dt, 0.0
+        return dt
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Resumen en milisegundos"""
+        return {
+            'render_avg_ms': self.render_avg * 1000,
+            'render_max_ms': self.render_max * 1000,
+            'render_calls': self.render_calls,
+            'update_avg_ms': self.update_avg * 1000,
+            'update_max_ms': self.update_max * 1000,
+            'update_calls': self.update_calls,
+            'degraded': self.degraded,
+        }
+
+
 class PluginManager:
     """Gestiona la carga y ejecución de plugins/mods"""
     
@@ -93,9 +309,12 @@ class PluginManager:
             os_ref: Referencia al objeto PixelOS principal
         """
         self.os_ref = os_ref
-        self.plugins: Dict[str, Application] = {}
+        self.plugins: Dict[str, Application] = {}  # Apps ya construidas, por app_id
+        self.descriptors: Dict[str, AppDescriptor] = {}  # Apps registradas, por app_id
         self.plugin_classes: List[Type[Application]] = []
+        self._pending_plugins: List[Tuple[str, str, bytes]] = []  # Leídos, sin ejecutar
         self.should_shutdown = False  # Flag para solicitar apagado
+        self.app_stats: Dict[Application, AppStats] = {}  # Tiempos medidos por el motor
         
         # Crear directorio de mods si no existe
         if not os.path.exists(MODS_DIR):
@@ -129,8 +348,8 @@ class MiAplicacion(Application):
         print(f"{self.name} abierta!")
     
     def render(self, surface, rect):
-        # Dibuja tu UI aquí
-        font = pygame.font.Font(None, 24)
+        # Dibuja tu UI aquí (las fuentes salen del caché compartido)
+        font = self.get_font(24)
         text = font.render("¡Hola desde mi mod!", True, (80, 70, 100))
         surface.blit(text, (rect.x + 20, rect.y + 20))
 ```
@@ -138,7 +357,7 @@ class MiAplicacion(Application):
 ## Características Disponibles
 
 - Acceso al sistema de ventanas
-- Eventos de mouse y teclado
+- Eventos de mouse y teclado (`event_types` limita los que recibe la app)
 - Renderizado personalizado
 - Colores pastel predefinidos
 - Fuente Monocraft integrada
@@ -146,42 +365,89 @@ class MiAplicacion(Application):
 ¡Diviértete creando! 🎨
 """)
     
-    def load_plugins(self):
-        """Carga todos los plugins desde el directorio de mods"""
+    def load_plugins(self, report: Optional[Callable[[float], None]] = None):
+        """Carga todos los plugins desde el directorio de mods
+        
+        Args:
+            report: Función opcional que recibe el avance (0.0 a 1.0)
+        """
+        self.discover_plugins()
+        self.exec_plugins(report)
+    
+    def discover_plugins(self, report: Optional[Callable[[float], None]] = None):
+        """Busca los mods y lee su código, sin ejecutarlo
+        
+        Solo hace E/S, así que puede correr en un hilo de trabajo; el código
+        se ejecuta después con exec_plugins() desde el hilo principal.
+        
+        Args:
+            report: Función opcional que recibe el avance (0.0 a 1.0)
+        """
         if not os.path.exists(MODS_DIR):
             return
         
         print("\n🔍 Buscando mods...")
         
         # Buscar archivos .py en el directorio de mods
-        for item in os.listdir(MODS_DIR):
+        items = os.listdir(MODS_DIR)
+        for index, item in enumerate(items):
+            if report:
+                report(index / len(items))
             item_path = os.path.join(MODS_DIR, item)
             
-            # Cargar módulos Python
+            # Módulos Python
             if item.endswith('.py') and item != '__init__.py':
-                self._load_plugin_file(item_path, item[:-3])
+                self._read_plugin_file(item_path, item[:-3])
             
-            # Cargar desde subdirectorios
+            # Subdirectorios con main.py
             elif os.path.isdir(item_path):
                 main_file = os.path.join(item_path, 'main.py')
                 if os.path.exists(main_file):
-                    self._load_plugin_file(main_file, item)
+                    self._read_plugin_file(main_file, item)
+    
+    def exec_plugins(self, report: Optional[Callable[[float], None]] = None):
+        """Ejecuta los mods leídos por discover_plugins() (hilo principal)
+        
+        Args:
+            report: Función opcional que recibe el avance (0.0 a 1.0)
+        """
+        pending, self._pending_plugins = self._pending_plugins, []
+        for index, (module_name, file_path, source) in enumerate(pending):
+            if report:
+                report(index / len(pending))
+            self._load_plugin_file(file_path, module_name, source)
         
         print(f"✅ {len(self.plugin_classes)} plugin(s) cargado(s)\n")
     
-    def _load_plugin_file(self, file_path: str, module_name: str):
-        """Carga un archivo de plugin
+    def _read_plugin_file(self, file_path: str, module_name: str):
+        """Lee el código de un plugin para ejecutarlo más tarde
         
         Args:
             file_path: Ruta al archivo Python
             module_name: Nombre del módulo
         """
         try:
-            # Cargar el módulo dinámicamente
+            with open(file_path, 'rb') as f:
+                source = f.read()
+        except OSError as e:
+            print(f"  ❌ Error leyendo {module_name}: {e}")
+            return
+        self._pending_plugins.append((module_name, file_path, source))
+    
+    def _load_plugin_file(self, file_path: str, module_name: str, source: bytes):
+        """Ejecuta el código de un plugin y registra sus aplicaciones
+        
+        Args:
+            file_path: Ruta al archivo Python
+            module_name: Nombre del módulo
+            source: Código leído por _read_plugin_file
+        """
+        try:
+            # Crear el módulo dinámicamente a partir del código ya leído
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                exec(compile(source, file_path, 'exec'), module.__dict__)
                 
                 # Buscar clases que hereden de Application
                 for name, obj in inspect.getmembers(module, inspect.isclass):
@@ -209,18 +475,57 @@ class MiAplicacion(Application):
             print(f"❌ Error creando instancia de {plugin_class.__name__}: {e}")
             return None
     
-    def launch_app(self, app: Application):
+    def register_app(self, descriptor: AppDescriptor):
+        """Registra una app sin construirla
+        
+        Args:
+            descriptor: Descriptor de la app
+        """
+        self.descriptors[descriptor.app_id] = descriptor
+    
+    def get_app(self, app_id: str) -> Optional[Application]:
+        """Devuelve la app de un id, construyéndola la primera vez
+        
+        Args:
+            app_id: Identificador de la app
+            
+        Returns:
+            Instancia de la aplicación, o None si no existe o falla al crearse
+        """
+        app = self.plugins.get(app_id)
+        if app is not None:
+            return app
+        
+        descriptor = self.descriptors.get(app_id)
+        if descriptor is None:
+            return None
+        try:
+            app = descriptor.factory()
+        except Exception as e:
+            print(f"❌ Error creando la app {descriptor.name}: {e}")
+            return None
+        descriptor.instance = app
+        self.plugins[app_id] = app
+        return app
+    
+    def launch_app(self, app: Union[Application, AppDescriptor]):
         """Lanza una aplicación
         
         Args:
-            app: Aplicación a lanzar
+            app: Aplicación a lanzar, o su descriptor (se construye si hace falta)
         """
+        if isinstance(app, AppDescriptor):
+            app = self.get_app(app.app_id)
+            if app is None:
+                return
+        
         if not app.is_running:
             app.is_running = True
             
             # Asignar filesystem si la app lo soporta
             if hasattr(app, 'set_filesystem'):
                 app.set_filesystem(self.os_ref.filesystem)
+            app.theme_manager = self.os_ref.theme_manager
             
             # Crear ventana para la aplicación
             window = self.os_ref.window_manager.create_window(
@@ -234,6 +539,44 @@ class MiAplicacion(Application):
             app.window = window
             app.on_open()
     
+    def get_app_stats(self, app: Application) -> AppStats:
+        """Obtiene (o crea) las estadísticas de una app
+        
+        Args:
+            app: Instancia de la aplicación
+        """
+        stats = self.app_stats.get(app)
+        if stats is None:
+            stats = self.app_stats[app] = AppStats()
+        return stats
+    
+    def record_app_time(self, app: Application, phase: str, seconds: float):
+        """Registra el tiempo de render o update de una app y aplica el presupuesto
+        
+        Args:
+            app: Aplicación medida
+            phase: "render" o "update"
+            seconds: Duración medida
+        """
+        stats = self.get_app_stats(app)
+        if stats.record(phase, seconds):
+            if stats.degraded:
+                print(f"⚠️ {app.name} supera su presupuesto de frame "
+                      f"(render {stats.render_avg * 1000:.1f} ms, update {stats.update_avg * 1000:.1f} ms); "
+                      f"se dibujará a ritmo reducido")
+            else:
+                print(f"✅ {app.name} vuelve a su ritmo normal")
+    
+    def is_app_degraded(self, app: Optional[Application]) -> bool:
+        """Indica si una app está degradada por exceder su presupuesto"""
+        stats = self.app_stats.get(app) if app is not None else None
+        return bool(stats and stats.degraded)
+    
+    def get_all_app_stats(self) -> Dict[str, Dict[str, float]]:
+        """Devuelve las estadísticas de las apps abiertas, por app_id"""
+        return {app.app_id: stats.to_dict()
+                for app, stats in self.app_stats.items() if app.is_running}
+    
     def get_plugin_classes(self) -> List[Type[Application]]:
         """Obtiene todas las clases de plugins cargadas
         
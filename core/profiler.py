@@ -0,0 +1,188 @@
+"""
+Profiler - Panel superpuesto con los tiempos de cada frame
+
+Muestra las fases (eventos, update, render) y el desglose por ventana,
+app, barra de tareas y escritorio, con un histograma de los últimos
+frames y el componente más lento resaltado.
+"""
+import datetime
+import json
+import os
+import pygame
+from typing import List, Optional
+from config.settings import *
+from core.frame_stats import FrameStats
+
+
+class ProfilerOverlay:
+    """Panel de profiling que se activa con una tecla"""
+
+    PHASES = ["events", "update", "render", "frame"]
+    WIDTH = 440
+    ROW_HEIGHT = 16
+    MAX_ROWS = 14
+    HISTOGRAM_WIDTH = 90
+    P50_RIGHT = 280  # Borde derecho de las columnas de tiempos
+    P95_RIGHT = 330
+    BG_COLOR = (20, 15, 30, 220)
+
+    def __init__(self, screen: pygame.Surface, theme_manager,
+                 history: int = PROFILER_HISTORY):
+        """Inicializa el profiler
+
+        Args:
+            screen: Superficie principal
+            theme_manager: Gestor de temas (fuentes y texto cacheado)
+            history: Frames recordados por componente
+        """
+        self.screen = screen
+        self.theme_manager = theme_manager
+        self.stats = FrameStats(max_samples=history)
+        self.visible = False
+        self.budget = 1.0 / RENDER_FPS_CAP
+        self.rect = pygame.Rect(SCREEN_WIDTH - self.WIDTH - 10, 10, self.WIDTH, 0)
+        self._panel: Optional[pygame.Surface] = None
+        self._since_refresh = PROFILER_REFRESH
+        self._damage: List[pygame.Rect] = []
+
+    def toggle(self):
+        """Muestra u oculta el panel; al mostrarlo empieza a medir de cero"""
+        self.visible = not self.visible
+        self._damage.append(self.rect.copy())
+        if self.visible:
+            self.stats.reset()
+            self._since_refresh = PROFILER_REFRESH
+        else:
+            self._panel = None
+
+    def update(self, dt: float):
+        """Reconstruye el panel cada PROFILER_REFRESH segundos"""
+        if not self.visible:
+            return
+        self._since_refresh += dt
+        if self._since_refresh >= PROFILER_REFRESH:
+            self._since_refresh = 0.0
+            old_rect = self.rect.copy()
+            self._panel = self._build_panel()
+            self._damage.extend([old_rect, self.rect.copy()])
+
+    def next_deadline(self) -> Optional[float]:
+        """Segundos hasta el próximo refresco del panel"""
+        if not self.visible:
+            return None
+        return max(0.0, PROFILER_REFRESH - self._since_refresh)
+
+    def collect_damage(self) -> List[pygame.Rect]:
+        """Devuelve las regiones del panel que cambiaron desde el último frame"""
+        damage = [r for r in self._damage if r.width > 0 and r.height > 0]
+        self._damage = []
+        return damage
+
+    def get_worst_offender(self) -> Optional[str]:
+        """Devuelve el componente con peor p95 (sin contar las fases)"""
+        names = [n for n in self.stats.get_names() if n not in self.PHASES]
+        if not names:
+            return None
+        return max(names, key=lambda n: self.stats.percentile(n, 95))
+
+    def _build_panel(self) -> pygame.Surface:
+        """Dibuja el panel completo en una superficie propia"""
+        font = self.theme_manager.get_font(FONT_SIZE_SMALL)
+        budget_ms = self.budget * 1000
+
+        components = [n for n in self.stats.get_names() if n not in self.PHASES]
+        components.sort(key=lambda n: self.stats.percentile(n, 95), reverse=True)
+        components = components[:self.MAX_ROWS]
+        worst = components[0] if components else None
+
+        rows = 2 + len(self.PHASES) + 1 + len(components)
+        height = rows * self.ROW_HEIGHT + 12
+        self.rect.height = height
+
+        panel = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        panel.fill(self.BG_COLOR)
+        pygame.draw.rect(panel, Colors.PURPLE, panel.get_rect(), width=1)
+
+        y = 6
+        # Los textos con números cambian en cada refresco: se dibujan sin el
+        # caché compartido para no llenarlo de entradas que no se repiten
+        header = f"Profiler  {self.stats.frame_count} frames  (presupuesto {budget_ms:.1f} ms)"
+        panel.blit(font.render(header, True, Colors.BLUE), (8, y))
+        y += self.ROW_HEIGHT
+        for label, right in (("p50", self.P50_RIGHT), ("p95", self.P95_RIGHT)):
+            text = self.theme_manager.render_text(font, label, Colors.TEXT_SECONDARY)
+            panel.blit(text, text.get_rect(topright=(right, y)))
+        y += self.ROW_HEIGHT
+
+        for name in self.PHASES:
+            self._draw_row(panel, font, name, y, highlight=False)
+            y += self.ROW_HEIGHT
+        y += self.ROW_HEIGHT // 2
+
+        for name in components:
+            self._draw_row(panel, font, name, y, highlight=(name == worst))
+            y += self.ROW_HEIGHT
+
+        return panel
+
+    def _draw_row(self, panel: pygame.Surface, font, name: str, y: int, highlight: bool):
+        """Dibuja una fila: nombre, p50, p95 e histograma de los últimos frames"""
+        p50 = self.stats.percentile(name, 50) * 1000
+        p95 = self.stats.percentile(name, 95) * 1000
+
+        if highlight:
+            pygame.draw.rect(panel, (120, 40, 70), (2, y - 1, self.WIDTH - 4, self.ROW_HEIGHT))
+        color = Colors.PINK if highlight else Colors.BACKGROUND
+
+        label = name if len(name) <= 28 else name[:27] + "~"
+        panel.blit(self.theme_manager.render_text(font, label, color), (8, y))
+        for value, right in ((p50, self.P50_RIGHT), (p95, self.P95_RIGHT)):
+            text = font.render(f"{value:.2f}", True, color)
+            panel.blit(text, text.get_rect(topright=(right, y)))
+
+        # Histograma: una barra por frame, escala = presupuesto del frame
+        samples = list(self.stats.samples.get(name, ()))[-self.HISTOGRAM_WIDTH:]
+        bar_height = self.ROW_HEIGHT - 4
+        left = self.WIDTH - self.HISTOGRAM_WIDTH - 8
+        bottom = y + bar_height
+        for i, seconds in enumerate(samples):
+            h = max(1, min(bar_height, int(bar_height * seconds / self.budget)))
+            bar_color = Colors.PINK if seconds > self.budget else Colors.GREEN
+            pygame.draw.line(panel, bar_color, (left + i, bottom), (left + i, bottom - h + 1))
+
+    def render(self, clip: Optional[pygame.Rect] = None):
+        """Dibuja el panel sobre la pantalla
+
+        Args:
+            clip: Región que se está redibujando (None = toda la pantalla)
+        """
+        if not self.visible or self._panel is None:
+            return
+        if clip is not None and not clip.colliderect(self.rect):
+            return
+        self.screen.blit(self._panel, self.rect.topleft)
+
+    def dump(self, directory: str = PROFILES_DIR) -> str:
+        """Guarda el perfil actual en un archivo JSON
+
+        Args:
+            directory: Carpeta de destino
+
+        Returns:
+            Ruta del archivo creado
+        """
+        os.makedirs(directory, exist_ok=True)
+        now = datetime.datetime.now()
+        path = os.path.join(directory, f"profile_{now.strftime('%Y%m%d_%H%M%S')}.json")
+        data = {
+            'created': now.isoformat(timespec='seconds'),
+            'frames': self.stats.frame_count,
+            'budget_ms': self.budget * 1000,
+            'worst_offender': self.get_worst_offender(),
+            'summary': self.stats.summary(),
+            'samples_ms': {name: [s * 1000 for s in values]
+                           for name, values in self.stats.samples.items()},
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
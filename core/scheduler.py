@@ -0,0 +1,73 @@
+"""
+Frame Scheduler - Bucle principal consciente de la inactividad
+
+En lugar de dibujar siempre a FPS fijos, el bucle duerme esperando eventos
+hasta que algún componente pide un frame (animación, cursor, reloj...).
+"""
+import time
+import pygame
+from typing import List, Optional, Tuple
+from config.settings import *
+
+
+class FrameScheduler:
+    """Decide cuándo debe ejecutarse el siguiente frame"""
+
+    def __init__(self, fps: int = RENDER_FPS_CAP, max_idle_wait: float = IDLE_MAX_WAIT):
+        """Inicializa el planificador
+
+        Args:
+            fps: Frames por segundo mientras hay animaciones
+            max_idle_wait: Espera máxima sin eventos, en segundos
+        """
+        self.fps = fps
+        self.max_idle_wait = max_idle_wait
+        self.clock = pygame.time.Clock()
+        self._next_deadline: Optional[float] = None
+        self.idle_time = 0.0  # Segundos dormidos antes del último frame
+
+    def schedule_in(self, seconds: Optional[float]):
+        """Registra que un componente necesita un frame dentro de `seconds`
+
+        Args:
+            seconds: Segundos hasta el próximo frame necesario
+                     (0 = animando, None = no necesita nada)
+        """
+        if seconds is None:
+            return
+        deadline = time.monotonic() + max(0.0, seconds)
+        if self._next_deadline is None or deadline < self._next_deadline:
+            self._next_deadline = deadline
+
+    def is_idle(self) -> bool:
+        """Indica si ningún componente necesita un frame inmediato"""
+        return self._next_deadline is None or self._next_deadline > time.monotonic()
+
+    def wait(self) -> Tuple[float, List[pygame.event.Event]]:
+        """Espera hasta el próximo frame
+
+        Si algo está animando se limita a `fps`. Si no, bloquea en
+        pygame.event.wait hasta que llegue un evento o venza el plazo
+        más próximo.
+
+        Returns:
+            (dt en segundos desde el frame anterior, eventos ya recibidos)
+        """
+        events: List[pygame.event.Event] = []
+        self.idle_time = 0.0
+
+        if self.is_idle():
+            timeout = self.max_idle_wait
+            if self._next_deadline is not None:
+                timeout = min(timeout, self._next_deadline - time.monotonic())
+            start = time.monotonic()
+            event = pygame.event.wait(max(1, int(timeout * 1000)))
+            self.idle_time = time.monotonic() - start
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+
+        # Aun despertando por eventos no se superan los fps configurados
+        dt = self.clock.tick(self.fps) / 1000.0
+
+        self._next_deadline = None
+        return dt, events
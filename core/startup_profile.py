@@ -0,0 +1,169 @@
+"""
+Startup Profile - Mide cuánto cuesta arrancar Pixel-OS
+
+Con `python main.py --profile-startup` (o PIXELOS_PROFILE_STARTUP=1) se
+cronometra cada import de módulo, cada paso de inicialización y el tiempo
+hasta el primer frame del escritorio. El informe se imprime al terminar
+el arranque y se añade a un historial en user_data para comparar versiones.
+
+Este módulo solo usa la biblioteca estándar: se importa antes que pygame
+para poder medirlo también.
+"""
+import builtins
+import datetime
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+from config.settings import (STARTUP_HISTORY_FILE, STARTUP_HISTORY_SIZE,
+                             STARTUP_REPORT_IMPORTS, VERSION)
+
+
+def profiling_requested(argv: List[str]) -> bool:
+    """Indica si se pidió el perfil de arranque por argumento o entorno"""
+    return "--profile-startup" in argv or os.environ.get("PIXELOS_PROFILE_STARTUP") == "1"
+
+
+class StartupProfile:
+    """Tiempos de import, inicialización y primer frame"""
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.imports: Dict[str, List[float]] = {}  # módulo -> [propio, acumulado] en segundos
+        self.init_timings: Dict[str, float] = {}  # Paso de inicialización -> segundos
+        self.time_to_first_frame: Optional[float] = None
+        self._last_mark = self.start_time
+        self._local = threading.local()  # Pila de imports anidados por hilo
+        self._original_import = None
+
+    def install(self):
+        """Empieza a cronometrar los imports"""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        """Deja de cronometrar los imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Sustituto de __import__ que mide los módulos que se cargan de verdad"""
+        full_name = name
+        if level:
+            try:
+                package = (globals or {}).get("__package__") or ""
+                full_name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                pass
+        already_loaded = full_name in sys.modules
+        if already_loaded and not fromlist:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        loaded = len(sys.modules)
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if len(sys.modules) > loaded:
+                if already_loaded:
+                    # "from paquete import submódulo" con el paquete ya cargado
+                    full_name = f"{full_name}.{','.join(f for f in fromlist if f != '*')}"
+                timing = self.imports.setdefault(full_name, [0.0, 0.0])
+                timing[0] += total - children
+                timing[1] += total
+                if stack:
+                    stack[-1] += total
+
+    def mark(self, name: str):
+        """Registra un paso de inicialización: el tiempo desde la marca anterior"""
+        now = time.perf_counter()
+        self.init_timings[name] = self.init_timings.get(name, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def finish(self, boot_timings: Optional[Dict[str, float]] = None,
+               history_file: str = STARTUP_HISTORY_FILE) -> Dict:
+        """Cierra el perfil al dibujar el primer frame, lo imprime y lo guarda
+
+        Args:
+            boot_timings: Segundos por etapa del BootPipeline
+            history_file: Historial de arranques (JSON)
+
+        Returns:
+            La entrada añadida al historial
+        """
+        self.mark("first_frame")
+        self.time_to_first_frame = time.perf_counter() - self.start_time
+        self.uninstall()
+
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        entry = {
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'version': VERSION,
+            'python': sys.version.split()[0],
+            'time_to_first_frame_ms': self.time_to_first_frame * 1000,
+            'imports': len(self.imports),
+            'init_ms': {name: s * 1000 for name, s in self.init_timings.items()},
+            'boot_ms': {name: s * 1000 for name, s in (boot_timings or {}).items()},
+            'slowest_imports_ms': {name: t[0] * 1000 for name, t in slowest[:STARTUP_REPORT_IMPORTS]},
+        }
+
+        history = self.load_history(history_file)
+        history.append(entry)
+        history = history[-STARTUP_HISTORY_SIZE:]
+        try:
+            os.makedirs(os.path.dirname(history_file), exist_ok=True)
+            with open(history_file, 'w', encoding='utf-8') as f:
+                json.dump(history, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar el historial de arranque: {e}")
+
+        print(self.format_report(entry, history))
+        return entry
+
+    @staticmethod
+    def load_history(history_file: str = STARTUP_HISTORY_FILE) -> List[Dict]:
+        """Lee el historial de arranques (lista vacía si no existe)"""
+        try:
+            with open(history_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            return history if isinstance(history, list) else []
+        except (OSError, ValueError):
+            return []
+
+    def format_report(self, entry: Dict, history: List[Dict]) -> str:
+        """Informe legible del arranque y su evolución por versión"""
+        lines = ["", f"⏱️ Perfil de arranque: primer frame en {entry['time_to_first_frame_ms']:.0f} ms"]
+
+        lines.append("  Inicialización:")
+        for name, ms in entry['init_ms'].items():
+            lines.append(f"    {name:<28} {ms:8.1f} ms")
+        if entry['boot_ms']:
+            lines.append("  Etapas de arranque:")
+            for name, ms in entry['boot_ms'].items():
+                lines.append(f"    {name:<28} {ms:8.1f} ms")
+
+        lines.append(f"  Imports más lentos (tiempo propio, {entry['imports']} módulos):")
+        for name, ms in entry['slowest_imports_ms'].items():
+            cumulative = self.imports.get(name, [0.0, 0.0])[1] * 1000
+            lines.append(f"    {name:<40} {ms:8.1f} ms  (acumulado {cumulative:.1f} ms)")
+
+        # Mediana del primer frame por versión, en orden de aparición
+        by_version: Dict[str, List[float]] = {}
+        for item in history:
+            by_version.setdefault(item.get('version', '?'), []).append(item.get('time_to_first_frame_ms', 0.0))
+        lines.append("  Primer frame por versión (mediana):")
+        for version, values in by_version.items():
+            values = sorted(values)
+            lines.append(f"    v{version:<27} {values[len(values) // 2]:8.1f} ms  ({len(values)} arranques)")
+        return "\n".join(lines)
@@ -1,9 +1,143 @@
 """
 Theme Manager - Gestiona temas, fuentes y estilos visuales
 """
+import os
 import pygame
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from config.settings import *
+from core.assets import AssetLoader, IconAtlas
+
+
+class FontCache:
+    """Caché LRU de fuentes indexada por (ruta, tamaño, estilo)
+    
+    Cargar una fuente desde disco es caro; las apps piden sus fuentes aquí
+    en lugar de crearlas en cada frame.
+    """
+    
+    def __init__(self, max_entries: int = FONT_CACHE_SIZE):
+        """Inicializa el caché
+        
+        Args:
+            max_entries: Número máximo de fuentes cargadas a la vez
+        """
+        self.max_entries = max_entries
+        self._fonts: "OrderedDict[Tuple, pygame.font.Font]" = OrderedDict()
+        self._resolved_paths: Dict[Optional[str], Optional[str]] = {}
+    
+    def _resolve_path(self, path: Optional[str]) -> Optional[str]:
+        """Resuelve una ruta de fuente una sola vez
+        
+        Si el archivo no existe se usa la fuente por defecto de Pygame (None)
+        y se recuerda, para no volver a intentarlo en cada llamada.
+        """
+        if path not in self._resolved_paths:
+            if path is None or os.path.exists(path):
+                self._resolved_paths[path] = path
+            else:
+                print(f"⚠️ Fuente no encontrada, usando fuente por defecto: {path}")
+                self._resolved_paths[path] = None
+        return self._resolved_paths[path]
+    
+    def get(self, size: int, path: Optional[str] = FONT_PATH,
+            style: str = "regular") -> pygame.font.Font:
+        """Obtiene una fuente del caché, cargándola si es necesario
+        
+        Args:
+            size: Tamaño en puntos
+            path: Ruta del archivo de fuente (None = fuente por defecto)
+            style: regular, bold, italic o bold_italic
+        
+        Returns:
+            Objeto Font de Pygame
+        """
+        key = (path, size, style)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            return font
+        
+        resolved = self._resolve_path(path)
+        try:
+            font = pygame.font.Font(resolved, size)
+        except Exception as e:
+            print(f"⚠️ No se pudo cargar la fuente {resolved}: {e}")
+            self._resolved_paths[path] = None
+            font = pygame.font.Font(None, size)
+        font.set_bold(style in ("bold", "bold_italic"))
+        font.set_italic(style in ("italic", "bold_italic"))
+        
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_entries:
+            self._fonts.popitem(last=False)
+        return font
+    
+    def clear(self):
+        """Vacía el caché (por ejemplo al cambiar de tema)"""
+        self._fonts.clear()
+        self._resolved_paths.clear()
+
+
+class TextCache:
+    """Caché LRU de textos ya rasterizados
+    
+    La mayoría del texto en pantalla es idéntico de un frame a otro, así que
+    se reutiliza la superficie en lugar de llamar a font.render cada vez.
+    Las superficies devueltas son compartidas: solo deben usarse para blit.
+    """
+    
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        """Inicializa el caché
+        
+        Args:
+            max_entries: Número máximo de superficies guardadas
+        """
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font: pygame.font.Font, text: str, color: Tuple,
+               antialias: bool = True) -> pygame.Surface:
+        """Devuelve el texto rasterizado, reutilizándolo si ya existe
+        
+        Args:
+            font: Fuente con la que renderizar
+            text: Texto a renderizar
+            color: Color del texto
+            antialias: Si se suavizan los bordes
+            
+        Returns:
+            Superficie con el texto
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Devuelve los contadores de aciertos y fallos del caché"""
+        return {
+            'entries': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+    
+    def clear(self):
+        """Vacía el caché y reinicia los contadores"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
 
 
 class ThemeManager:
@@ -11,23 +145,19 @@ class ThemeManager:
     
     def __init__(self):
         """Inicializa el gestor de temas"""
+        self.font_cache = FontCache()
+        self.text_cache = TextCache()
+        self.assets = AssetLoader()  # Imágenes compartidas por escritorio, barra, menú y apps
+        self.icons = IconAtlas(self.assets)  # Iconos de apps; lo construye el arranque
         self.fonts = {}
         self._load_fonts()
     
     def _load_fonts(self):
         """Carga la fuente Monocraft en diferentes tamaños"""
-        try:
-            # Intentar cargar Monocraft
-            self.fonts['small'] = pygame.font.Font(FONT_PATH, FONT_SIZE_SMALL)
-            self.fonts['medium'] = pygame.font.Font(FONT_PATH, FONT_SIZE_MEDIUM)
-            self.fonts['large'] = pygame.font.Font(FONT_PATH, FONT_SIZE_LARGE)
-            print("✅ Fuente Monocraft cargada correctamente")
-        except Exception as e:
-            print(f"⚠️ No se pudo cargar Monocraft, usando fuente por defecto: {e}")
-            # Fallback a fuente del sistema
-            self.fonts['small'] = pygame.font.Font(None, FONT_SIZE_SMALL)
-            self.fonts['medium'] = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-            self.fonts['large'] = pygame.font.Font(None, FONT_SIZE_LARGE)
+        # El caché resuelve la ruta una sola vez y usa la fuente por defecto si falta
+        self.fonts['small'] = self.font_cache.get(FONT_SIZE_SMALL)
+        self.fonts['medium'] = self.font_cache.get(FONT_SIZE_MEDIUM)
+        self.fonts['large'] = self.font_cache.get(FONT_SIZE_LARGE)
     
     def get_font(self, size: int = FONT_SIZE_MEDIUM) -> pygame.font.Font:
         """Obtiene una fuente del tamaño especificado
@@ -45,6 +175,35 @@ class ThemeManager:
         else:
             return self.fonts['large']
     
+    def get_font_at(self, size: int, path: Optional[str] = FONT_PATH,
+                    style: str = "regular") -> pygame.font.Font:
+        """Obtiene una fuente de tamaño exacto desde el caché compartido
+        
+        Args:
+            size: Tamaño de la fuente
+            path: Ruta del archivo de fuente (None = fuente por defecto)
+            style: regular, bold, italic o bold_italic
+            
+        Returns:
+            Objeto Font de Pygame
+        """
+        return self.font_cache.get(size, path, style)
+    
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple,
+                    antialias: bool = True) -> pygame.Surface:
+        """Renderiza texto a través del caché compartido
+        
+        Args:
+            font: Fuente con la que renderizar
+            text: Texto a renderizar
+            color: Color del texto
+            antialias: Si se suavizan los bordes
+            
+        Returns:
+            Superficie con el texto (compartida, no modificar)
+        """
+        return self.text_cache.render(font, text, color, antialias)
+    
     def get_color(self, color_name: str) -> tuple:
         """Obtiene un color de la paleta pastel
         
@@ -92,6 +251,6 @@ class ThemeManager:
         
         # Dibujar texto
         font = self.get_font(font_size)
-        text_surf = font.render(text, True, Colors.TEXT_PRIMARY)
+        text_surf = self.render_text(font, text, Colors.TEXT_PRIMARY)
         text_rect = text_surf.get_rect(center=rect.center)
         surface.blit(text_surf, text_rect)
@@ -5,6 +5,7 @@ Inspirado en Windows 11 con funcionalidad estilo Linux
 import pygame
 from typing import List, Optional, Dict, Tuple, Any
 from config.settings import *
+from core.hit_test import HitIndex
 
 
 class Window:
@@ -43,14 +44,28 @@ class Window:
         self.animation_progress = 0.0
         self.target_alpha = 255
         self.current_alpha = 0
+        self.previous_alpha = 0  # Valor en el tick anterior
+        self.is_visible = True  # False si está minimizada, tapada o fuera de pantalla
+        self.on_geometry_changed = None  # Lo asigna el WindowManager
+        self.display_alpha = 0  # Interpolado entre ticks para dibujar
         
         # Áreas de la ventana
         self.titlebar_rect = pygame.Rect(x, y, width, WINDOW_TITLEBAR_HEIGHT)
         self.content_rect = pygame.Rect(x, y + WINDOW_TITLEBAR_HEIGHT, 
                                        width, height - WINDOW_TITLEBAR_HEIGHT)
         
-        # Botones de control
+        # Botones de control; el estado (parte, "hover"/"pressed") lo fija el
+        # WindowManager a partir de los eventos del ratón
         self._setup_control_buttons()
+        self.control_state: Optional[Tuple[str, str]] = None
+        self.control_sprites: Optional["ControlSprites"] = None  # Compartidos, los asigna el WindowManager
+        self.shadow: Optional["WindowShadow"] = None  # Compartida, la asigna el WindowManager
+        
+        # Superficies cacheadas del marco (se reconstruyen solo si cambia su aspecto);
+        # la opaca se usa cuando termina el fundido de aparición
+        self._chrome_surface: Optional[pygame.Surface] = None
+        self._opaque_chrome: Optional[pygame.Surface] = None
+        self._chrome_key: Optional[Tuple] = None
     
     def _setup_control_buttons(self):
         """Crea los botones de control (cerrar, minimizar, maximizar)"""
@@ -87,6 +102,13 @@ class Window:
             self.rect.width, self.rect.height - WINDOW_TITLEBAR_HEIGHT
         )
         self._setup_control_buttons()
+        self.control_state = None  # Los botones se movieron: el puntero ya no está sobre ellos
+        self._notify_geometry()
+    
+    def _notify_geometry(self):
+        """Avisa de que cambió el área que ocupa la ventana"""
+        if self.on_geometry_changed:
+            self.on_geometry_changed()
     
     def maximize(self, screen_width: int, screen_height: int):
         """Maximiza la ventana"""
@@ -107,10 +129,54 @@ class Window:
     def minimize(self):
         """Minimiza la ventana"""
         self.is_minimized = True
+        self._notify_geometry()
     
     def unminimize(self):
         """Restaura la ventana minimizada"""
-        self.is_minimized = False
+        if self.is_minimized:
+            self.is_minimized = False
+            self._notify_geometry()
+    
+    def get_bounds(self) -> pygame.Rect:
+        """Devuelve el área de pantalla que ocupa la ventana, sombra incluida"""
+        return self.rect.inflate(WINDOW_SHADOW_SIZE * 2, WINDOW_SHADOW_SIZE * 2)
+    
+    def get_opaque_rects(self) -> List[pygame.Rect]:
+        """Devuelve las zonas que la ventana tapa por completo
+        
+        Las esquinas redondeadas y el fundido de aparición dejan ver lo
+        que hay detrás, así que solo cuenta la cruz interior de una ventana
+        totalmente opaca.
+        """
+        if self.is_minimized or self.display_alpha < 255:
+            return []
+        return self.get_core_rects()
+    
+    def get_core_rects(self) -> List[pygame.Rect]:
+        """Devuelve la cruz interior de la ventana (sin sombra ni esquinas)"""
+        radius = WINDOW_BORDER_RADIUS
+        return [self.rect.inflate(-radius * 2, 0), self.rect.inflate(0, -radius * 2)]
+    
+    def get_render_state(self) -> Tuple:
+        """Devuelve todo lo que afecta al aspecto del marco de la ventana
+        
+        Si el estado no cambia entre dos frames, el marco no necesita redibujarse.
+        """
+        return (
+            tuple(self.rect),
+            self.title,
+            self.is_focused,
+            self.is_minimized,
+            self.is_maximized,
+            int(self.display_alpha),
+            self.control_state,
+        )
+    
+    def next_deadline(self) -> Optional[float]:
+        """Segundos hasta que la ventana necesite otro frame (None = ninguno)"""
+        if self.current_alpha < self.target_alpha:
+            return 0.0  # Animación de aparición en curso
+        return None
     
     def update(self, dt: float):
         """Actualiza animaciones de la ventana
@@ -119,8 +185,18 @@ class Window:
             dt: Delta time en segundos
         """
         # Animación de aparición
+        self.previous_alpha = self.current_alpha
         if self.current_alpha < self.target_alpha:
             self.current_alpha = min(255, self.current_alpha + 1000 * dt)
+        self.display_alpha = self.current_alpha  # Sin interpolar hasta interpolate()
+    
+    def interpolate(self, alpha: float):
+        """Calcula los valores a dibujar entre el tick anterior y el actual
+        
+        Args:
+            alpha: Fracción del tick transcurrida (0.0 a 1.0)
+        """
+        self.display_alpha = self.previous_alpha + (self.current_alpha - self.previous_alpha) * alpha
     
     def render(self, screen: pygame.Surface, theme_manager):
         """Renderiza la ventana
@@ -132,16 +208,43 @@ class Window:
         if self.is_minimized:
             return
         
-        # Sombra (efecto Windows 11)
-        shadow_rect = self.rect.inflate(WINDOW_SHADOW_SIZE * 2, WINDOW_SHADOW_SIZE * 2)
-        shadow_surf = pygame.Surface(shadow_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, Colors.SHADOW, shadow_surf.get_rect(), 
-                        border_radius=WINDOW_BORDER_RADIUS)
-        screen.blit(shadow_surf, shadow_rect)
+        # Sombra (efecto Windows 11); lo que tapa el marco opaco no se dibuja
+        if self.shadow is None:
+            self.shadow = WindowShadow()
+        self.shadow.render(screen, self.get_bounds(), self.get_opaque_rects())
+        
+        # Marco de la ventana: al mover solo se vuelve a copiar en la nueva posición
+        chrome_key = (self.rect.size, self.title, self.is_focused, self.is_maximized)
+        if self._chrome_surface is None or chrome_key != self._chrome_key:
+            self._chrome_surface = self._build_chrome(theme_manager)
+            self._opaque_chrome = None
+            self._chrome_key = chrome_key
+        
+        if self.display_alpha >= 255:
+            # Fundido terminado: copia sin mezcla alfa por píxel
+            if self._opaque_chrome is None:
+                self._opaque_chrome = self._build_opaque_chrome()
+            screen.blit(self._opaque_chrome, self.rect)
+        else:
+            self._chrome_surface.set_alpha(int(self.display_alpha))
+            screen.blit(self._chrome_surface, self.rect)
+        
+        # Botones de control: sprites pre-dibujados, el hover no reconstruye el marco
+        if self.control_sprites is None:
+            self.control_sprites = ControlSprites()
+        self._render_control_buttons(screen)
+    
+    def _build_chrome(self, theme_manager) -> pygame.Surface:
+        """Dibuja el marco completo de la ventana en una superficie propia
         
-        # Fondo de ventana con bordes redondeados
+        Args:
+            theme_manager: Gestor de temas
+            
+        Returns:
+            Superficie con fondo, barra de título y borde (los botones
+            de control se copian encima desde ControlSprites)
+        """
         window_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        window_surf.set_alpha(int(self.current_alpha))
         
         # Fondo principal
         pygame.draw.rect(window_surf, Colors.WINDOW_BG, window_surf.get_rect(),
@@ -159,66 +262,184 @@ class Window:
         # Renderizar título
         try:
             font = theme_manager.get_font(FONT_SIZE_MEDIUM)
-            title_text = font.render(self.title, True, Colors.TEXT_PRIMARY)
+            title_text = theme_manager.render_text(font, self.title, Colors.TEXT_PRIMARY)
             window_surf.blit(title_text, (16, (WINDOW_TITLEBAR_HEIGHT - title_text.get_height()) // 2))
         except:
             pass
         
-        # Botones de control
-        self._render_control_buttons(window_surf, theme_manager)
-        
         # Borde
         pygame.draw.rect(window_surf, Colors.BORDER, window_surf.get_rect(),
                         width=2, border_radius=WINDOW_BORDER_RADIUS)
         
-        screen.blit(window_surf, self.rect)
-    
-    def _render_control_buttons(self, surface: pygame.Surface, theme_manager):
-        """Renderiza los botones de control de la ventana"""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Ajustar posiciones a coordenadas locales
-        close_local = self.close_button.move(-self.rect.x, -self.rect.y)
-        max_local = self.maximize_button.move(-self.rect.x, -self.rect.y)
-        min_local = self.minimize_button.move(-self.rect.x, -self.rect.y)
-        
-        # Botón minimizar
-        min_hover = self.minimize_button.collidepoint(mouse_pos)
-        pygame.draw.rect(surface, Colors.HOVER if min_hover else Colors.WINDOW_BG,
-                        min_local, border_radius=6)
-        pygame.draw.line(surface, Colors.TEXT_PRIMARY,
-                        (min_local.centerx - 6, min_local.centery),
-                        (min_local.centerx + 6, min_local.centery), 2)
-        
-        # Botón maximizar/restaurar
-        max_hover = self.maximize_button.collidepoint(mouse_pos)
-        pygame.draw.rect(surface, Colors.HOVER if max_hover else Colors.WINDOW_BG,
-                        max_local, border_radius=6)
-        if self.is_maximized:
-            # Icono restaurar (dos cuadrados superpuestos)
-            pygame.draw.rect(surface, Colors.TEXT_PRIMARY,
-                           (max_local.centerx - 4, max_local.centery - 2, 8, 8), 2)
-        else:
+        return window_surf
+    
+    def _build_opaque_chrome(self) -> pygame.Surface:
+        """Convierte el marco al formato de la pantalla, sin canal alfa
+        
+        Las esquinas redondeadas no tienen semitransparencias, así que basta
+        con un color clave para recortarlas.
+        """
+        self._chrome_surface.set_alpha(255)
+        try:
+            opaque = pygame.Surface(self.rect.size).convert()
+        except pygame.error:
+            return self._chrome_surface  # Sin modo de vídeo: se queda con alfa
+        opaque.fill(CHROME_COLORKEY)
+        opaque.blit(self._chrome_surface, (0, 0))
+        opaque.set_colorkey(CHROME_COLORKEY, pygame.RLEACCEL)
+        return opaque
+    
+    def _render_control_buttons(self, screen: pygame.Surface):
+        """Copia los sprites de los botones de control sobre el marco"""
+        sprites = self.control_sprites
+        alpha = int(self.display_alpha)
+        maximize_kind = "restore" if self.is_maximized else "maximize"
+        for part, kind, rect in (("minimize", "minimize", self.minimize_button),
+                                 ("maximize", maximize_kind, self.maximize_button),
+                                 ("close", "close", self.close_button)):
+            state = self.control_state[1] if self.control_state and self.control_state[0] == part else "normal"
+            sprite = sprites.get(kind, state)
+            sprite.set_alpha(alpha)  # Compartido: se ajusta antes de cada copia
+            screen.blit(sprite, rect)
+
+
+class WindowShadow:
+    """Sombra de ventana en nueve trozos, compartida por todas las ventanas
+    
+    Las cuatro esquinas salen de un rectángulo redondeado pequeño dibujado
+    una vez; los lados y el centro, de una superficie de color uniforme que
+    se copia con `area`. Así ningún tamaño de ventana crea superficies, y
+    lo que tapa el marco opaco de la ventana simplemente no se dibuja.
+    """
+    
+    MAX_LAYOUTS = 64  # Combinaciones (tamaño, zona tapada) recordadas
+    
+    def __init__(self, radius: int = WINDOW_BORDER_RADIUS, color: Tuple = Colors.SHADOW):
+        self.radius = radius
+        self.color = color
+        self._corners = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.rect(self._corners, color, self._corners.get_rect(), border_radius=radius)
+        self._fill: Optional[pygame.Surface] = None
+        self._layouts: Dict[Tuple, List[pygame.Rect]] = {}
+    
+    def render(self, screen: pygame.Surface, bounds: pygame.Rect,
+               covered: Optional[List[pygame.Rect]] = None):
+        """Dibuja la sombra
+        
+        Args:
+            screen: Superficie destino
+            bounds: Área de la sombra en pantalla
+            covered: Zonas opacas que se dibujan encima (se omiten)
+        """
+        r = self.radius
+        x, y, w, h = bounds
+        
+        # Esquinas
+        for area, pos in (((0, 0, r, r), (x, y)),
+                          ((r, 0, r, r), (x + w - r, y)),
+                          ((0, r, r, r), (x, y + h - r)),
+                          ((r, r, r, r), (x + w - r, y + h - r))):
+            screen.blit(self._corners, pos, area)
+        
+        # Lados y centro, recortados por lo que quedará tapado
+        if self._fill is None or self._fill.get_width() < w or self._fill.get_height() < h:
+            size = (max(w, self._fill.get_width() if self._fill else 0),
+                    max(h, self._fill.get_height() if self._fill else 0))
+            self._fill = pygame.Surface(size, pygame.SRCALPHA)
+            self._fill.fill(self.color)
+        for piece in self._layout(bounds, covered or []):
+            screen.blit(self._fill, (x + piece.x, y + piece.y), (0, 0, piece.width, piece.height))
+    
+    def _layout(self, bounds: pygame.Rect, covered: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Trozos de color uniforme, en coordenadas relativas a `bounds`"""
+        local_covered = tuple(tuple(rect.move(-bounds.x, -bounds.y)) for rect in covered)
+        key = (bounds.size, local_covered)
+        pieces = self._layouts.get(key)
+        if pieces is None:
+            r = self.radius
+            w, h = bounds.size
+            # Columna central y los dos lados, sin solaparse
+            pieces = [pygame.Rect(r, 0, w - r * 2, h),
+                      pygame.Rect(0, r, r, h - r * 2),
+                      pygame.Rect(w - r, r, r, h - r * 2)]
+            pieces = _subtract_rects(pieces, [pygame.Rect(rect) for rect in local_covered])
+            if len(self._layouts) >= self.MAX_LAYOUTS:
+                self._layouts.clear()
+            self._layouts[key] = pieces
+        return pieces
+
+
+class ControlSprites:
+    """Sprites de los botones de control, compartidos por todas las ventanas
+    
+    Cada botón (minimizar, maximizar, restaurar, cerrar) se dibuja una vez
+    por estado (normal, hover, pressed) en una sola hoja; si cambia la
+    paleta se regenera.
+    """
+    
+    KINDS = ("minimize", "maximize", "restore", "close")
+    STATES = ("normal", "hover", "pressed")
+    SIZE = 32
+    
+    def __init__(self):
+        self._sheet: Optional[pygame.Surface] = None
+        self._palette: Optional[Tuple] = None
+        self._sprites: Dict[Tuple[str, str], pygame.Surface] = {}
+    
+    def get(self, kind: str, state: str) -> pygame.Surface:
+        """Devuelve el sprite de un botón en un estado
+        
+        Args:
+            kind: minimize, maximize, restore o close
+            state: normal, hover o pressed
+        """
+        palette = (Colors.WINDOW_BG, Colors.HOVER, Colors.ACTIVE, Colors.TEXT_PRIMARY)
+        if palette != self._palette:
+            self._build(palette)
+        return self._sprites[(kind, state)]
+    
+    def _build(self, palette: Tuple):
+        """Dibuja la hoja completa: una fila por botón, una columna por estado"""
+        normal_bg, hover_bg, pressed_bg, glyph = palette
+        size = self.SIZE
+        self._sheet = pygame.Surface((size * len(self.STATES), size * len(self.KINDS)), pygame.SRCALPHA)
+        self._sprites = {}
+        
+        for row, kind in enumerate(self.KINDS):
+            if kind == "close":
+                # Cerrar con efecto hover rojo suave
+                backgrounds = (normal_bg, (255, 150, 150), (235, 120, 120))
+            else:
+                backgrounds = (normal_bg, hover_bg, pressed_bg)
+            for column, state in enumerate(self.STATES):
+                rect = pygame.Rect(column * size, row * size, size, size)
+                pygame.draw.rect(self._sheet, backgrounds[column], rect, border_radius=6)
+                self._draw_glyph(kind, rect, glyph)
+                self._sprites[(kind, state)] = self._sheet.subsurface(rect)
+        self._palette = palette
+    
+    def _draw_glyph(self, kind: str, rect: pygame.Rect, color: Tuple[int, int, int]):
+        """Dibuja el símbolo de un botón en la hoja"""
+        cx, cy = rect.center
+        if kind == "minimize":
+            pygame.draw.line(self._sheet, color, (cx - 6, cy), (cx + 6, cy), 2)
+        elif kind == "maximize":
             # Icono maximizar (un cuadrado)
-            pygame.draw.rect(surface, Colors.TEXT_PRIMARY,
-                           (max_local.centerx - 6, max_local.centery - 6, 12, 12), 2)
-        
-        # Botón cerrar (con efecto hover rojo suave)
-        close_hover = self.close_button.collidepoint(mouse_pos)
-        close_color = (255, 150, 150) if close_hover else Colors.WINDOW_BG
-        pygame.draw.rect(surface, close_color, close_local, border_radius=6)
-        # X
-        pygame.draw.line(surface, Colors.TEXT_PRIMARY,
-                        (close_local.centerx - 6, close_local.centery - 6),
-                        (close_local.centerx + 6, close_local.centery + 6), 2)
-        pygame.draw.line(surface, Colors.TEXT_PRIMARY,
-                        (close_local.centerx + 6, close_local.centery - 6),
-                        (close_local.centerx - 6, close_local.centery + 6), 2)
+            pygame.draw.rect(self._sheet, color, (cx - 6, cy - 6, 12, 12), 2)
+        elif kind == "restore":
+            # Icono restaurar
+            pygame.draw.rect(self._sheet, color, (cx - 4, cy - 2, 8, 8), 2)
+        elif kind == "close":
+            # X
+            pygame.draw.line(self._sheet, color, (cx - 6, cy - 6), (cx + 6, cy + 6), 2)
+            pygame.draw.line(self._sheet, color, (cx + 6, cy - 6), (cx - 6, cy + 6), 2)
 
 
 class WindowManager:
     """Gestiona todas las ventanas del sistema"""
     
+    CONTROL_PARTS = ("close", "maximize", "minimize")
+    
     def __init__(self, screen: pygame.Surface, theme_manager):
         """Inicializa el gestor de ventanas
         
@@ -230,6 +451,20 @@ class WindowManager:
         self.theme_manager = theme_manager
         self.windows: List[Window] = []
         self.focused_window: Optional[Window] = None
+        
+        # Estado del último frame compuesto (para dirty rectangles)
+        self._last_frame: Dict[Window, Tuple] = {}
+        
+        # Índice espacial de ventanas y sus partes; se reconstruye solo
+        # cuando una ventana se mueve, cambia de tamaño o de orden
+        self.hit_index = HitIndex()
+        self.windows_version = 0  # Cambia al abrir o cerrar ventanas
+        self._drag_window: Optional[Window] = None
+        
+        # Sprites de los botones de control, sombra y botón bajo el puntero
+        self.control_sprites = ControlSprites()
+        self.shadow = WindowShadow()
+        self._control_window: Optional[Window] = None
     
     def create_window(self, title: str, width: int = 600, height: int = 400,
                      color: Optional[Tuple[int, int, int]] = None, app_ref: Any = None) -> Window:
@@ -250,7 +485,11 @@ class WindowManager:
         y = 50 + offset
         
         window = Window(title, x, y, width, height, color, app_ref)
+        window.on_geometry_changed = self.hit_index.invalidate
+        window.control_sprites = self.control_sprites
+        window.shadow = self.shadow
         self.windows.append(window)
+        self.windows_version += 1
         self.focus_window(window)
         
         return window
@@ -274,6 +513,7 @@ class WindowManager:
             window.is_focused = True
             window.unminimize()
             self.focused_window = window
+            self.hit_index.invalidate()
     
     def close_window(self, window: Window):
         """Cierra una ventana
@@ -291,74 +531,141 @@ class WindowManager:
                 window.app_ref.is_running = False
                 window.app_ref.window = None
             self.windows.remove(window)
+            self.windows_version += 1
+            self.hit_index.invalidate()
+            if self._drag_window == window:
+                self._drag_window = None
+            if self._control_window == window:
+                self._control_window = None
             
             if self.focused_window == window:
                 self.focused_window = self.windows[-1] if self.windows else None
                 if self.focused_window:
                     self.focused_window.is_focused = True
     
-    def handle_event(self, event: pygame.event.Event):
+    def handle_event(self, event: pygame.event.Event) -> bool:
         """Procesa eventos relacionados con ventanas
         
         Args:
             event: Evento de Pygame
+            
+        Returns:
+            True si el evento era para el marco de una ventana (botones de
+            control o barra de título) y no debe llegar a la app
         """
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
+            hit = self.hit_test(mouse_pos)
+            if hit is None:
+                return False
+            part, window = hit
             
-            # Iterar en orden inverso (de arriba hacia abajo)
-            for window in reversed(self.windows):
-                if window.is_minimized:
-                    continue
-                
-                # Click en botones de control
-                if window.close_button.collidepoint(mouse_pos):
-                    self.close_window(window)
-                    return
-                
-                if window.maximize_button.collidepoint(mouse_pos):
-                    if window.is_maximized:
-                        window.restore()
-                    else:
-                        window.maximize(SCREEN_WIDTH, SCREEN_HEIGHT)
-                    return
-                
-                if window.minimize_button.collidepoint(mouse_pos):
-                    window.minimize()
-                    return
-                
+            # Click en botones de control
+            if part in self.CONTROL_PARTS:
+                self._set_control_state(window, (part, "pressed"))
+            if part == "close":
+                self.close_window(window)
+            elif part == "maximize":
+                if window.is_maximized:
+                    window.restore()
+                else:
+                    window.maximize(SCREEN_WIDTH, SCREEN_HEIGHT)
+            elif part == "minimize":
+                window.minimize()
+            elif part == "titlebar":
                 # Click en barra de título para arrastrar
-                if window.titlebar_rect.collidepoint(mouse_pos):
-                    self.focus_window(window)
-                    window.dragging = True
-                    window.drag_offset = (
-                        mouse_pos[0] - window.rect.x,
-                        mouse_pos[1] - window.rect.y
-                    )
-                    return
-                
-                # Click en contenido
-                if window.rect.collidepoint(mouse_pos):
-                    self.focus_window(window)
-                    return
+                self.focus_window(window)
+                window.dragging = True
+                window.drag_offset = (
+                    mouse_pos[0] - window.rect.x,
+                    mouse_pos[1] - window.rect.y
+                )
+                self._drag_window = window
+            else:
+                # Click en contenido: también le llega a la app
+                self.focus_window(window)
+                return False
+            return True
         
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             # Detener arrastre
-            for window in self.windows:
-                window.dragging = False
+            if self._drag_window:
+                self._drag_window.dragging = False
+                self._drag_window = None
+            self._update_control_hover(event.pos)
         
         elif event.type == pygame.MOUSEMOTION:
             # Arrastrar ventana
-            for window in self.windows:
-                if window.dragging:
-                    mouse_pos = event.pos
-                    window.rect.x = mouse_pos[0] - window.drag_offset[0]
-                    window.rect.y = mouse_pos[1] - window.drag_offset[1]
-                    window.update_rects()
+            window = self._drag_window
+            if window and window.dragging:
+                mouse_pos = event.pos
+                window.rect.x = mouse_pos[0] - window.drag_offset[0]
+                window.rect.y = mouse_pos[1] - window.drag_offset[1]
+                window.update_rects()
+            else:
+                self._update_control_hover(event.pos, held=getattr(event, "buttons", (0,))[0])
         
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Doble click en barra de título para maximizar
             pass  # Implementar si se desea
+        
+        return False
+    
+    def _update_control_hover(self, pos: Tuple[int, int], held: bool = False):
+        """Actualiza qué botón de control está bajo el puntero
+        
+        Args:
+            pos: Posición del puntero
+            held: Si el botón izquierdo sigue pulsado (mantiene "pressed")
+        """
+        hit = self.hit_test(pos)
+        if hit is None or hit[0] not in self.CONTROL_PARTS:
+            self._set_control_state(None, None)
+            return
+        part, window = hit
+        pressed = held and window.control_state == (part, "pressed")
+        self._set_control_state(window, (part, "pressed" if pressed else "hover"))
+    
+    def _set_control_state(self, window: Optional[Window], state: Optional[Tuple[str, str]]):
+        """Marca el botón de control activo; solo una ventana a la vez"""
+        previous = self._control_window
+        if previous is not None and previous is not window:
+            previous.control_state = None
+        if window is not None:
+            window.control_state = state
+        self._control_window = window
+    
+    def hit_test(self, pos: Tuple[int, int]) -> Optional[Tuple[str, Window]]:
+        """Resuelve qué parte de qué ventana está bajo el puntero
+        
+        Args:
+            pos: Posición en pantalla
+            
+        Returns:
+            (parte, ventana) con parte en "close", "maximize", "minimize",
+            "titlebar" o "body"; None si no hay ninguna ventana
+        """
+        if self.hit_index.dirty:
+            self._rebuild_hit_index()
+        return self.hit_index.hit(pos)
+    
+    def window_at(self, pos: Tuple[int, int]) -> Optional[Window]:
+        """Devuelve la ventana visible más alta bajo el puntero"""
+        hit = self.hit_test(pos)
+        return hit[1] if hit else None
+    
+    def _rebuild_hit_index(self):
+        """Reconstruye el índice de ventanas en orden z"""
+        regions = []
+        for window in self.windows:
+            if window.is_minimized:
+                continue
+            regions.append((window.rect, ("body", window)))
+            regions.append((window.titlebar_rect, ("titlebar", window)))
+            regions.append((window.minimize_button, ("minimize", window)))
+            regions.append((window.maximize_button, ("maximize", window)))
+            regions.append((window.close_button, ("close", window)))
+        self.hit_index.rebuild(regions)
     
     def update(self, dt: float):
         """Actualiza todas las ventanas
@@ -369,10 +676,89 @@ class WindowManager:
         for window in self.windows:
             window.update(dt)
     
+    def interpolate(self, alpha: float):
+        """Interpola las animaciones de todas las ventanas para dibujarlas
+        
+        Args:
+            alpha: Fracción del tick transcurrida (0.0 a 1.0)
+        """
+        for window in self.windows:
+            window.interpolate(alpha)
+    
+    def collect_damage(self) -> List[pygame.Rect]:
+        """Calcula las regiones que cambiaron desde el último frame
+        
+        Returns:
+            Lista de rectángulos de pantalla a redibujar
+        """
+        damage = []
+        current: Dict[Window, Tuple] = {}
+        
+        for z, window in enumerate(self.windows):
+            state = (z, window.get_render_state(), window.is_visible)
+            bounds = window.get_bounds()
+            current[window] = (state, bounds)
+            
+            previous = self._last_frame.get(window)
+            if previous is None or previous[0] != state:
+                if previous is not None:
+                    damage.append(previous[1])
+                if window.is_visible:
+                    damage.append(bounds)
+            elif window.app_ref and window.is_visible:
+                app = window.app_ref
+                if app.needs_redraw or not getattr(app, "damage_tracking", False):
+                    damage.append(window.content_rect.copy())
+        
+        # Ventanas cerradas desde el último frame
+        for window, (_, bounds) in self._last_frame.items():
+            if window not in current:
+                damage.append(bounds)
+        
+        self._last_frame = current
+        return damage
+    
+    def update_visibility(self):
+        """Recalcula qué ventanas se ven, recorriendo el orden z de arriba abajo
+        
+        Una ventana es invisible si está minimizada, fuera de la pantalla o
+        tapada por completo por ventanas opacas que están encima. Solo se
+        mira su cruz interior: la sombra y las esquinas redondeadas de una
+        ventana tapada no cuentan, así una ventana maximizada oculta a otra
+        maximizada. Las apps reciben on_visibility_changed cuando su ventana
+        cambia de estado.
+        """
+        screen_rect = self.screen.get_rect()
+        occluders: List[pygame.Rect] = []
+        
+        for window in reversed(self.windows):
+            visible = False
+            if not window.is_minimized:
+                core = [rect.clip(screen_rect) for rect in window.get_core_rects()]
+                core = [rect for rect in core if rect.width and rect.height]
+                visible = bool(core and _subtract_rects(core, occluders))
+                occluders.extend(window.get_opaque_rects())
+            
+            if visible != window.is_visible:
+                window.is_visible = visible
+                app = window.app_ref
+                if app and hasattr(app, "on_visibility_changed"):
+                    try:
+                        app.on_visibility_changed(visible)
+                    except Exception as e:
+                        print(f"❌ Error en on_visibility_changed de {window.title}: {e}")
+    
+    def next_deadline(self) -> Optional[float]:
+        """Segundos hasta que alguna ventana necesite otro frame (None = ninguno)"""
+        deadlines = [w.next_deadline() for w in self.windows]
+        deadlines = [d for d in deadlines if d is not None]
+        return min(deadlines) if deadlines else None
+    
     def render(self):
         """Renderiza todas las ventanas"""
         for window in self.windows:
-            window.render(self.screen, self.theme_manager)
+            if window.is_visible:
+                window.render(self.screen, self.theme_manager)
     
     def get_windows(self) -> List[Window]:
         """Obtiene todas las ventanas
@@ -381,3 +767,32 @@ class WindowManager:
             Lista de ventanas
         """
         return self.windows
+
+
+def _subtract_rects(rects: List[pygame.Rect], occluders: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Resta a un conjunto de rectángulos las zonas cubiertas por otros
+    
+    Returns:
+        Trozos que quedan sin cubrir (lista vacía = totalmente cubiertos)
+    """
+    for occluder in occluders:
+        remaining = []
+        for rect in rects:
+            if not rect.colliderect(occluder):
+                remaining.append(rect)
+                continue
+            # Franjas de arriba y abajo a todo el ancho; izquierda y derecha en medio
+            if rect.top < occluder.top:
+                remaining.append(pygame.Rect(rect.left, rect.top, rect.width, occluder.top - rect.top))
+            if occluder.bottom < rect.bottom:
+                remaining.append(pygame.Rect(rect.left, occluder.bottom, rect.width, rect.bottom - occluder.bottom))
+            top = max(rect.top, occluder.top)
+            bottom = min(rect.bottom, occluder.bottom)
+            if rect.left < occluder.left:
+                remaining.append(pygame.Rect(rect.left, top, occluder.left - rect.left, bottom - top))
+            if occluder.right < rect.right:
+                remaining.append(pygame.Rect(occluder.right, top, rect.right - occluder.right, bottom - top))
+        rects = remaining
+        if not rects:
+            break
+    return rects
@@ -3,15 +3,23 @@ PixelOS v1.4 - Main Entry Point
 Sistema operativo retro en pixels
 """
 
-import pygame
-from core.engine import PixelOS
+import sys
+from core.startup_profile import StartupProfile, profiling_requested
 
 def main():
+    # Perfil de arranque opcional: debe empezar antes de importar pygame
+    startup_profile = StartupProfile() if profiling_requested(sys.argv) else None
+    if startup_profile:
+        startup_profile.install()
+    
+    import pygame
+    from core.engine import PixelOS
+    
     # Initialize Pygame
     pygame.init()
     
     # Create the operating system
-    pixel_os = PixelOS()
+    pixel_os = PixelOS(startup_profile=startup_profile)
     
     # Run the main loop
     pixel_os.run()
@@ -0,0 +1,36 @@
+"""
+Tests del arranque por etapas
+"""
+import pytest
+
+from core.boot import BootPipeline, BootStage
+
+
+def _fail(report):
+    raise OSError("disco roto")
+
+
+def test_required_stage_aborts_boot_with_original_error():
+    ran = []
+    pipeline = BootPipeline([
+        BootStage("filesystem", "Montando", _fail, threaded=True),
+        BootStage("desktop", "Escritorio", lambda report: ran.append("desktop")),
+    ])
+
+    with pytest.raises(OSError, match="disco roto"):
+        while not pipeline.step():
+            pass
+    assert ran == []
+    assert not pipeline.done
+
+
+def test_optional_stage_failure_does_not_stop_boot():
+    ran = []
+    pipeline = BootPipeline([
+        BootStage("plugins", "Mods", _fail, required=False),
+        BootStage("events", "Sistema", lambda report: ran.append("events")),
+    ])
+
+    pipeline.run_all()
+    assert ran == ["events"]
+    assert isinstance(pipeline.stages[0].error, OSError)
@@ -0,0 +1,98 @@
+"""
+Tests del filesystem virtual: recuperación de instantáneas y diario
+"""
+import os
+
+from core.filesystem import VirtualFilesystem
+
+
+def _names(fs, path=""):
+    """Archivos de una carpeta"""
+    return sorted(fs.get_path(path).files)
+
+
+def test_recovery_from_older_generation_ignores_journal_after_gap(tmp_path, capsys):
+    storage = str(tmp_path / "filesystem")
+    fs = VirtualFilesystem(storage)
+    fs.create_file("Documentos", "a.txt", "a")
+    fs.save()  # Generación que se recuperará (acaba en filesystem.json.1)
+
+    fs.create_file("Documentos", "b.txt", "b")
+    fs.save()  # filesystem.json, que se corromperá
+
+    # Operaciones en el diario sobre un archivo creado entre las dos instantáneas
+    fs.save_file("Documentos", "b.txt", "b2")
+    fs.move_to_trash("Documentos", "b.txt")
+    fs.create_file("Documentos", "c.txt", "c")
+    fs.close()
+    assert os.path.getsize(fs.journal_path) > 0
+
+    with open(fs.snapshot_path, 'r+b') as f:
+        f.truncate(os.path.getsize(fs.snapshot_path) // 2)
+
+    recovered = VirtualFilesystem(storage)
+    output = capsys.readouterr().out
+
+    # El árbol es exactamente el de la generación anterior, sin operaciones a medias
+    assert _names(recovered, "Documentos") == ["a.txt"]
+    assert _names(recovered, "Papelera") == []
+    assert recovered.get_path("Documentos").get_file("a.txt").content == "a"
+    assert "Error repitiendo el diario" not in output
+
+    # El diario no aplicado se conserva aparte
+    kept = [name for name in os.listdir(storage) if name.startswith(fs.JOURNAL_FILE + ".gap-")]
+    assert len(kept) == 1
+    assert os.path.getsize(os.path.join(storage, kept[0])) > 0
+
+    # Y también el contenido al que apunta, aunque se compacte
+    gap_blobs = [fs.blobs.blob_id("b2"), fs.blobs.blob_id("c")]
+    recovered.save()
+    for blob_id in gap_blobs:
+        assert os.path.exists(recovered.blobs.blob_path(blob_id))
+
+    # Lo que se haga después se guarda y se vuelve a cargar con normalidad
+    recovered.create_file("Documentos", "d.txt", "d")
+    recovered.close()
+    reloaded = VirtualFilesystem(storage)
+    assert _names(reloaded, "Documentos") == ["a.txt", "d.txt"]
+    assert reloaded.get_path("Documentos").get_file("d.txt").content == "d"
+    reloaded.close()
+
+
+def test_journal_is_replayed_over_current_snapshot(tmp_path):
+    storage = str(tmp_path / "filesystem")
+    fs = VirtualFilesystem(storage)
+    fs.create_file("Documentos", "a.txt", "a")
+    fs.save()
+    fs.save_file("Documentos", "a.txt", "a2")
+    fs.copy_file("Documentos", "a.txt", "Descargas")
+    fs.close()
+
+    reloaded = VirtualFilesystem(storage)
+    assert reloaded.get_path("Documentos").get_file("a.txt").content == "a2"
+    assert reloaded.get_path("Descargas").get_file("a.txt").content == "a2"
+    reloaded.close()
+
+
+def test_compaction_reads_each_generation_once(tmp_path, monkeypatch):
+    storage = str(tmp_path / "filesystem")
+    fs = VirtualFilesystem(storage, generations=2)
+    fs.create_file("Documentos", "a.txt", "v1")
+    fs.save()
+
+    reads = []
+    read_snapshot = VirtualFilesystem._read_snapshot
+    monkeypatch.setattr(VirtualFilesystem, "_read_snapshot",
+                        staticmethod(lambda path: reads.append(path) or read_snapshot(path)))
+
+    for version in range(2, 6):
+        fs.save_file("Documentos", "a.txt", f"v{version}")
+        fs.save()
+    assert len(reads) <= fs.generations + 1
+
+    # Las generaciones que se conservan mantienen sus blobs; el resto se borra
+    kept = {fs.blobs.blob_id(f"v{version}") for version in (3, 4, 5)}
+    for version in range(1, 6):
+        blob_id = fs.blobs.blob_id(f"v{version}")
+        assert os.path.exists(fs.blobs.blob_path(blob_id)) == (blob_id in kept)
+    fs.close()
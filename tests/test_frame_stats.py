@@ -0,0 +1,23 @@
+"""
+Tests de las estadísticas por frame
+"""
+from core.frame_stats import FrameStats
+
+
+def _stats(values):
+    stats = FrameStats()
+    for value in values:
+        stats.add("render", value)
+        stats.end_frame()
+    return stats
+
+
+def test_percentile_is_nearest_rank():
+    stats = _stats([1, 2, 3, 4, 5, 6])
+    assert stats.percentile("render", 50) == 3
+    assert stats.percentile("render", 0) == 1
+    assert stats.percentile("render", 100) == 6
+
+    stats = _stats(range(1, 21))
+    assert stats.percentile("render", 95) == 19
+    assert stats.percentile("render", 99) == 20
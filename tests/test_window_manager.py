@@ -0,0 +1,31 @@
+"""
+Tests del gestor de ventanas: visibilidad por oclusión
+"""
+import pygame
+
+from config.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from core.window_manager import WindowManager
+
+
+def _opaque_window(manager, title):
+    """Crea una ventana con la animación de aparición terminada"""
+    window = manager.create_window(title)
+    window.current_alpha = window.display_alpha = 255
+    return window
+
+
+def test_maximized_window_hides_maximized_window_below():
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    manager = WindowManager(screen, theme_manager=None)
+    below = _opaque_window(manager, "Abajo")
+    above = _opaque_window(manager, "Arriba")
+    below.maximize(SCREEN_WIDTH, SCREEN_HEIGHT)
+    above.maximize(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    manager.update_visibility()
+    assert below.is_visible is False
+    assert above.is_visible is True
+
+    above.restore()
+    manager.update_visibility()
+    assert below.is_visible is True
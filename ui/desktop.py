@@ -1,18 +1,19 @@
 """
 Desktop - Escritorio del sistema con iconos y fondos
 """
-import os
 import pygame
 from typing import List, Optional, Tuple, Any
 from config.i18n import tr
 from config.settings import *
+from core.hit_test import HitIndex
 
 
 class DesktopIcon:
     """Representa un icono en el escritorio"""
     
     def __init__(self, name: str, x: int, y: int, app_ref: Any = None,
-                 color: Optional[Tuple[int, int, int]] = None, app_id: Optional[str] = None):
+                 color: Optional[Tuple[int, int, int]] = None, app_id: Optional[str] = None,
+                 icons=None):
         """Inicializa un icono de escritorio
         
         Args:
@@ -21,6 +22,7 @@ class DesktopIcon:
             app_ref: Referencia a la aplicación asociada
             color: Color de acento
             app_id: ID de la aplicación para cargar el icono correcto
+            icons: IconAtlas compartido del que sale la imagen
         """
         self.name = name
         self.x = x
@@ -40,27 +42,21 @@ class DesktopIcon:
         self.selected = False
         self.hover = False
         
+        # Área ocupada en el último render (el label puede ser más ancho)
+        self.bounds = self.icon_rect.union(self.label_rect).inflate(8, 8)
+        
         # Cargar imagen del icono
-        self.icon_image = self._load_icon_image()
+        self.icon_image = self._load_icon_image(icons)
     
-    def _load_icon_image(self) -> Optional[pygame.Surface]:
-        """Carga la imagen del icono desde archivo
+    def _load_icon_image(self, icons) -> Optional[pygame.Surface]:
+        """Obtiene la imagen del icono del atlas
         
         Returns:
             Superficie con la imagen escalada, o None si no se encuentra
         """
-        if not self.app_id:
+        if icons is None:
             return None
-        
-        icon_path = os.path.join("assets", "imgs", f"icon_{self.app_id}.png")
-        try:
-            if os.path.exists(icon_path):
-                img = pygame.image.load(icon_path)
-                # Escalar a tamaño del icono
-                return pygame.transform.scale(img, (DESKTOP_ICON_SIZE - 8, DESKTOP_ICON_SIZE - 8))
-        except Exception:
-            pass
-        return None
+        return icons.get(self.app_id, DESKTOP_APP_ICON_SIZE)
     
     def update(self, mouse_pos):
         """Actualiza el estado del icono
@@ -71,6 +67,10 @@ class DesktopIcon:
         self.hover = (self.icon_rect.collidepoint(mouse_pos) or 
                      self.label_rect.collidepoint(mouse_pos))
     
+    def get_render_state(self) -> Tuple:
+        """Devuelve todo lo que afecta al aspecto del icono"""
+        return (self.name, self.selected, self.hover, self.icon_rect.topleft)
+    
     def render(self, surface: pygame.Surface, theme_manager):
         """Renderiza el icono
         
@@ -99,7 +99,7 @@ class DesktopIcon:
         
         # Label
         font = theme_manager.get_font(FONT_SIZE_SMALL)
-        text = font.render(self.name, True, Colors.TEXT_PRIMARY)
+        text = theme_manager.render_text(font, self.name, Colors.TEXT_PRIMARY)
         text_rect = text.get_rect(center=(self.label_rect.centerx, self.label_rect.centery))
         
         # Fondo del texto para mejor legibilidad
@@ -107,6 +107,7 @@ class DesktopIcon:
         pygame.draw.rect(surface, Colors.WINDOW_BG, text_bg, border_radius=4)
         
         surface.blit(text, text_rect)
+        self.bounds = self.icon_rect.union(self.label_rect).inflate(8, 8).union(text_bg)
 
 
 class Desktop:
@@ -122,6 +123,13 @@ class Desktop:
         self.screen = screen
         self.theme_manager = theme_manager
         self.icons: List[DesktopIcon] = []
+        self._last_frame: dict = {}
+        
+        # Índice de iconos; se reconstruye cuando cambia la lista
+        self.hit_index = HitIndex()
+        self._indexed_icons = None
+        self._hovered_icon: Optional[DesktopIcon] = None
+        self._pointer_pos: Optional[Tuple[int, int]] = None  # Última posición de MOUSEMOTION
         
         # Crear algunos iconos de ejemplo
         self._create_default_icons()
@@ -142,7 +150,7 @@ class Desktop:
         
         for i, (name, color) in enumerate(default_apps):
             y = start_y + (i * spacing)
-            icon = DesktopIcon(name, start_x, y, color=color)
+            icon = DesktopIcon(name, start_x, y, color=color, icons=self.theme_manager.icons)
             self.icons.append(icon)
     
     def add_icon(self, name: str, app_ref: Any = None,
@@ -164,7 +172,8 @@ class Desktop:
         # Obtener app_id desde la referencia de la aplicación
         app_id = getattr(app_ref, 'app_id', None) if app_ref else None
         
-        icon = DesktopIcon(name, start_x, y, app_ref, color, app_id=app_id)
+        icon = DesktopIcon(name, start_x, y, app_ref, color, app_id=app_id,
+                           icons=self.theme_manager.icons)
         self.icons.append(icon)
     
     def update(self, dt: float):
@@ -173,15 +182,99 @@ class Desktop:
         Args:
             dt: Delta time en segundos
         """
-        mouse_pos = pygame.mouse.get_pos()
+        # El hover lo actualizan los eventos de movimiento; aquí solo si
+        # la lista de iconos cambió bajo el puntero
+        if self._reindex():
+            self._update_hover()
+    
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Sigue el puntero para el hover de los iconos
+        
+        Returns:
+            False: el movimiento del puntero nunca se consume
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self._pointer_pos = event.pos
+            self._update_hover()
+        elif event.type == pygame.WINDOWLEAVE:
+            self._pointer_pos = None
+            self._update_hover()
+        return False
+    
+    def _update_hover(self):
+        """Recalcula el icono en hover con la última posición del puntero"""
+        pos = self._pointer_pos
+        hovered = self.icon_at(pos) if pos is not None else None
+        if hovered is not self._hovered_icon:
+            if self._hovered_icon:
+                self._hovered_icon.hover = False
+            if hovered:
+                hovered.hover = True
+            self._hovered_icon = hovered
+    
+    def icon_at(self, pos: Tuple[int, int]) -> Optional[DesktopIcon]:
+        """Devuelve el icono bajo el puntero, o None
+        
+        Args:
+            pos: Posición en pantalla
+        """
+        self._reindex()
+        return self.hit_index.hit(pos)
+    
+    def _reindex(self) -> bool:
+        """Reconstruye el índice si cambió la lista de iconos
+        
+        La lista puede reemplazarse desde fuera (ej: al registrar apps).
+        
+        Returns:
+            True si hubo que reconstruirlo
+        """
+        indexed = (id(self.icons), len(self.icons))
+        if indexed == self._indexed_icons:
+            return False
+        regions = []
+        for icon in reversed(self.icons):  # El primero de la lista gana
+            regions.append((icon.icon_rect, icon))
+            regions.append((icon.label_rect, icon))
+        self.hit_index.rebuild(regions)
+        self._indexed_icons = indexed
+        return True
+    
+    def collect_damage(self) -> List[pygame.Rect]:
+        """Calcula las regiones del escritorio que cambiaron desde el último frame
+        
+        Returns:
+            Lista de rectángulos de pantalla a redibujar
+        """
+        damage = []
+        current = {}
         for icon in self.icons:
-            icon.update(mouse_pos)
+            state = icon.get_render_state()
+            current[icon] = state
+            if icon not in self._last_frame:
+                # Aún no se conoce el ancho real de su etiqueta
+                damage.append(self.screen.get_rect())
+            elif self._last_frame[icon] != state:
+                damage.append(icon.bounds)
+        
+        # Iconos eliminados desde el último frame
+        for icon in self._last_frame:
+            if icon not in current:
+                damage.append(icon.bounds)
+        
+        self._last_frame = current
+        return damage
     
-    def render(self):
-        """Renderiza el escritorio"""
+    def render(self, clip: Optional[pygame.Rect] = None):
+        """Renderiza el escritorio
+        
+        Args:
+            clip: Región a redibujar (None = todo el escritorio)
+        """
         # Los iconos se renderizan sobre el fondo
         for icon in self.icons:
-            icon.render(self.screen, self.theme_manager)
+            if clip is None or icon.bounds.colliderect(clip):
+                icon.render(self.screen, self.theme_manager)
     
     def handle_click(self, pos: Tuple[int, int]) -> Optional[DesktopIcon]:
         """Maneja clicks en el escritorio
@@ -192,7 +285,4 @@ class Desktop:
         Returns:
             Icono clickeado o None
         """
-        for icon in self.icons:
-            if icon.icon_rect.collidepoint(pos) or icon.label_rect.collidepoint(pos):
-                return icon
-        return None
+        return self.icon_at(pos)
@@ -2,11 +2,12 @@
 TaskBar - Barra de tareas estilo Windows 11 con colores pastel
 Incluye menú de inicio y soporte para iconos PNG
 """
-import os
+import datetime
 import pygame
 from typing import List, Optional, Any
 from config.i18n import tr
 from config.settings import *
+from core.hit_test import HitIndex
 
 
 class StartMenu:
@@ -27,22 +28,26 @@ class StartMenu:
             self.menu_width, self.menu_height
         )
         
-        # Items del menú
+        # Items del menú y sus rectángulos (fijos mientras no cambie la lista)
         self.menu_items = []
+        self.item_rects: List[pygame.Rect] = []
+        self.hit_index = HitIndex()
         self.hovered_item = -1
         self._build_menu_items()
     
     def _build_menu_items(self):
-        """Construye la lista de items del menú desde los plugins"""
+        """Construye la lista de items del menú desde las apps registradas
+        
+        Los items guardan el descriptor: la app se construye al abrirla.
+        """
         self.menu_items = []
-        for app_id, app_ref in self.plugin_manager.plugins.items():
-            if hasattr(app_ref, 'name') and hasattr(app_ref, 'color'):
-                self.menu_items.append({
-                    'name': app_ref.name,
-                    'app_id': app_id,
-                    'color': app_ref.color,
-                    'app_ref': app_ref,
-                })
+        for app_id, descriptor in self.plugin_manager.descriptors.items():
+            self.menu_items.append({
+                'name': descriptor.name,
+                'app_id': app_id,
+                'color': descriptor.color,
+                'app_ref': descriptor,
+            })
         # Agregar botón de apagado al final
         self.menu_items.append({
             'name': 'Apagar',
@@ -51,24 +56,33 @@ class StartMenu:
             'app_ref': None,
             'is_shutdown': True,
         })
+        self._layout_items()
     
-    def update(self, mouse_pos):
-        """Actualiza el menú según la posición del mouse"""
-        if not self.visible:
-            return
-        
-        self.hovered_item = -1
+    def _layout_items(self):
+        """Calcula los rectángulos de los items y reconstruye su índice"""
         item_height = 50
-        for i in range(len(self.menu_items)):
-            item_rect = pygame.Rect(
+        self.item_rects = [
+            pygame.Rect(
                 self.menu_rect.x + 10,
                 self.menu_rect.y + 50 + i * item_height,
                 self.menu_rect.width - 20,
                 item_height - 5
             )
-            if item_rect.collidepoint(mouse_pos):
-                self.hovered_item = i
-                break
+            for i in range(len(self.menu_items))
+        ]
+        self.hit_index.rebuild((rect, i) for i, rect in enumerate(self.item_rects))
+    
+    def item_at(self, pos) -> int:
+        """Devuelve el índice del item bajo el puntero, o -1"""
+        index = self.hit_index.hit(pos)
+        return -1 if index is None else index
+    
+    def update(self, mouse_pos):
+        """Actualiza el menú según la posición del mouse (None = fuera de la pantalla)"""
+        if not self.visible:
+            return
+        
+        self.hovered_item = -1 if mouse_pos is None else self.item_at(mouse_pos)
     
     def render(self):
         """Renderiza el menú de inicio"""
@@ -81,20 +95,14 @@ class StartMenu:
         
         # Título
         font_title = self.theme_manager.get_font(FONT_SIZE_MEDIUM)
-        title = font_title.render("Aplicaciones", True, Colors.TEXT_PRIMARY)
+        title = self.theme_manager.render_text(font_title, "Aplicaciones", Colors.TEXT_PRIMARY)
         self.screen.blit(title, (self.menu_rect.x + 20, self.menu_rect.y + 15))
         
         # Items
         font_item = self.theme_manager.get_font(FONT_SIZE_SMALL)
-        item_height = 50
         
         for i, item in enumerate(self.menu_items):
-            item_rect = pygame.Rect(
-                self.menu_rect.x + 10,
-                self.menu_rect.y + 50 + i * item_height,
-                self.menu_rect.width - 20,
-                item_height - 5
-            )
+            item_rect = self.item_rects[i]
             
             # Fondo si está hovered
             if i == self.hovered_item:
@@ -110,23 +118,16 @@ class StartMenu:
                                (icon_rect.centerx, icon_rect.top + 4),
                                (icon_rect.centerx, icon_rect.top + 10), 2)
             else:
-                icon_path = os.path.join("assets", "imgs", f"icon_{item['app_id']}.png")
-                try:
-                    if os.path.exists(icon_path):
-                        icon_img = pygame.image.load(icon_path)
-                        icon_img = pygame.transform.scale(icon_img, (32, 32))
-                        self.screen.blit(icon_img, (item_rect.x + 5, item_rect.y + 8))
-                    else:
-                        # Fallback
-                        color_rect = pygame.Rect(item_rect.x + 5, item_rect.y + 8, 32, 32)
-                        pygame.draw.rect(self.screen, item['color'], color_rect, border_radius=4)
-                except Exception:
+                icon_img = self.theme_manager.icons.get(item['app_id'], START_MENU_ICON_SIZE)
+                if icon_img:
+                    self.screen.blit(icon_img, (item_rect.x + 5, item_rect.y + 8))
+                else:
                     # Fallback
                     color_rect = pygame.Rect(item_rect.x + 5, item_rect.y + 8, 32, 32)
                     pygame.draw.rect(self.screen, item['color'], color_rect, border_radius=4)
             
             # Nombre
-            name_text = font_item.render(item['name'], True, Colors.TEXT_PRIMARY)
+            name_text = self.theme_manager.render_text(font_item, item['name'], Colors.TEXT_PRIMARY)
             self.screen.blit(name_text, (item_rect.x + 45, item_rect.y + 15))
     
     def handle_click(self, pos, window_manager) -> Optional[Any]:
@@ -135,50 +136,42 @@ class StartMenu:
             self.visible = False
             return None
         
-        item_height = 50
-        for i, item in enumerate(self.menu_items):
-            item_rect = pygame.Rect(
-                self.menu_rect.x + 10,
-                self.menu_rect.y + 50 + i * item_height,
-                self.menu_rect.width - 20,
-                item_height - 5
-            )
-            if item_rect.collidepoint(pos):
-                self.visible = False
-                # Si es el botón de apagado, retornar especialmente
-                if item.get('is_shutdown'):
-                    return 'SHUTDOWN'
-                return item['app_ref']
-        
-        return None
+        index = self.item_at(pos)
+        if index < 0:
+            return None
+        
+        item = self.menu_items[index]
+        self.visible = False
+        # Si es el botón de apagado, retornar especialmente
+        if item.get('is_shutdown'):
+            return 'SHUTDOWN'
+        return item['app_ref']
 
 
 class TaskBarButton:
     """Botón en la barra de tareas con soporte para iconos PNG"""
     
-    def __init__(self, name: str, color: tuple, window_ref=None, app_id: Optional[str] = None):
-        """Inicializa un botón de la barra"""
+    def __init__(self, name: str, color: tuple, window_ref=None, app_id: Optional[str] = None,
+                 icons=None):
+        """Inicializa un botón de la barra
+        
+        Args:
+            icons: IconAtlas compartido del que sale el icono
+        """
         self.name = name
         self.color = color
         self.window_ref = window_ref
         self.app_id = app_id
         self.rect = pygame.Rect(0, 0, TASKBAR_ICON_SIZE + 20, TASKBAR_ICON_SIZE + 8)
         self.hover = False
-        self.icon_image = self._load_icon_image()
+        self.degraded = False  # La app excede su presupuesto de frame
+        self.icon_image = self._load_icon_image(icons)
     
-    def _load_icon_image(self) -> Optional[pygame.Surface]:
-        """Carga la imagen del icono desde archivo"""
-        if not self.app_id:
+    def _load_icon_image(self, icons) -> Optional[pygame.Surface]:
+        """Obtiene la imagen del icono del atlas (sin leer de disco)"""
+        if icons is None:
             return None
-        
-        icon_path = os.path.join("assets", "imgs", f"icon_{self.app_id}.png")
-        try:
-            if os.path.exists(icon_path):
-                img = pygame.image.load(icon_path)
-                return pygame.transform.scale(img, (TASKBAR_ICON_SIZE - 10, TASKBAR_ICON_SIZE - 10))
-        except Exception:
-            pass
-        return None
+        return icons.get(self.app_id, TASKBAR_APP_ICON_SIZE)
     
     def render(self, surface: pygame.Surface, theme_manager):
         """Renderiza el botón"""
@@ -215,6 +208,12 @@ class TaskBarButton:
                 30, 2
             )
             pygame.draw.rect(surface, self.color, indicator_rect, border_radius=1)
+        
+        # Aviso de app degradada (se dibuja a ritmo reducido)
+        if self.degraded:
+            center = (self.rect.right - 6, self.rect.top + 6)
+            pygame.draw.circle(surface, Colors.PINK, center, 4)
+            pygame.draw.circle(surface, Colors.TEXT_PRIMARY, center, 4, width=1)
 
 
 class TaskBar:
@@ -236,47 +235,75 @@ class TaskBar:
         # Botones
         self.buttons: List[TaskBarButton] = []
         self.start_button_rect = pygame.Rect(10, self.rect.y + 5, 180, 40)
+        self.hit_index = HitIndex()  # Botón de inicio y botones de apps
+        self._hovered_button: Optional[TaskBarButton] = None
+        self.start_hover = False  # Puntero sobre el botón de inicio
+        self._pointer_pos = None  # Última posición de MOUSEMOTION (None = fuera de la ventana)
+        self._synced_version = None  # windows_version de la última sincronización
         self.start_menu = StartMenu(screen, theme_manager, plugin_manager)
         self.logo_surface = None
         self._load_logo()
+        
+        # Estado del último frame compuesto (para dirty rectangles)
+        self._last_bar_state = None
+        self._last_menu_state = None
 
     def _load_logo(self):
         """Carga el logo del sistema para el botón de inicio"""
-        try:
-            logo = pygame.image.load(SYSTEM_LOGO).convert_alpha()
-            self.logo_surface = pygame.transform.smoothscale(logo, (24, 24))
-        except Exception:
-            self.logo_surface = None
+        self.logo_surface = self.theme_manager.assets.load(SYSTEM_LOGO, (24, 24))
     
     def update(self, dt: float):
         """Actualiza la barra de tareas"""
-        # Sincronizar botones con ventanas
-        self._sync_buttons()
+        # Sincronizar botones solo si se abrieron o cerraron ventanas
+        if self.window_manager.windows_version != self._synced_version:
+            self._sync_buttons()
+            self._synced_version = self.window_manager.windows_version
+            self._update_hover()  # Los botones se movieron bajo el puntero
         
-        # Actualizar hover de botones
-        mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons:
-            button.hover = button.rect.collidepoint(mouse_pos)
-        
-        # Actualizar menú de inicio
-        self.start_menu.update(mouse_pos)
+            app = getattr(button.window_ref, 'app_ref', None)
+            button.degraded = self.plugin_manager.is_app_degraded(app)
+    
+    def _update_hover(self):
+        """Recalcula el hover con la última posición conocida del puntero"""
+        pos = self._pointer_pos
+        hovered = self.button_at(pos) if pos is not None else None
+        if hovered is not self._hovered_button:
+            if self._hovered_button:
+                self._hovered_button.hover = False
+            if hovered:
+                hovered.hover = True
+            self._hovered_button = hovered
+        
+        self.start_hover = pos is not None and self.start_button_rect.collidepoint(pos)
+        self.start_menu.update(pos)
+    
+    def next_deadline(self) -> Optional[float]:
+        """Segundos hasta el próximo cambio de minuto del reloj"""
+        now = datetime.datetime.now()
+        return 60 - now.second - now.microsecond / 1_000_000
     
     def _sync_buttons(self):
         """Sincroniza los botones con las ventanas abiertas"""
         windows = self.window_manager.get_windows()
         
         # Eliminar botones de ventanas cerradas
-        self.buttons = [btn for btn in self.buttons if btn.window_ref in windows]
+        open_windows = set(windows)
+        self.buttons = [btn for btn in self.buttons if btn.window_ref in open_windows]
+        if self._hovered_button not in self.buttons:
+            self._hovered_button = None
         
         # Añadir botones de ventanas nuevas
+        with_button = {btn.window_ref for btn in self.buttons}
         for window in windows:
-            if not any(btn.window_ref == window for btn in self.buttons):
+            if window not in with_button:
                 # Obtener app_id desde la ventana
                 app_id = getattr(window, 'app_id', None)
                 if hasattr(window, 'app_ref'):
                     app_id = getattr(window.app_ref, 'app_id', None)
                 
-                button = TaskBarButton(window.title, window.color, window, app_id)
+                button = TaskBarButton(window.title, window.color, window, app_id,
+                                       icons=self.theme_manager.icons)
                 self.buttons.append(button)
         
         # Actualizar posiciones
@@ -291,9 +318,55 @@ class TaskBar:
         for i, button in enumerate(self.buttons):
             button.rect.x = start_x + i * (TASKBAR_ICON_SIZE + 20 + 8)
             button.rect.y = self.rect.y + (TASKBAR_HEIGHT - button.rect.height) // 2
+        
+        regions = [(self.start_button_rect, None)]
+        regions.extend((button.rect, button) for button in self.buttons)
+        self.hit_index.rebuild(regions)
     
-    def render(self):
-        """Renderiza la barra de tareas"""
+    def button_at(self, pos) -> Optional[TaskBarButton]:
+        """Devuelve el botón de app bajo el puntero, o None"""
+        return self.hit_index.hit(pos)
+    
+    def collect_damage(self) -> List[pygame.Rect]:
+        """Calcula las regiones de la barra y el menú que cambiaron
+        
+        Returns:
+            Lista de rectángulos de pantalla a redibujar
+        """
+        damage = []
+        
+        bar_state = (
+            tuple((id(btn.window_ref), btn.rect.x, btn.hover, btn.degraded,
+                   btn.window_ref.is_minimized if btn.window_ref else None)
+                  for btn in self.buttons),
+            self.start_hover,
+            datetime.datetime.now().strftime("%H:%M"),
+        )
+        if bar_state != self._last_bar_state:
+            damage.append(self.rect.copy())
+            self._last_bar_state = bar_state
+        
+        menu = self.start_menu
+        menu_state = (menu.visible, menu.hovered_item if menu.visible else -1,
+                      len(menu.menu_items))
+        if menu_state != self._last_menu_state:
+            damage.append(menu.menu_rect.copy())
+            self._last_menu_state = menu_state
+        
+        return damage
+    
+    def render(self, clip: Optional[pygame.Rect] = None):
+        """Renderiza la barra de tareas
+        
+        Args:
+            clip: Región a redibujar (None = toda la barra y el menú)
+        """
+        if clip is not None and not self.rect.colliderect(clip):
+            # Solo el menú de inicio puede caer fuera de la barra
+            if self.start_menu.visible and self.start_menu.menu_rect.colliderect(clip):
+                self.start_menu.render()
+            return
+        
         # Fondo de la barra
         taskbar_surf = pygame.Surface((SCREEN_WIDTH, TASKBAR_HEIGHT), pygame.SRCALPHA)
         pygame.draw.rect(taskbar_surf, (*Colors.TASKBAR_BG, 240), taskbar_surf.get_rect())
@@ -319,11 +392,8 @@ class TaskBar:
     
     def _render_start_button(self):
         """Renderiza el botón de inicio"""
-        mouse_pos = pygame.mouse.get_pos()
-        hover = self.start_button_rect.collidepoint(mouse_pos)
-        
         # Fondo del botón
-        bg_color = Colors.HOVER if hover else Colors.TASKBAR_BG
+        bg_color = Colors.HOVER if self.start_hover else Colors.TASKBAR_BG
         pygame.draw.rect(self.screen, bg_color, self.start_button_rect, border_radius=8)
         
         # Logo del sistema
@@ -349,19 +419,18 @@ class TaskBar:
         
         # Texto de marca
         font = self.theme_manager.get_font(FONT_SIZE_MEDIUM)
-        text = font.render(tr("taskbar.brand"), True, Colors.TEXT_PRIMARY)
+        text = self.theme_manager.render_text(font, tr("taskbar.brand"), Colors.TEXT_PRIMARY)
         text_x = logo_rect.right + 10
         text_y = self.start_button_rect.centery - text.get_height() // 2
         self.screen.blit(text, (text_x, text_y))
     
     def _render_clock(self):
         """Renderiza el reloj del sistema"""
-        import datetime
         now = datetime.datetime.now()
         time_str = now.strftime("%H:%M")
         
         font = self.theme_manager.get_font(FONT_SIZE_MEDIUM)
-        text = font.render(time_str, True, Colors.TEXT_PRIMARY)
+        text = self.theme_manager.render_text(font, time_str, Colors.TEXT_PRIMARY)
         
         # Posición en la esquina derecha
         x = SCREEN_WIDTH - text.get_width() - 20
@@ -369,18 +438,35 @@ class TaskBar:
         
         self.screen.blit(text, (x, y))
     
-    def handle_event(self, event: pygame.event.Event):
-        """Maneja eventos de la barra de tareas"""
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Maneja eventos de la barra de tareas
+        
+        Returns:
+            True si el click fue sobre la barra o el menú de inicio
+            (el movimiento del puntero nunca se consume)
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self._pointer_pos = event.pos
+            self._update_hover()
+            return False
+        if event.type == pygame.WINDOWLEAVE:
+            self._pointer_pos = None
+            self._update_hover()
+            return False
+        
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
             
             # Click en botón de inicio
             if self.start_button_rect.collidepoint(mouse_pos):
                 self.start_menu.visible = not self.start_menu.visible
-                return
+                self.start_menu.update(self._pointer_pos)
+                return True
             
-            # Click en menú de inicio
+            # Click en menú de inicio (fuera de él solo lo cierra)
             if self.start_menu.visible:
+                inside = (self.start_menu.menu_rect.collidepoint(mouse_pos) or
+                          self.rect.collidepoint(mouse_pos))
                 result = self.start_menu.handle_click(mouse_pos, self.window_manager)
                 if result == 'SHUTDOWN':
                     # Señal de apagado - cambiar flag en el plugin_manager
@@ -388,17 +474,18 @@ class TaskBar:
                         self.plugin_manager.should_shutdown = True
                 elif result:
                     self.plugin_manager.launch_app(result)
-                return
+                return inside
             
             # Click en botones de aplicaciones
-            for button in self.buttons:
-                if button.rect.collidepoint(mouse_pos):
-                    if button.window_ref:
-                        if button.window_ref.is_minimized:
-                            button.window_ref.unminimize()
-                            self.window_manager.focus_window(button.window_ref)
-                        elif button.window_ref == self.window_manager.focused_window:
-                            button.window_ref.minimize()
-                        else:
-                            self.window_manager.focus_window(button.window_ref)
-                    return
+            button = self.button_at(mouse_pos)
+            if button and button.window_ref:
+                if button.window_ref.is_minimized:
+                    button.window_ref.unminimize()
+                    self.window_manager.focus_window(button.window_ref)
+                elif button.window_ref == self.window_manager.focused_window:
+                    button.window_ref.minimize()
+                else:
+                    self.window_manager.focus_window(button.window_ref)
+            
+            return self.rect.collidepoint(mouse_pos)
+        return False